@@ -36,6 +36,7 @@ from .word import Lex
 from .word import LexSentence
 from .word import LexInMemory
 from .word import LexMySQL
+from .word import AsyncLex
 from .word import WordListed
 from .word import Listing
 from .word import Qoolbar
@@ -51,6 +52,7 @@ __all__ = [
     'LexSentence',
     'LexInMemory',
     'LexMySQL',
+    'AsyncLex',
     'WordListed',
     'Listing',
     'Qoolbar',
@@ -10,6 +10,7 @@ from __future__ import unicode_literals
 import calendar
 import inspect
 import json
+import os
 import re
 import sys
 import threading
@@ -21,6 +22,23 @@ import uuid
 import mysql.connector
 import six
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None   # Python 2
+else:
+    # NOTE:  async syntax in a string, so this file still compiles in Python 2.
+    exec(
+        "async def iterate_while_reading(alex, vrb, idn_ishes):\n"
+        "    async def iterate():\n"
+        "        words = []\n"
+        "        async for word in alex.iter_words(batch_size=2, vrb=vrb):\n"
+        "            words.append(word)\n"
+        "        return words\n"
+        "    return await asyncio.gather(iterate(), *[alex.read_word(i) for i in idn_ishes])\n",
+        globals()
+    )
+
 import qiki
 from qiki.number import hex_from_bytes
 from qiki.number import type_name
@@ -58,7 +76,7 @@ except ImportError:
             CREATE USER 'example_user'@'localhost';
             ALTER USER  'example_user'@'localhost' 
                 IDENTIFIED BY 'example_password';
-            GRANT CREATE, INSERT, SELECT, DROP 
+            GRANT CREATE, INSERT, SELECT, UPDATE, DROP, ALTER, INDEX
                 ON `example_database`.* 
                 TO 'example_user'@'localhost';
             
@@ -90,6 +108,10 @@ TEST_ASTRAL_PLANE = True   # Test txt with Unicode characters on an astral-plane
 SHOW_UTF8_EXAMPLES = False   # Prints a few unicode test strings in both \u escape syntax and UTF-8 hexadecimal.
                              # e.g.  "\u262e on earth" in utf8 is E298AE206F6E206561727468
 
+SHOW_THROUGHPUT = False   # Prints how many words per second some concurrency tests insert.
+
+RUN_BENCHMARKS = bool(os.environ.get('QIKI_BENCHMARKS'))   # Slow timing runs, e.g. MySQL connectors.
+
 
 class TestFlavors(object):
     """Run each test derived from WordTests using the following variations."""
@@ -360,7 +382,501 @@ class LexErrorTests(TestBaseClass):
         lex.disconnect()
 
 
+class SchemaTests(TestBaseClass):
+    """Test LexMySQL indexes and upgrading old tables."""
+
+    def setUp(self):
+        super(SchemaTests, self).setUp()
+        credentials = secure.credentials.for_unit_testing_database.copy()
+        credentials['table'] = 'word_schema_' + uuid.uuid4().hex
+        self.lex = qiki.LexMySQL(**credentials)
+
+        def cleanup():
+            self.lex.uninstall_to_scratch()
+            self.lex.disconnect()
+
+        self.addCleanup(cleanup)
+
+    def test_new_table_has_indexes(self):
+        self.assertEqual(qiki.LexMySQL.SCHEMA_VERSION, self.lex.schema_version())
+        self.assertEqual([], self.lex.upgrade_schema())
+
+    def test_upgrade_old_table(self):
+        for _, name, _, _ in qiki.LexMySQL.SCHEMA_INDEXES:
+            self.lex.super_query('ALTER TABLE', self.lex.table, 'DROP INDEX', qiki.LexMySQL.SuperIdentifier(name))
+        self.assertEqual(set(['PRIMARY']), self.lex.index_names())
+        self.assertEqual(1, self.lex.schema_version())
+        with self.assertRaises(qiki.LexMySQL.SchemaError):
+            self.lex.verify_schema()
+
+        added = self.lex.upgrade_schema()
+
+        self.assertEqual(set(name for _, name, _, _ in qiki.LexMySQL.SCHEMA_INDEXES), set(added))
+        self.assertEqual(qiki.LexMySQL.SCHEMA_VERSION, self.lex.schema_version())
+        self.lex.verify_schema()
+        self.assertEqual('noun', self.lex.noun('noun').txt)
+
+    def test_memory_engine_indexes_are_btree(self):
+        credentials = secure.credentials.for_unit_testing_database.copy()
+        credentials['table'] = 'word_schema_' + uuid.uuid4().hex
+        credentials['engine'] = 'MEMORY'
+        lex = qiki.LexMySQL(**credentials)
+        self.addCleanup(lex.disconnect)
+        self.addCleanup(lex.uninstall_to_scratch)
+        lex.verify_schema()
+
+    def test_hash_index_fails_verify(self):
+        credentials = secure.credentials.for_unit_testing_database.copy()
+        credentials['table'] = 'word_schema_' + uuid.uuid4().hex
+        credentials['engine'] = 'MEMORY'
+        lex = qiki.LexMySQL(**credentials)
+        self.addCleanup(lex.disconnect)
+        self.addCleanup(lex.uninstall_to_scratch)
+        lex.super_query('ALTER TABLE', lex.table, 'DROP INDEX', qiki.LexMySQL.SuperIdentifier('obj_vrb'))
+        lex.super_query('ALTER TABLE', lex.table, 'ADD INDEX', qiki.LexMySQL.SuperIdentifier('obj_vrb'),
+                        'USING HASH (`obj`, `vrb`, `idn`)')
+        with self.assertRaises(qiki.LexMySQL.SchemaError):
+            lex.verify_schema()
+
+
+class ConnectionPoolTests(TestBaseClass):
+    """Test the LexMySQL connection pool, with stand-in connections."""
+
+    class FakeConnection(object):
+        def __init__(self):
+            self.alive = True
+            self.in_transaction = False
+            self.n_rollbacks = 0
+
+        def is_connected(self):
+            return self.alive
+
+        def rollback(self):
+            self.n_rollbacks += 1
+            self.in_transaction = False
+
+        def close(self):
+            self.alive = False
+
+    def setUp(self):
+        super(ConnectionPoolTests, self).setUp()
+        self.connections = []
+
+    def connect(self):
+        connection = self.FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+    def test_reuse(self):
+        pool = qiki.word.ConnectionPool(self.connect, size=2)
+        c1 = pool.borrow()
+        pool.give_back(c1)
+        self.assertIs(c1, pool.borrow())
+        self.assertEqual(1, len(self.connections))
+
+    def test_bounded(self):
+        pool = qiki.word.ConnectionPool(self.connect, size=2, timeout=0.05)
+        pool.borrow()
+        pool.borrow()
+        with self.assertRaises(qiki.word.ConnectionPool.Timeout):
+            pool.borrow()
+        self.assertEqual(2, len(self.connections))
+
+    def test_wait_for_another_thread(self):
+        pool = qiki.word.ConnectionPool(self.connect, size=1, timeout=5.0)
+        c1 = pool.borrow()
+        timer = threading.Timer(0.05, pool.give_back, args=(c1,))
+        timer.start()
+        self.assertIs(c1, pool.borrow())
+        timer.join()
+        stats = pool.stats()
+        self.assertEqual(1, stats['n_waits'])
+        self.assertGreater(stats['max_wait_seconds'], 0.0)
+
+    def test_transaction_ended(self):
+        pool = qiki.word.ConnectionPool(self.connect)
+        c1 = pool.borrow()
+        c1.in_transaction = True
+        pool.give_back(c1)
+        self.assertEqual(1, c1.n_rollbacks)
+        c1 = pool.borrow()
+        pool.give_back(c1)
+        self.assertEqual(1, c1.n_rollbacks)
+
+    def test_dead_connection_replaced(self):
+        pool = qiki.word.ConnectionPool(self.connect, ping_seconds=0.0)
+        c1 = pool.borrow()
+        pool.give_back(c1)
+        c1.close()
+        c2 = pool.borrow()
+        self.assertIsNot(c1, c2)
+        self.assertTrue(c2.is_connected())
+        self.assertEqual(1, pool.stats()['n_replaced'])
+
+    def test_check_after_error(self):
+        pool = qiki.word.ConnectionPool(self.connect, ping_seconds=3600.0)
+        c1 = pool.borrow()
+        c1.close()
+        pool.give_back(c1, check=True)
+        self.assertEqual(0, pool.stats()['n_open'])
+        self.assertIsNot(c1, pool.borrow())
+
+    def test_max_lifetime(self):
+        pool = qiki.word.ConnectionPool(self.connect, max_lifetime=0.0)
+        c1 = pool.borrow()
+        pool.give_back(c1)
+        time.sleep(0.01)
+        c2 = pool.borrow()
+        self.assertIsNot(c1, c2)
+        self.assertFalse(c1.is_connected())
+        self.assertEqual(1, pool.stats()['n_recycled'])
+
+    def test_close(self):
+        pool = qiki.word.ConnectionPool(self.connect)
+        c1 = pool.borrow()
+        c2 = pool.borrow()
+        pool.give_back(c1)
+        pool.close()
+        self.assertFalse(c1.is_connected())
+        self.assertTrue(c2.is_connected())
+        pool.give_back(c2)
+        self.assertFalse(c2.is_connected())
+        with self.assertRaises(qiki.word.ConnectionPool.Closed):
+            pool.borrow()
+
+
 # noinspection PyUnresolvedReferences
+class StatementCacheTests(TestBaseClass):
+    """Test remembering query shapes and prepared cursors, without a MySQL server."""
+
+    class FakeCursor(object):
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    class FakeConnection(object):
+        def __init__(self):
+            self.unread_result = False
+            self.cursors = []
+            self.qiki_prepared = qiki.word.StatementCache(2)
+
+        def cursor(self, prepared):
+            assert prepared
+            cursor = StatementCacheTests.FakeCursor()
+            self.cursors.append(cursor)
+            return cursor
+
+    def setUp(self):
+        super(StatementCacheTests, self).setUp()
+        # NOTE:  A LexMySQL that never connects, enough for _super_parse() and Cursor.
+        self.lex = object.__new__(qiki.LexMySQL)
+        self.lex._shapes = qiki.word.StatementCache(10)
+        self.lex._shapes_lock = threading.Lock()
+        self.lex._n_shape_hits = 0
+        self.lex._n_shape_misses = 0
+        self.lex._n_prepare_hits = 0
+        self.lex._n_prepare_misses = 0
+        self.lex._client_binding = False
+
+    def test_least_recently_used(self):
+        cache = qiki.word.StatementCache(2)
+        self.assertEqual([], cache.put('a', 1))
+        self.assertEqual([], cache.put('b', 2))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual([2], cache.put('c', 3))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.pop('c'))
+        self.assertEqual(1, len(cache))
+
+    def test_same_shape_same_query(self):
+        table = qiki.LexMySQL.TableName('word')
+        query1, parameters1 = self.lex._super_parse('SELECT * FROM', table, 'WHERE idn=', qiki.Number(1))
+        query2, parameters2 = self.lex._super_parse('SELECT * FROM', table, 'WHERE idn=', qiki.Number(2))
+        self.assertEqual('SELECT * FROM `word` WHERE idn= ? ', query1)
+        self.assertIs(query1, query2)
+        self.assertEqual([qiki.Number(1).raw], parameters1)
+        self.assertEqual([qiki.Number(2).raw], parameters2)
+        stats = self.lex.statement_stats()
+        self.assertEqual(1, stats['shape_hits'])
+        self.assertEqual(1, stats['shape_misses'])
+
+    def test_different_shapes(self):
+        query1, _ = self.lex._super_parse('SELECT * FROM t WHERE idn IN (', [1, 2], ')')
+        query2, _ = self.lex._super_parse('SELECT * FROM t WHERE idn IN (', [1, 2, 3], ')')
+        query3, _ = self.lex._super_parse('SELECT * FROM t WHERE txt=', qiki.Text('?'))
+        query4, _ = self.lex._super_parse('SELECT * FROM t WHERE txt=', None, '?')
+        self.assertEqual('SELECT * FROM t WHERE idn IN ( ?,? ) ', query1)
+        self.assertEqual('SELECT * FROM t WHERE idn IN ( ?,?,? ) ', query2)
+        self.assertEqual('SELECT * FROM t WHERE txt= ? ', query3)
+        self.assertEqual('SELECT * FROM t WHERE txt=  ? ', query4)
+        self.assertEqual(4, self.lex.statement_stats()['shapes_cached'])
+
+    def test_mistakes_still_caught(self):
+        with self.assertRaises(qiki.LexMySQL.SuperSelectStringString):
+            self.lex._super_parse('SELECT * FROM t WHERE txt=', 'define')
+        with self.assertRaises(qiki.LexMySQL.SuperSelectStringString):
+            self.lex._super_parse('SELECT * FROM t WHERE txt=', 'define')
+        with self.assertRaises(qiki.LexMySQL.SuperSelectTypeError):
+            self.lex._super_parse('SELECT', 1.5)
+
+    def test_prepared_cursor_reused(self):
+        connection = self.FakeConnection()
+        query, _ = self.lex._super_parse('SELECT 1')
+        with self.lex.Cursor(connection, query, self.lex) as cursor1:
+            pass
+        with self.lex.Cursor(connection, query, self.lex) as cursor2:
+            pass
+        self.assertIs(cursor1, cursor2)
+        self.assertFalse(cursor1.closed)
+        stats = self.lex.statement_stats()
+        self.assertEqual(1, stats['prepare_hits'])
+        self.assertEqual(1, stats['prepare_misses'])
+
+    def test_prepared_cursor_unread_not_reused(self):
+        connection = self.FakeConnection()
+        with self.lex.Cursor(connection, 'SELECT 1', self.lex) as cursor1:
+            connection.unread_result = True
+        self.assertTrue(cursor1.closed)
+        connection.unread_result = False
+        with self.lex.Cursor(connection, 'SELECT 1', self.lex) as cursor2:
+            pass
+        self.assertIsNot(cursor1, cursor2)
+
+    def test_prepared_cursor_evicted_closed(self):
+        connection = self.FakeConnection()
+        cursors = []
+        for query in ('SELECT 1', 'SELECT 2', 'SELECT 3'):
+            with self.lex.Cursor(connection, query, self.lex) as cursor:
+                cursors.append(cursor)
+        self.assertEqual([True, False, False], [c.closed for c in cursors])
+
+
+class RowDecoderTests(TestBaseClass):
+    """Test converting LexMySQL rows, without a MySQL server."""
+
+    def setUp(self):
+        super(RowDecoderTests, self).setUp()
+        self.lex = object.__new__(qiki.LexMySQL)
+        self.names = ('idn', 'num', 'txt', 'n')
+
+    def test_decode(self):
+        row = (bytearray(b'\x82\x2A'), b'\x82\x01', b'caf\xc3\xa9', 3)
+        decode = self.lex._row_decoder(self.names, row)
+        self.assertEqual((qiki.Number(42), qiki.Number(1), u"café", 3), decode(row))
+        self.assertIsInstance(decode(row)[2], qiki.Text)
+
+    def test_decode_latin1_strings(self):
+        row = (u'\x82\x2A', u'\x82\x01', u'caf\xc3\xa9', 3)
+        decode = self.lex._row_decoder(self.names, row)
+        self.assertEqual((qiki.Number(42), qiki.Number(1), u"café", 3), decode(row))
+
+    def test_decode_null(self):
+        first_row = (b'\x82\x2A', None, b'', None)
+        decode = self.lex._row_decoder(self.names, first_row)
+        self.assertEqual((qiki.Number(42), None, u"", None), decode(first_row))
+        self.assertEqual(
+            (qiki.Number(42), qiki.Number(1), u"", 5),
+            decode((b'\x82\x2A', b'\x82\x01', b'', 5))
+        )
+
+    def test_decode_null_by_column_type(self):
+        field_type = mysql.connector.FieldType
+        column_types = (field_type.VAR_STRING, field_type.VAR_STRING, field_type.BLOB, field_type.LONGLONG)
+        first_row = (b'\x82\x2A', None, None, None)
+        decode = self.lex._row_decoder(self.names, first_row, column_types=column_types)
+        self.assertEqual((qiki.Number(42), None, None, None), decode(first_row))
+        self.assertEqual(
+            (qiki.Number(42), qiki.Number(1), u"café", 5),
+            decode((b'\x82\x2A', u'\x82\x01', b'caf\xc3\xa9', 5))
+        )
+        self.assertEqual(
+            (qiki.Number(42), qiki.Number(2), u"abc", 6),
+            decode((b'\x82\x2A', bytearray(b'\x82\x02'), u'abc', 6))
+        )
+        self.assertIsInstance(decode(first_row[:2] + (u'abc', 6))[2], qiki.Text)
+
+    def test_decode_null_plans_once(self):
+        first_row = (b'\x82\x2A', None, b'', None)
+        decode = self.lex._row_decoder(self.names, first_row)
+        plans = []
+        cell_converter = self.lex._cell_converter
+
+        def cell_converter_counted(*args):
+            plans.append(args)
+            return cell_converter(*args)
+
+        self.lex._cell_converter = cell_converter_counted
+        for n in range(10):
+            decode((b'\x82\x2A', b'\x82\x01', b'', n))
+        self.assertEqual([], plans)
+
+    def test_raw(self):
+        row = (bytearray(b'\x82\x2A'), u'\x82\x01', b'abc', 3)
+        decode = self.lex._row_decoder(self.names, row, raw=True)
+        self.assertEqual((b'\x82\x2A', b'\x82\x01', b'abc', 3), decode(row))
+        self.assertIsInstance(decode(row)[0], six.binary_type)
+
+    def test_raw_some_columns(self):
+        row = (bytearray(b'\x82\x2A'), b'\x82\x01', b'abc', 3)
+        decode = self.lex._row_decoder(self.names, row, raw={'idn'})
+        self.assertEqual((b'\x82\x2A', qiki.Number(1), u"abc", 3), decode(row))
+
+
+class ClientBindingTests(TestBaseClass):
+    """Test binding data into LexMySQL queries for the C extension, without a MySQL server."""
+
+    def setUp(self):
+        super(ClientBindingTests, self).setUp()
+        self.lex = object.__new__(qiki.LexMySQL)
+        self.lex._shapes = qiki.word.StatementCache(10)
+        self.lex._shapes_lock = threading.Lock()
+        self.lex._n_shape_hits = 0
+        self.lex._n_shape_misses = 0
+        self.lex._client_binding = True
+
+    def test_bind(self):
+        query, parameters = self.lex._super_parse(
+            'SELECT * FROM', qiki.LexMySQL.TableName('word'),
+            'WHERE idn IN (', [qiki.Number(1), 2], ') AND num =', qiki.Number(0)
+        )
+        self.assertEqual("SELECT * FROM `word` WHERE idn IN ( X'8201',2 ) AND num = X'80' ", query)
+        self.assertEqual([], parameters)
+
+    def test_bind_text(self):
+        query, _ = self.lex._super_parse('SELECT * FROM t WHERE txt=', qiki.Text(u"it's café"))
+        if qiki.word.HORRIBLE_MYSQL_CONNECTOR_WORKAROUND:
+            self.assertEqual("SELECT * FROM t WHERE txt= _latin1 X'6974277320636166c3a9' ", query)
+        else:
+            self.assertEqual("SELECT * FROM t WHERE txt= _utf8mb4 X'6974277320636166c3a9' ", query)
+
+    def test_question_mark_not_a_placeholder(self):
+        query, _ = self.lex._super_parse("SELECT '?' AS q FROM t WHERE idn=", qiki.Number(1))
+        self.assertEqual("SELECT '?' AS q FROM t WHERE idn= X'8201' ", query)
+
+    def test_same_shape_different_data(self):
+        query1, _ = self.lex._super_parse('SELECT * FROM t WHERE idn=', qiki.Number(1))
+        query2, _ = self.lex._super_parse('SELECT * FROM t WHERE idn=', qiki.Number(2))
+        self.assertEqual("SELECT * FROM t WHERE idn= X'8201' ", query1)
+        self.assertEqual("SELECT * FROM t WHERE idn= X'8202' ", query2)
+        self.assertEqual(1, self.lex._n_shape_hits)
+
+    def test_bind_empty_binary(self):
+        self.assertEqual("X''", qiki.LexMySQL._sql_literal(b''))
+
+    def test_unknown_connector(self):
+        credentials = secure.credentials.for_unit_testing_database.copy()
+        credentials['connector'] = 'odbc'
+        with self.assertRaises(qiki.LexMySQL.ConnectError):
+            qiki.LexMySQL(**credentials)
+
+
+class ConnectorRoundTripTests(TestBaseClass):
+    """Store words with each MySQL Connector, read them back with a fresh LexMySQL."""
+
+    def round_trip(self, connector):
+        if connector == 'cext' and not getattr(mysql.connector, 'HAVE_CEXT', False):
+            self.skipTest("MySQL Connector C extension not available")
+        credentials = secure.credentials.for_unit_testing_database.copy()
+        credentials['table'] = 'word_trip_' + uuid.uuid4().hex
+        credentials['connector'] = connector
+        lex = qiki.LexMySQL(**credentials)
+
+        def cleanup():
+            lex.uninstall_to_scratch()
+            lex.disconnect()
+
+        self.addCleanup(cleanup)
+        fred = lex.define('agent', 'fred')
+        like = lex.verb('like')
+        apple = lex.noun('apple')
+        txts = ["", "plain", "it's a \"quote\"", "what?", "caf\u00e9 \u262E"]
+        if TEST_ASTRAL_PLANE:
+            txts.append("stinky \U0001F4A9")
+        nums = [qiki.Number(0), qiki.Number(-1), qiki.Number(1.5), qiki.Number(2**70)]
+        stored = [fred.says(like, apple, num, txt) for num in nums for txt in txts]
+        stored += lex.create_words([(fred, like, apple, 99, txt) for txt in txts])
+
+        lex2 = qiki.LexMySQL(**credentials)
+        self.addCleanup(lex2.disconnect)
+        for word in stored:
+            word2 = lex2[word.idn]
+            self.assertTrue(word2.exists())
+            self.assertEqual(
+                (word.sbj.idn, word.vrb.idn, word.obj.idn, word.num, word.txt, word.whn),
+                (word2.sbj.idn, word2.vrb.idn, word2.obj.idn, word2.num, word2.txt, word2.whn),
+            )
+            self.assertIsInstance(word2.txt, qiki.Text)
+        found = lex2.find_words(sbj=fred, vrb=like, obj=apple)
+        self.assertEqual([w.idn for w in stored], [w.idn for w in found])
+        self.assertEqual([w.txt for w in stored], [w.txt for w in found])
+        self.assertEqual(qiki.Number(99), lex2.find_words(txt=txts[-1], num_min=50)[0].num)
+        self.assertEqual(stored[-1].idn, lex2[fred.idn].says(like, apple, 99, txts[-1], use_already=True).idn)
+        self.assertGreater(lex2.statement_stats()['shape_hits'], 0)
+
+    def test_pure(self):
+        self.round_trip('pure')
+
+    def test_cext(self):
+        self.round_trip('cext')
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "Benchmarks are opt-in, set QIKI_BENCHMARKS=1")
+class ConnectorBenchmarkTests(TestBaseClass):
+    """Compare the pure Python MySQL Connector and its C extension, inserting and scanning words."""
+    N_WORDS = 2000
+
+    def benchmark(self, connector):
+        """Report seconds to insert, find and raw-scan N_WORDS words.  Timings are not asserted."""
+        if connector == 'cext' and not getattr(mysql.connector, 'HAVE_CEXT', False):
+            self.skipTest("MySQL Connector C extension not available")
+        credentials = secure.credentials.for_unit_testing_database.copy()
+        credentials['table'] = 'word_bench_' + uuid.uuid4().hex
+        credentials['connector'] = connector
+        lex = qiki.LexMySQL(**credentials)
+
+        def cleanup():
+            lex.uninstall_to_scratch()
+            lex.disconnect()
+
+        self.addCleanup(cleanup)
+        fred = lex.define('agent', 'fred')
+        like = lex.verb('like')
+        apple = lex.noun('apple')
+
+        t_start = time.time()
+        lex.create_words([(fred, like, apple, n, "word {}".format(n)) for n in range(self.N_WORDS)])
+        t_insert = time.time() - t_start
+
+        t_start = time.time()
+        words = lex.find_words(vrb=like)
+        t_scan = time.time() - t_start
+
+        t_start = time.time()
+        idn_raws = list(lex.super_select_tuples('SELECT idn FROM', lex.table, raw=True))
+        t_scan_raw = time.time() - t_start
+
+        self.assertEqual(self.N_WORDS, len(words))
+        self.assertEqual("word 7", words[7].txt)
+        self.assertEqual(qiki.Number(7), words[7].num)
+        self.assertGreaterEqual(len(idn_raws), self.N_WORDS)
+        print("\n{connector}: {n} words, insert {insert:.3f} sec, scan {scan:.3f} sec, "
+              "raw idn scan {raw:.3f} sec".format(
+                connector=connector,
+                n=self.N_WORDS,
+                insert=t_insert,
+                scan=t_scan,
+                raw=t_scan_raw,
+              ))
+
+    def test_pure(self):
+        self.benchmark('pure')
+
+    def test_cext(self):
+        self.benchmark('cext')
+
+
 class WordTests(TestBaseClass):
     """Base class for qiki.Word tests that use a standard, empty self.lex.  Has no tests itself."""
 
@@ -438,6 +954,7 @@ class WordTests(TestBaseClass):
             # EXAMPLE:  word_ce09954b2e784cd8811b640079497568
 
         credentials.update(TestFlavors.credentials_from_specs(self.flavor_spec))
+        self.credentials = credentials
         try:
             self.lex = self.lex_class()(**credentials)
         except qiki.LexMySQL.ConnectError as e:
@@ -603,6 +1120,29 @@ class WordTests(TestBaseClass):
         # NOTE:  It appears that .assertRaises() is the only assert-method that requires the msg
         #        parameter be passed by name.
 
+    def count_calls(self, method_name, owner=None):
+        """
+        Record calls to a method of the lex (or of owner) for the rest of the test.
+
+        Return a list, appended with an (args, kwargs, result) tuple for each call.
+
+            calls = self.count_calls('find_words')
+            do_something_that_should_find_once()
+            self.assertEqual(1, len(calls))
+        """
+        owner = self.lex if owner is None else owner
+        method_original = getattr(owner, method_name)
+        calls = []
+
+        def method_counted(*args, **kwargs):
+            result = method_original(*args, **kwargs)
+            calls.append((args, kwargs, result))
+            return result
+
+        setattr(owner, method_name, method_counted)
+        self.addCleanup(delattr, owner, method_name)
+        return calls
+
 
 class WordDemoTests(WordTests):
 
@@ -3926,7 +4466,13 @@ class Word0080Threading(TestBaseClass):
                 do_start=self.do_start
             )
             try:
-                self.word = self.lex.noun(self.txt)
+                with self.lex._connected():
+                    # NOTE:  Read a snapshot before the lock, on the connection the insert will use,
+                    #        like a caller already in a transaction.  Only _start_transaction()
+                    #        renews the snapshot, so the insert sees the other thread's word.
+                    self.lex._connection.start_transaction()
+                    self.lex.max_idn()
+                    self.word = self.lex.noun(self.txt)
             except self.lex.QueryError:
                 print("Crash on the {txt} thread!".format(
                     txt=self.txt,
@@ -4054,9 +4600,12 @@ class Word0080Threading(TestBaseClass):
         is_lex_starting_out_empty = main_lex.max_idn() == main_lex.IDN_MAX_FIXED
         assert is_lex_starting_out_empty, "Unexpected " + main_lex.max_idn().qstring()
 
+        main_connected = main_lex._connected()
+        main_connected.__enter__()
+        # NOTE:  The main thread holds one connection throughout, so main_lex reads one snapshot,
+        #        until main_lex._start_transaction() frees it to see the threads' inserts.
+        main_lex._start_transaction()
         max_idn_beforehand = main_lex.max_idn()
-        # NOTE:  This USED to free future main_lex.max_idn() calls to have different values:
-        #        main_lex._start_transaction()
 
         thread_tea    = self.ThreadCreatesNoun('tea',    do_lock=do_lock, do_start=do_start)
         thread_coffee = self.ThreadCreatesNoun('coffee', do_lock=do_lock, do_start=do_start)
@@ -4140,7 +4689,8 @@ class Word0080Threading(TestBaseClass):
             thread_coffee.join()
 
             self.assertIsNone(thread_coffee.lex)
-            self.assertEqual(max_idn_beforehand, thread_tea.lex.max_idn())
+            self.assertEqual(max_idn_beforehand + 1, thread_tea.lex.max_idn())
+            # NOTE:  Every lex operation reads fresh, on an autocommit connection from the pool.
 
             self.assertFalse(thread_coffee.did_crash)
 
@@ -4164,8 +4714,10 @@ class Word0080Threading(TestBaseClass):
                 self.assertTrue(thread_tea.did_crash, "No lock - should have crashed")
             elif not do_start:
                 # NOTE:  _lock_next_word() works, but _start_transaction() was deliberately broken.
-                #        So the tea thread can't see the coffee thread's insert.
-                self.assertEqual(max_idn_beforehand, thread_tea.lex.max_idn())
+                #        So the tea thread's connection still reads its snapshot from before the
+                #        lock, and can't see the coffee thread's insert.
+                #        (Other threads can, e.g. this one, each on its own pooled connection.)
+                self.assertEqual(max_idn_beforehand + 1, thread_tea.lex.max_idn())
                 self.assertTrue(thread_tea.lex.cop2.is_stopped)
                 thread_tea.lex.cop2.go()
                 thread_tea.lex.cop3.await_stop("tea 8b")
@@ -4225,6 +4777,7 @@ class Word0080Threading(TestBaseClass):
             Cop.let_go_all()
             thread_tea.join()
             thread_coffee.join()
+            main_connected.__exit__(None, None, None)
             main_lex.uninstall_to_scratch()
             main_lex.disconnect()
 
@@ -5204,6 +5757,1436 @@ class WordInternalTests(WordTests):
     #     print("anna likes two boys", anna_likes_bart.num, anna_likes_chet.num)
 
 
+class Word0090DefinitionAncestry(WordTests):
+
+    def setUp(self):
+        super(Word0090DefinitionAncestry, self).setUp()
+        self.noun = self.lex.noun()
+        self.apple = self.lex.noun('apple')
+        self.fuji = self.lex.define(self.apple, 'fuji')
+
+    def test_definition_ancestors(self):
+        self.assertEqual([self.apple, self.noun, self.noun], self.lex.definition_ancestors(self.fuji))
+        self.assertEqual([self.noun], self.lex.definition_ancestors(self.noun))
+        self.assertEqual([self.lex['agent'], self.noun, self.noun], self.lex.definition_ancestors(self.lex._lex))
+
+    def test_definition_ancestors_not_defined(self):
+        like = self.lex.verb('like')
+        liking = self.lex._lex.says(like, self.fuji)
+        self.assertEqual([], self.lex.definition_ancestors(liking))
+        self.assertFalse(liking.is_a_noun())
+
+    def test_is_a_inchoate_no_lookups(self):
+        self.fuji.is_a(self.noun)
+        populates = self.count_calls('populate_word_from_idn')
+        fuji = self.lex[self.fuji.idn]
+        self.assertTrue(fuji.is_a(self.apple))
+        self.assertTrue(fuji.is_a_noun())
+        self.assertFalse(fuji.is_a_verb())
+        self.assertFalse(fuji.is_a(self.fuji, reflexive=False))
+        self.assertEqual(0, len(populates))
+
+    def test_is_a_incremental(self):
+        populates = self.count_calls('populate_word_from_idn')
+        macintosh = self.lex.define(self.fuji, 'macintosh')
+        populates_to_define = len(populates)
+        self.assertTrue(self.lex[macintosh.idn].is_a(self.apple))
+        self.assertEqual(populates_to_define, len(populates))
+
+    def test_is_a_recursion_limit(self):
+        macintosh = self.lex.define(self.fuji, 'macintosh')
+        self.assertFalse(macintosh.is_a(self.apple, recursion=1))
+        self.assertTrue (macintosh.is_a(self.apple, recursion=2))
+        self.assertFalse(macintosh.is_a(self.noun,  recursion=2))
+        self.assertTrue (macintosh.is_a(self.noun,  recursion=3))
+        self.assertTrue (macintosh.is_a(self.noun,  recursion=4))
+
+    def test_is_a_nonexistent(self):
+        self.assertFalse(self.lex[qiki.Number(999)].is_a(self.noun))
+
+
+class Word0091DefinitionCache(WordTests):
+
+    def setUp(self):
+        super(Word0091DefinitionCache, self).setUp()
+        self.apple = self.lex.noun('apple')
+        self.like = self.lex.verb('like')
+
+    def test_name_resolution_cached(self):
+        selects = self.count_calls('_populate_word_from_definition')
+        self.assertEqual(self.apple, self.lex['apple'])
+        self.assertEqual(self.like, self.lex.verb('like'))
+        self.assertEqual(self.like.idn, self.lex.idn_ify('like'))
+        self.lex._lex(self.like)[self.apple] = 1, "crunchy"
+        self.assertEqual(0, len(selects))
+
+    def test_cached_definition_is_choate(self):
+        apple = self.lex['apple']
+        self.assertTrue(apple.exists())
+        self.assertEqual('apple', apple.txt)
+        self.assertEqual(self.lex.noun(), apple.obj)
+        self.assertIsNot(apple, self.lex['apple'])
+
+    def test_preload_definitions(self):
+        self.lex._forget_cached_words()
+        self.assertEqual(7, self.lex.preload_definitions())   # 5 seminal words, apple, like
+        selects = self.count_calls('_populate_word_from_definition')
+        self.assertEqual(self.apple, self.lex['apple'])
+        self.assertEqual(self.lex.IDN_AGENT, self.lex['agent'].idn)
+        self.assertEqual(0, len(selects))
+
+    def test_earliest_definition_wins(self):
+        apple2 = self.lex.create_word(sbj=self.lex._lex, vrb=self.lex['define'], obj=self.like, txt='apple')
+        self.assertNotEqual(self.apple, apple2)
+        self.assertEqual(self.apple, self.lex['apple'])
+        self.lex._forget_cached_words()
+        self.lex.preload_definitions()
+        self.assertEqual(self.apple, self.lex['apple'])
+
+    def test_undefined_name(self):
+        with self.assertRaises(ValueError):
+            self.lex.idn_ify('pear')
+        pear = self.lex.noun('pear')
+        self.assertEqual(pear.idn, self.lex.idn_ify('pear'))
+
+
+class Word0092RenderMany(WordQoolbarSetup):
+
+    def feed(self):
+        """Inchoate copies of the words a feed would show."""
+        return [self.lex[w.idn] for w in (
+            self.anna_like_youtube,
+            self.bart_like_youtube,
+            self.anna_like_zigzags,
+            self.bart_delete_zigzags,
+        )]
+
+    def test_render_many_same_as_one_at_a_time(self):
+        rendered = self.lex.render_many(self.feed(), fields=('description', 'dict', 'repr', 'str'))
+        expected = [dict(
+            description=w.description(),
+            dict=w.to_dict(),
+            repr=repr(w),
+            str=str(w),
+        ) for w in self.feed()]
+        self.assertEqual(expected, rendered)
+        self.assertEqual("[anna](like)[youtube]", rendered[0]['description'])
+        self.assertEqual("[bart](like, 10)[youtube]", rendered[1]['description'])
+
+    def test_render_many_default_fields(self):
+        rendered = self.lex.render_many(self.feed())
+        self.assertEqual(4, len(rendered))
+        self.assertEqual({'description', 'dict'}, set(rendered[0].keys()))
+        self.assertEqual(self.youtube.idn, rendered[0]['dict']['obj'])
+
+    def test_render_many_makes_words_choate(self):
+        feed = self.feed()
+        self.lex.render_many(feed, fields=())
+        for word in feed:
+            self.assertFalse(word._is_inchoate)
+            self.assertFalse(word.sbj._is_inchoate)
+
+    def test_render_many_nonexistent(self):
+        rendered = self.lex.render_many([self.lex[qiki.Number(999)]], fields=('repr',))
+        self.assertEqual([dict(repr="Word(unidentified Number('0q83_03E7'))")], rendered)
+
+    def test_render_many_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.lex.render_many(self.feed(), fields=('txt',))
+
+    def test_presentable(self):
+        self.assertEqual("10", qiki.Word.presentable(qiki.Number(10)))
+        self.assertEqual("10", qiki.Word.presentable(qiki.Number(10)))
+        self.assertEqual("2.5", qiki.Word.presentable(qiki.Number(2.5)))
+        self.assertEqual("0q82_01__7E0100", qiki.Word.presentable(qiki.Number(1, qiki.Suffix(qiki.Suffix.Type.TEST))))
+
+    def test_presentable_least_recently_used(self):
+        self.addCleanup(setattr, qiki.Word, '_presentable_cache', qiki.Word._presentable_cache)
+        self.addCleanup(setattr, qiki.Word, 'PRESENTABLE_CACHE_MAX', qiki.Word.PRESENTABLE_CACHE_MAX)
+        qiki.Word._presentable_cache = type(qiki.Word._presentable_cache)()
+        qiki.Word.PRESENTABLE_CACHE_MAX = 2
+        qiki.Word.presentable(qiki.Number(1))
+        qiki.Word.presentable(qiki.Number(2))
+        qiki.Word.presentable(qiki.Number(1))
+        qiki.Word.presentable(qiki.Number(3))
+        self.assertEqual(
+            [qiki.Number(1).raw, qiki.Number(3).raw],
+            list(qiki.Word._presentable_cache.keys()),
+        )
+
+    def test_format_whn_one_time_lex(self):
+        word = self.feed()[0]
+        "{:w}".format(word)
+        time_lex = qiki.Word._shared_time_lex()
+        "{:w}".format(word)
+        self.assertIs(time_lex, qiki.Word._shared_time_lex())
+
+
+class Word0093RenderManyQueries(WordQoolbarSetup):
+
+    def __init__(self, *args, **kwargs):
+        super(Word0093RenderManyQueries, self).__init__(*args, **kwargs)
+        self.only_sql_flavors()
+
+    def test_render_many_two_selects(self):
+        feed = [self.lex[w.idn] for w in self.lex.find_words(vrb=self.like)]
+        selects = self.count_calls('_decoded_rows')
+        self.lex.render_many(feed, fields=('description', 'dict', 'repr'))
+        self.assertEqual(2, len(selects))
+
+
+class Word0094MembershipFilter(WordTests):
+
+    def setUp(self):
+        super(Word0094MembershipFilter, self).setUp()
+        self.apple = self.lex.noun('apple')
+        self.like = self.lex.verb('like')
+        self.membership = self.lex.use_membership_filter()
+
+    def test_bloom_filter(self):
+        bloom = qiki.word.BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(qiki.Number(i).raw)
+        for i in range(1000):
+            self.assertIn(qiki.Number(i).raw, bloom)
+        false_positives = sum(1 for i in range(1000, 11000) if qiki.Number(i).raw in bloom)
+        self.assertLess(false_positives, 300)
+        self.assertAlmostEqual(0.01, bloom.false_positive_rate(), delta=0.005)
+
+    def test_membership_filter_exposed(self):
+        self.assertIs(self.membership, self.lex.membership_filter)
+        count_before = self.membership.count
+        self.lex.noun('pear')
+        self.assertGreater(self.membership.count, count_before)
+        self.assertLess(self.membership.false_positive_rate(), 0.001)
+
+    def test_missing_idn_answered_locally(self):
+        calls = self.count_calls('_populate_word_from_idn')
+        self.assertFalse(self.lex[qiki.Number(999)].exists())
+        self.assertEqual(0, len(calls))
+        self.assertTrue(self.lex[self.apple.idn].exists())
+        self.assertEqual(1, len(calls))
+
+    def test_missing_name_answered_locally(self):
+        self.lex._forget_cached_words()
+        calls = self.count_calls('_populate_word_from_definition')
+        with self.assertRaises(ValueError):
+            self.lex.idn_ify('pear')
+        self.assertEqual(0, len(calls))
+        self.assertEqual(self.apple, self.lex['apple'])
+        self.assertEqual(1, len(calls))
+
+    def test_missing_sbj_vrb_obj_answered_locally(self):
+        calls = self.count_calls('_populate_word_from_sbj_vrb_obj')
+        with self.assertNewWord():
+            self.lex.create_word(sbj=self.lex._lex, vrb=self.like, obj=self.apple, use_already=True)
+        self.assertEqual(0, len(calls))
+        with self.assertNoNewWord():
+            self.lex.create_word(sbj=self.lex._lex, vrb=self.like, obj=self.apple, use_already=True)
+        self.assertEqual(1, len(calls))
+
+    def test_inserts_keep_filter_current(self):
+        pear = self.lex.noun('pear')
+        self.assertEqual(pear, self.lex['pear'])
+        self.assertTrue(self.lex[pear.idn].exists())
+        self.assertTrue(self.membership.might_have_name('pear'))
+        self.assertTrue(self.membership.might_have_idn(pear.idn))
+
+
+class Word0095SentenceTemplate(WordTests):
+
+    def setUp(self):
+        super(Word0095SentenceTemplate, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.banana = self.lex.noun('banana')
+
+    def test_say_same_as_bracket_syntax(self):
+        self.lex[self.fred](self.like)[self.apple] = 10, "so crisp"
+        bracket_word = self.lex[self.fred](self.like)[self.apple]
+        with self.assertNewWord():
+            said_word = self.lex.sentence(self.fred, self.like).say(self.apple, 10, "so crisp")
+        self.assertEqual(bracket_word.idn + 1, said_word.idn)
+        self.assertTrue(said_word.exists())
+        for field in ('sbj', 'vrb', 'obj', 'num', 'txt'):
+            self.assertEqual(getattr(bracket_word, field), getattr(said_word, field))
+        self.assertEqual(said_word, self.lex[self.fred](self.like)[self.apple])
+        self.assertIsInstance(said_word.whn, qiki.Number)
+
+    def test_say_by_name_and_idn(self):
+        like = self.lex.sentence('fred', 'like')
+        word = like.say('apple')
+        self.assertEqual(self.fred, word.sbj)
+        self.assertEqual(self.like, word.vrb)
+        self.assertEqual(self.apple, word.obj)
+        self.assertEqual(qiki.Number(1), word.num)
+        self.assertEqual("", word.txt)
+        word = like.say(self.banana.idn, -1)
+        self.assertEqual(self.banana, word.obj)
+        self.assertEqual(qiki.Number(-1), word.num)
+
+    def test_say_many(self):
+        like = self.lex.sentence(self.fred, self.like)
+        with self.assertNewWords(3):
+            words = like.say_many([
+                (self.apple, 10),
+                (self.banana, -1, "too mushy"),
+                (self.apple,),
+            ])
+        self.assertEqual([self.apple, self.banana, self.apple], [w.obj for w in words])
+        self.assertEqual([10, -1, 1], [int(w.num) for w in words])
+        self.assertEqual(["", "too mushy", ""], [w.txt for w in words])
+        self.assertEqual(words[2], self.lex[self.fred](self.like)[self.apple])
+
+    def test_sentence_resolves_once(self):
+        like = self.lex.sentence('fred', 'like')
+        self.assertEqual(self.fred, like.sbj)
+        self.assertEqual(self.like, like.vrb)
+        with self.assertRaises(qiki.Lex.NotFound):
+            self.lex.sentence('fred', 'loathe')
+        with self.assertRaises(qiki.Lex.NotFound):
+            like.say('cherry')
+
+    def test_say_reads_no_words(self):
+        like = self.lex.sentence(self.fred, self.like)
+        apple = self.lex[self.apple.idn]
+        populates = self.count_calls('populate_word_from_idn')
+        for n in range(10):
+            like.say(apple, n)
+            like.say(self.banana.idn, n)
+        self.assertEqual(0, len(populates))
+        self.assertEqual(qiki.Number(9), self.lex[self.fred](self.like)[self.apple].num)
+
+
+class Word0096Records(WordTests):
+
+    def setUp(self):
+        super(Word0096Records, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.fred_like_apple = self.lex.create_word(self.fred, self.like, self.apple, 10, "crisp ☺")
+
+    def assertSameWord(self, expected, actual):
+        self.assertEqual(expected.idn, actual.idn)
+        for field in ('sbj', 'vrb', 'obj', 'num', 'txt', 'whn'):
+            self.assertEqual(getattr(expected, field), getattr(actual, field))
+
+    def test_record_round_trip(self):
+        record = self.fred_like_apple.to_record()
+        self.assertIsInstance(record, six.binary_type)
+        words = self.lex.words_from_records(record)
+        self.assertEqual(1, len(words))
+        self.assertSameWord(self.fred_like_apple, words[0])
+        self.assertTrue(words[0].exists())
+        self.assertIs(self.lex, words[0].lex)
+
+    def test_records_round_trip(self):
+        originals = [self.fred, self.like, self.apple, self.fred_like_apple]
+        records = self.lex.records_from_words(originals)
+        for buffer in (records, bytearray(records), memoryview(records)):
+            words = self.lex.words_from_records(buffer)
+            self.assertEqual(4, len(words))
+            for original, word in zip(originals, words):
+                self.assertSameWord(original, word)
+
+    def test_record_layout(self):
+        record = self.fred_like_apple.to_record()
+        self.assertEqual(
+            b'\x00\x02' + self.fred_like_apple.idn.raw,
+            record[:2 + len(self.fred_like_apple.idn.raw)]
+        )
+        self.assertTrue(record.endswith(b'\x00\x00\x00\x09crisp \xe2\x98\xba'))
+
+    def test_no_records(self):
+        self.assertEqual(b'', self.lex.records_from_words([]))
+        self.assertEqual([], self.lex.words_from_records(b''))
+
+    def test_truncated_record(self):
+        record = self.fred_like_apple.to_record()
+        for cut in (1, 3, len(record) - 1):
+            with self.assertRaises(qiki.LexSentence.RecordError):
+                self.lex.words_from_records(record[:cut])
+
+
+class Word0097LazyTxt(WordTests):
+
+    def setUp(self):
+        super(Word0097LazyTxt, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.banana = self.lex.noun('banana')
+        self.lex.create_word(self.fred, self.like, self.apple, 10, "so crisp")
+        self.lex.create_word(self.fred, self.like, self.banana, -1, "too mushy")
+        self.lex.create_word(self.apple, self.like, self.banana, 2)
+
+    def test_lazy_txt_same_words(self):
+        eager = self.lex.find_words(vrb=self.like)
+        lazy = self.lex.find_words(vrb=self.like, lazy_txt=True)
+        self.assertEqual([w.idn for w in eager], [w.idn for w in lazy])
+        self.assertEqual([w.num for w in eager], [w.num for w in lazy])
+        self.assertEqual([w.txt for w in eager], [w.txt for w in lazy])
+        self.assertEqual(["so crisp", "too mushy", ""], [w.txt for w in lazy])
+        self.assertEqual([w.to_dict() for w in eager], [w.to_dict() for w in lazy])
+
+    def test_lazy_txt_fetched_once_for_all(self):
+        fetches = self.count_calls('_txts_by_idn')
+        lazy = self.lex.find_words(vrb=self.like, lazy_txt=True)
+        self.assertEqual([10, -1, 2], [int(w.num) for w in lazy])
+        self.assertEqual([self.apple, self.banana, self.banana], [w.obj for w in lazy])
+        self.assertEqual(0, len(fetches))
+        self.assertEqual("too mushy", lazy[1].txt)
+        self.assertEqual(1, len(fetches))
+        self.assertEqual("so crisp", lazy[0].txt)
+        self.assertEqual("", lazy[2].txt)
+        self.assertEqual(1, len(fetches))
+
+    def test_eager_txt_never_fetched(self):
+        fetches = self.count_calls('_txts_by_idn')
+        eager = self.lex.find_words(vrb=self.like)
+        self.assertEqual("so crisp", eager[0].txt)
+        self.assertEqual(0, len(fetches))
+
+    def test_populate_txts(self):
+        fetches = self.count_calls('_txts_by_idn')
+        lazy = self.lex.find_words(vrb=self.like, lazy_txt=True)
+        self.lex.populate_txts(lazy[1:])
+        self.assertEqual(1, len(fetches))
+        self.assertEqual("too mushy", lazy[1].txt)
+        self.assertEqual(1, len(fetches))
+        self.assertEqual("so crisp", lazy[0].txt)
+        self.assertEqual(2, len(fetches))
+
+    def test_lazy_txt_with_jbo(self):
+        lazy = self.lex.find_words(obj=self.banana, jbo_vrb=[self.like], lazy_txt=True)
+        self.assertEqual(["too mushy", ""], [w.txt for w in lazy])
+
+
+class Word0098ChoateTracer(WordTests):
+
+    def setUp(self):
+        super(Word0098ChoateTracer, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.fruits = [self.lex.noun(name) for name in ('apple', 'banana', 'cherry')]
+        self.likings = [self.lex.create_word(self.fred, self.like, fruit) for fruit in self.fruits]
+
+    def n_plus_1(self):
+        names = []
+        for liking in self.likings:
+            fruit = self.lex[liking.idn].obj
+            names.append(fruit.txt)
+        return names
+
+    def test_trace_choates(self):
+        with self.lex.trace_choates() as tracer:
+            self.assertIs(tracer, self.lex.choate_tracer)
+            self.assertEqual(["apple", "banana", "cherry"], self.n_plus_1())
+        self.assertIsNone(self.lex.choate_tracer)
+        self.assertEqual(6, len(tracer.events))
+        self.assertEqual(['obj', 'obj', 'obj', 'txt', 'txt', 'txt'], sorted(e[1] for e in tracer.events))
+        for signature, why, seconds in tracer.events:
+            self.assertIn("n_plus_1", signature[0])
+            self.assertIn("test_word.py:", signature[0])
+            self.assertGreaterEqual(seconds, 0.0)
+
+    def test_hottest(self):
+        with self.lex.trace_choates(stack_depth=1) as tracer:
+            self.n_plus_1()
+            self.lex[self.fred.idn].exists()
+        hottest = tracer.hottest()
+        self.assertEqual(3, len(hottest))
+        signature, count, seconds, whys = hottest[0]
+        self.assertEqual(1, len(signature))
+        self.assertEqual(3, count)
+        self.assertEqual(1, hottest[2][1])
+        self.assertEqual(['exists()'], hottest[2][3])
+        self.assertEqual(1, len(tracer.hottest(limit=1)))
+        report = tracer.report()
+        self.assertTrue(report.startswith("7 words became choate"), report)
+        self.assertIn("n_plus_1", report)
+
+    def test_no_lazy_loads(self):
+        with self.lex.trace_choates() as tracer:
+            words = self.lex.find_words(vrb=self.like)
+            self.lex.populate_words(words)
+            with tracer.no_lazy_loads():
+                self.assertEqual([1, 1, 1], [int(w.num) for w in words])
+                with self.assertRaises(qiki.word.ChoateTracer.LazyLoad):
+                    self.lex[self.fred.idn].txt
+            self.assertEqual("fred", self.lex[self.fred.idn].txt)
+
+    def test_not_tracing(self):
+        self.lex.trace_choates()
+        self.lex.untrace_choates()
+        self.assertIsNone(self.lex.choate_tracer)
+        self.assertEqual(["apple", "banana", "cherry"], self.n_plus_1())
+
+
+class Word0099FindJbo(WordQoolbarSetup):
+
+    def test_find_jbo(self):
+        self.assertEqual([self.anna_like_youtube, self.bart_like_youtube], self.youtube.find_jbo())
+        self.assertEqual([self.anna_like_zigzags, self.bart_delete_zigzags], self.zigzags.find_jbo())
+        self.assertEqual([self.anna_like_zigzags], self.zigzags.find_jbo(vrb=self.like))
+        self.assertEqual([self.anna_like_zigzags], self.zigzags.find_jbo(vrb='like'))
+        self.assertEqual([self.bart_delete_zigzags], self.zigzags.find_jbo(vrb=[self.delete.idn]))
+        self.assertEqual([], self.anna.find_jbo())
+
+    def test_find_jbs(self):
+        self.assertEqual([self.anna_like_youtube, self.anna_like_zigzags], self.anna.find_jbs())
+        self.assertEqual([self.bart_delete_zigzags], self.bart.find_jbs(vrb=self.delete))
+        self.assertEqual([], self.youtube.find_jbs())
+
+    def test_find_jbo_same_as_find_words_jbo(self):
+        nouns = self.lex.find_words(obj=self.lex.noun(), jbo_vrb=[self.like, self.delete])
+        for noun in nouns:
+            self.assertEqual(noun.jbo, noun.find_jbo(vrb=[self.like, self.delete]))
+
+    def test_find_jbo_loads_result_set_at_once(self):
+        finds = self.count_calls('_find_related_words')
+        nouns = self.lex.find_words(obj=self.lex.noun())
+        self.assertEqual(
+            [[], [], [], [self.anna_like_youtube, self.bart_like_youtube], [self.anna_like_zigzags]],
+            [noun.find_jbo(vrb=self.like) for noun in nouns[-5:]]
+        )
+        self.assertEqual(1, len(finds))
+        nouns[0].find_jbo(vrb=self.like)
+        self.assertEqual(1, len(finds))
+        nouns[0].find_jbo()
+        self.assertEqual(2, len(finds))
+        [noun.find_jbs() for noun in nouns]
+        self.assertEqual(3, len(finds))
+
+    def test_populate_related(self):
+        finds = self.count_calls('_find_related_words')
+        words = [self.lex[self.youtube.idn], self.lex[self.zigzags.idn]]
+        self.lex.populate_related(words, 'obj', self.lex.vrbs_ify('like'))
+        self.assertEqual(1, len(finds))
+        self.assertEqual([self.anna_like_zigzags], words[1].find_jbo(vrb='like'))
+        self.assertEqual(1, len(finds))
+
+    def test_find_jbo_after_insert(self):
+        self.assertEqual([self.anna_like_youtube, self.bart_like_youtube], self.youtube.find_jbo())
+        bart_like_youtube_again = self.bart.says(self.like, self.youtube, 20)
+        self.assertEqual(
+            [self.anna_like_youtube, self.bart_like_youtube, bart_like_youtube_again],
+            self.youtube.find_jbo()
+        )
+
+    def test_vrbs_ify(self):
+        self.assertIsNone(self.lex.vrbs_ify(None))
+        self.assertIsNone(self.lex.vrbs_ify([]))
+        self.assertEqual(frozenset([self.like.idn]), self.lex.vrbs_ify('like'))
+        self.assertEqual(
+            frozenset([self.like.idn, self.delete.idn]),
+            self.lex.vrbs_ify([self.like, self.delete.idn])
+        )
+
+
+class Word0100UpsertWord(WordTests):
+
+    def setUp(self):
+        super(Word0100UpsertWord, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+
+    def test_upsert_word(self):
+        with self.assertNewWord():
+            word, is_new = self.lex.upsert_word(self.fred, self.like, self.apple, 10, "crisp")
+        self.assertTrue(is_new)
+        self.assertTrue(word.exists())
+        with self.assertNoNewWord():
+            same_word, is_new = self.lex.upsert_word(self.fred, self.like, self.apple, 10, "crisp")
+        self.assertFalse(is_new)
+        self.assertEqual(word.idn, same_word.idn)
+        self.assertEqual(word.whn, same_word.whn)
+
+    def test_upsert_word_different_num_or_txt(self):
+        first, _ = self.lex.upsert_word(self.fred, self.like, self.apple, 10, "crisp")
+        with self.assertNewWord():
+            second, is_new = self.lex.upsert_word(self.fred, self.like, self.apple, 11, "crisp")
+        self.assertTrue(is_new)
+        with self.assertNewWord():
+            third, is_new = self.lex.upsert_word(self.fred, self.like, self.apple, 11, "crunchy")
+        self.assertTrue(is_new)
+        self.assertEqual([first.idn + 1, second.idn + 1], [second.idn, third.idn])
+
+    def test_upsert_word_latest_wins(self):
+        self.lex.create_word(self.fred, self.like, self.apple, 10)
+        self.lex.create_word(self.fred, self.like, self.apple, 20)
+        with self.assertNewWord():
+            word, is_new = self.lex.upsert_word(self.fred, self.like, self.apple, 10)
+        self.assertTrue(is_new)
+        with self.assertNoNewWord():
+            same_word, is_new = self.lex.upsert_word(self.fred, self.like, self.apple, 10)
+        self.assertFalse(is_new)
+        self.assertEqual(word.idn, same_word.idn)
+
+    def test_upsert_word_same_as_use_already(self):
+        word, _ = self.lex.upsert_word('fred', 'like', 'apple')
+        with self.assertNoNewWord():
+            same_word = self.lex.create_word('fred', 'like', 'apple', use_already=True)
+        self.assertEqual(word.idn, same_word.idn)
+        self.assertEqual(qiki.Number(1), same_word.num)
+        self.assertEqual("", same_word.txt)
+
+    def test_upsert_word_bad_num(self):
+        with self.assertRaises(qiki.LexSentence.CreateWordError):
+            self.lex.upsert_word(self.fred, self.like, self.apple, num="ten")
+
+    def test_use_already_txt_case_matters(self):
+        old_word = self.lex.create_word(self.fred, self.like, self.apple, 10, "crunchy")
+        with self.assertNewWord():
+            new_word = self.lex.create_word(self.fred, self.like, self.apple, 10, "Crunchy", use_already=True)
+        self.assertEqual(old_word.idn + 1, new_word.idn)
+        self.assertEqual("Crunchy", new_word.txt)
+        with self.assertNewWord():
+            self.lex.create_word(self.fred, self.like, self.apple, 10, "Crunchy ", use_already=True)
+        with self.assertNoNewWord():
+            self.lex.create_word(self.fred, self.like, self.apple, 10, "Crunchy ", use_already=True)
+
+
+class Word0101NumAddConcurrent(WordTests):
+    N_THREADS = 4
+    N_INCREMENTS = 50
+
+    def setUp(self):
+        super(Word0101NumAddConcurrent, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.vote = self.lex.verb('vote')
+        self.hot = self.lex.noun('hot counter')
+
+    def increment(self):
+        for _ in range(self.N_INCREMENTS):
+            self.lex.create_word(self.fred, self.vote, self.hot, num_add=1)
+
+    def test_num_add_txt_carries_over(self):
+        self.lex.create_word(self.fred, self.vote, self.hot, num=10, txt="tally")
+        word = self.lex.create_word(self.fred, self.vote, self.hot, num_add=5)
+        self.assertEqual(qiki.Number(15), word.num)
+        self.assertEqual("tally", word.txt)
+        self.assertTrue(word.exists())
+        self.assertEqual(word, self.lex[self.fred](self.vote)[self.hot])
+
+    def test_concurrent_num_add_throughput(self):
+        """Hot counter benchmark:  no increment is lost, and how many per second."""
+        threads = [threading.Thread(target=self.increment) for _ in range(self.N_THREADS)]
+        n_total = self.N_THREADS * self.N_INCREMENTS
+        t_start = time.time()
+        with self.assertNewWords(n_total):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        t_delta = time.time() - t_start
+        self.assertEqual(qiki.Number(n_total), self.lex[self.fred](self.vote)[self.hot].num)
+        if SHOW_THROUGHPUT:
+            print("\n{n} concurrent num_add increments in {sec:.3f} sec, {rate:.0f} per second".format(
+                n=n_total,
+                sec=t_delta,
+                rate=n_total / t_delta if t_delta > 0 else float('inf'),
+            ))
+
+    class LexOtherProcess(qiki.LexMySQL):
+        """As if in another process:  a process-global lock all its own."""
+        _global_lock = threading.Lock()
+
+    def test_num_add_other_process(self):
+        if not isinstance(self.lex, qiki.LexMySQL):
+            self.skipTest("Only LexMySQL can be shared by processes")
+        other_lex = self.LexOtherProcess(**self.credentials)
+        self.addCleanup(other_lex.disconnect)
+        self.assertIsNot(self.lex._global_lock, other_lex._global_lock)
+
+        def increment_other():
+            for _ in range(self.N_INCREMENTS):
+                other_lex.create_word(self.fred.idn, self.vote.idn, self.hot.idn, num_add=1)
+
+        threads = [threading.Thread(target=self.increment), threading.Thread(target=increment_other)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(qiki.Number(2 * self.N_INCREMENTS), self.lex[self.fred](self.vote)[self.hot].num)
+
+
+class Word0102CreateWords(WordTests):
+
+    def setUp(self):
+        super(Word0102CreateWords, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.banana = self.lex.noun('banana')
+
+    def test_create_words(self):
+        max_idn_before = self.lex.max_idn()
+        with self.assertNewWords(3):
+            words = self.lex.create_words([
+                (self.fred, self.like, self.apple),
+                (self.fred, self.like, self.banana, -1),
+                ('fred', 'like', 'apple', 10, "so crisp"),
+            ])
+        self.assertEqual([max_idn_before + 1, max_idn_before + 2, max_idn_before + 3], [w.idn for w in words])
+        self.assertEqual([self.apple, self.banana, self.apple], [w.obj for w in words])
+        self.assertEqual([1, -1, 10], [int(w.num) for w in words])
+        self.assertEqual(["", "", "so crisp"], [w.txt for w in words])
+        for word in words:
+            self.assertTrue(word.exists())
+            self.assertEqual(self.fred, word.sbj)
+            self.assertEqual(self.like, word.vrb)
+            self.assertEqual(words[0].whn, word.whn)
+            self.assertEqual(word, self.lex[word.idn])
+        self.assertEqual(words[2], self.lex[self.fred](self.like)[self.apple])
+
+    def test_create_words_then_create_word(self):
+        words = self.lex.create_words([(self.fred, self.like, self.apple)] * 5)
+        word = self.lex.create_word(self.fred, self.like, self.banana)
+        self.assertEqual(words[-1].idn + 1, word.idn)
+
+    def test_create_no_words(self):
+        with self.assertNoNewWord():
+            self.assertEqual([], self.lex.create_words([]))
+
+    def test_create_words_bad_num(self):
+        with self.assertNoNewWord():
+            with self.assertRaises(qiki.LexSentence.CreateWordError):
+                self.lex.create_words([
+                    (self.fred, self.like, self.apple),
+                    (self.fred, self.like, self.banana, "ten"),
+                ])
+
+    def test_create_words_resolves_names_once(self):
+        reads = self.count_calls('read_word')
+        self.lex.create_words([('fred', 'like', 'apple', n) for n in range(10)])
+        self.assertEqual(1, len([
+            args for args, _, _ in reads if isinstance(args[0], six.text_type) and args[0] == 'apple'
+        ]))
+
+    def test_say_many_inserts_together(self):
+        like = self.lex.sentence(self.fred, self.like)
+        words = like.say_many([(self.apple, 1), (self.banana, 2)])
+        self.assertEqual(words[0].idn + 1, words[1].idn)
+        self.assertEqual(words[0].whn, words[1].whn)
+
+
+class Word0103IdnAllocator(WordTests):
+
+    def setUp(self):
+        super(Word0103IdnAllocator, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+
+    def tearDown(self):
+        self.lex.use_idn_allocator(None)
+        super(Word0103IdnAllocator, self).tearDown()
+
+    def use_blocks(self, block_size):
+        allocator = qiki.word.IdnBlockAllocator(self.lex, block_size=block_size)
+        self.lex.use_idn_allocator(allocator)
+        reserves = self.count_calls('reserve_idns')
+        return allocator, reserves
+
+    @staticmethod
+    def reservations(reserves):
+        return [args[0] for args, _, _ in reserves]
+
+    def test_num_add_keeps_global_lock(self):
+        self.use_blocks(10)
+        self.lex.create_word(self.fred, self.like, self.apple, 10)
+        thread = threading.Thread(
+            target=self.lex.create_word,
+            args=(self.fred, self.like, self.apple),
+            kwargs=dict(num_add=5),
+        )
+        with self.lex._global_lock:
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+        thread.join()
+        self.assertEqual(qiki.Number(15), self.lex[self.fred](self.like)[self.apple].num)
+
+    def test_block_size_1(self):
+        _, reserves = self.use_blocks(1)
+        max_idn_before = self.lex.max_idn()
+        word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.assertEqual(max_idn_before + 1, word.idn)
+        self.assertEqual(word, self.lex[self.fred](self.like)[self.apple])
+        self.assertEqual([1], self.reservations(reserves))
+
+    def test_blocks(self):
+        _, reserves = self.use_blocks(10)
+        max_idn_before = self.lex.max_idn()
+        words = [self.lex.create_word(self.fred, self.like, self.apple, n) for n in range(25)]
+        self.assertEqual([max_idn_before + 1 + n for n in range(25)], [w.idn for w in words])
+        self.assertEqual([10, 10, 10], self.reservations(reserves))
+        for n, word in enumerate(words):
+            self.assertEqual(n, int(self.lex[word.idn].num))
+
+    def test_blocks_bulk(self):
+        _, reserves = self.use_blocks(10)
+        self.lex.create_word(self.fred, self.like, self.apple)
+        words = self.lex.create_words([(self.fred, self.like, self.apple)] * 25)
+        self.assertEqual(words[0].idn + 24, words[-1].idn)
+        self.assertEqual([10, 16], self.reservations(reserves))
+        word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.assertEqual(words[-1].idn + 1, word.idn)
+
+    def test_allocator_lock_not_global_lock(self):
+        allocator, _ = self.use_blocks(10)
+        self.assertIs(allocator.lock, self.lex._lock_next_word())
+        self.assertIsNot(self.lex._global_lock, self.lex._lock_next_word())
+        self.lex.use_idn_allocator(None)
+        self.assertIs(self.lex._global_lock, self.lex._lock_next_word())
+
+    def test_back_to_max_idn(self):
+        self.use_blocks(10)
+        word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.lex.use_idn_allocator(None)
+        next_word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.assertEqual(word.idn + 1, next_word.idn)
+
+    def test_allocator_again_after_max_idn(self):
+        allocator, _ = self.use_blocks(10)
+        word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.lex.use_idn_allocator(None)
+        max_idn_word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.lex.use_idn_allocator(allocator)
+        next_word = self.lex.create_word(self.fred, self.like, self.apple)
+        self.assertEqual(word.idn + 1, max_idn_word.idn)
+        self.assertGreater(next_word.idn, max_idn_word.idn)
+
+    def test_reserve_inside_transaction(self):
+        if not isinstance(self.lex, qiki.LexMySQL):
+            self.skipTest("Only LexMySQL has transactions")
+        self.use_blocks(1)
+        with self.lex._connected():
+            self.lex._start_transaction()
+            self.lex.next_idn()
+            self.assertTrue(self.lex._connection.in_transaction)
+            self.lex._commit()
+
+
+class Word0104WriteBehind(WordTests):
+
+    def setUp(self):
+        super(Word0104WriteBehind, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+
+    def tearDown(self):
+        self.lex.stop_write_behind()
+        self.lex.use_idn_allocator(None)
+        super(Word0104WriteBehind, self).tearDown()
+
+    def use_write_behind(self, **kwargs):
+        if isinstance(self.lex, qiki.LexMySQL):
+            writer = qiki.LexMySQL(**self.credentials)   # its own connection, for the other thread
+            self.addCleanup(writer.disconnect)
+        else:
+            writer = None
+        return self.lex.use_write_behind(writer=writer, **kwargs)
+
+    def test_read_before_stored(self):
+        write_behind = self.use_write_behind(batch_size=100, flush_seconds=60.0)
+        word = self.lex.create_word(self.fred, self.like, self.apple, 42)
+        self.assertTrue(word.exists())
+        self.assertIs(word, write_behind.pending_word(word.idn))
+        self.assertEqual(1, write_behind.stats()['queue_depth'])
+        self.assertEqual(42, self.lex[word.idn].num)
+        self.assertEqual(self.apple, self.lex[word.idn].obj)
+
+    def test_lookup_flushes(self):
+        write_behind = self.use_write_behind(batch_size=100, flush_seconds=60.0)
+        word = self.lex.create_word(self.fred, self.like, self.apple, 42)
+        self.assertEqual(word.idn, self.lex[self.fred](self.like)[self.apple].idn)
+        self.assertEqual(0, write_behind.stats()['queue_depth'])
+        self.assertIsNone(write_behind.pending_word(word.idn))
+
+    def test_find_words_flushes(self):
+        self.use_write_behind(batch_size=100, flush_seconds=60.0)
+        words = [self.lex.create_word(self.fred, self.like, self.apple, n) for n in range(5)]
+        found = self.lex.find_words(sbj=self.fred, vrb=self.like)
+        self.assertEqual([w.idn for w in words], [w.idn for w in found])
+
+    def test_batches(self):
+        write_behind = self.use_write_behind(batch_size=10, flush_seconds=60.0)
+        for n in range(25):
+            self.lex.create_word(self.fred, self.like, self.apple, n)
+        self.lex.stop_write_behind()
+        stats = write_behind.stats()
+        self.assertEqual(25, stats['n_words'])
+        self.assertEqual(3, stats['n_flushes'])
+        self.assertEqual(0, stats['queue_depth'])
+        self.assertEqual(0, stats['n_errors'])
+        self.assertEqual(24, self.lex[self.fred](self.like)[self.apple].num)
+
+    def test_flush_seconds(self):
+        write_behind = self.use_write_behind(batch_size=100, flush_seconds=0.01)
+        self.lex.create_word(self.fred, self.like, self.apple, 42)
+        for _ in range(500):
+            if write_behind.stats()['n_flushes'] > 0:
+                break
+            time.sleep(0.01)
+        self.assertEqual(1, write_behind.stats()['n_words'])
+
+    def test_bulk(self):
+        write_behind = self.use_write_behind(batch_size=10, flush_seconds=60.0)
+        words = self.lex.create_words([(self.fred, self.like, self.apple, n) for n in range(15)])
+        self.assertEqual(words[0].idn + 14, words[-1].idn)
+        write_behind.flush()
+        self.assertEqual(15, write_behind.stats()['n_words'])
+        self.assertEqual(14, self.lex[self.fred](self.like)[self.apple].num)
+
+    def test_error_keeps_words(self):
+        write_behind = self.use_write_behind(batch_size=100, flush_seconds=60.0)
+        word = self.lex.create_word(self.fred, self.like, self.apple, 42)
+        write_original = write_behind.writer._write_words
+
+        def write_broken(_):
+            raise IOError("disk on fire")
+
+        write_behind.writer._write_words = write_broken
+        with self.assertRaises(IOError):
+            write_behind.flush()
+        stats = write_behind.stats()
+        self.assertEqual(1, stats['n_errors'])
+        self.assertEqual(1, stats['queue_depth'])
+        self.assertIs(word, write_behind.pending_word(word.idn))
+
+        write_behind.writer._write_words = write_original
+        write_behind.flush()
+        self.assertEqual(42, self.lex[self.fred](self.like)[self.apple].num)
+
+    def test_error_gives_up_after_max_tries(self):
+        write_behind = self.use_write_behind(batch_size=100, flush_seconds=60.0, max_tries=2)
+        word = self.lex.create_word(self.fred, self.like, self.apple, 42)
+
+        def write_broken(_):
+            raise IOError("duplicate idn")
+
+        write_behind.writer._write_words = write_broken
+        self.addCleanup(delattr, write_behind.writer, '_write_words')
+        with self.assertRaises(IOError):
+            write_behind.flush()
+        with self.assertRaises(IOError):
+            write_behind.flush()
+        write_behind.flush()
+        stats = write_behind.stats()
+        self.assertEqual(2, stats['n_errors'])
+        self.assertEqual(0, stats['queue_depth'])
+        self.assertEqual(1, len(stats['dead_letters']))
+        dead_words, dead_error = stats['dead_letters'][0]
+        self.assertEqual([word], dead_words)
+        self.assertIsInstance(dead_error, IOError)
+        self.assertIsNone(write_behind.pending_word(word.idn))
+
+    def test_full_queue_raises_while_failing(self):
+        write_behind = self.use_write_behind(batch_size=1, max_queue=1, flush_seconds=60.0, max_tries=100)
+        write_original = write_behind.writer._write_words
+
+        def write_broken(_):
+            raise IOError("database gone")
+
+        write_behind.writer._write_words = write_broken
+        self.addCleanup(delattr, write_behind.writer, '_write_words')
+        self.lex.create_word(self.fred, self.like, self.apple, 1)
+        t_start = time.time()
+        while write_behind.stats()['n_errors'] < 1:
+            self.assertLess(time.time() - t_start, 5.0)
+            time.sleep(0.01)
+        with self.assertRaises(IOError):
+            self.lex.create_word(self.fred, self.like, self.apple, 2)
+        write_behind.writer._write_words = write_original
+        write_behind.flush()
+        self.assertEqual(1, self.lex[self.fred](self.like)[self.apple].num)
+
+    def test_flush_waits_for_background_batch(self):
+        write_behind = self.use_write_behind(batch_size=5, flush_seconds=60.0)
+        write_original = write_behind.writer._write_words
+        batch_started = threading.Event()
+
+        def write_slowly(words):
+            batch_started.set()
+            time.sleep(0.2)
+            write_original(words)
+
+        write_behind.writer._write_words = write_slowly
+        self.addCleanup(delattr, write_behind.writer, '_write_words')
+        self.lex.create_words([(self.fred, self.like, self.apple, n) for n in range(5)])
+        self.assertTrue(batch_started.wait(5.0))
+        self.assertEqual(0, write_behind.stats()['queue_depth'])
+        self.assertEqual(5, len(self.lex.find_words(vrb=self.like)))
+        self.assertIsNone(write_behind.pending_word(self.lex.max_idn()))
+
+    def test_stop_puts_back_idn_allocation(self):
+        self.use_write_behind()
+        self.assertIsInstance(self.lex.idn_allocator, qiki.word.IdnBlockAllocator)
+        self.lex.stop_write_behind()
+        self.assertIsNone(self.lex.idn_allocator)
+        max_idn_before = self.lex.max_idn()
+        self.assertEqual(max_idn_before + 1, self.lex.create_word(self.fred, self.like, self.apple).idn)
+
+    def test_stop_keeps_own_idn_allocator(self):
+        allocator = qiki.word.IdnBlockAllocator(self.lex, block_size=3)
+        self.lex.use_idn_allocator(allocator)
+        self.use_write_behind()
+        self.assertIs(allocator, self.lex.idn_allocator)
+        self.lex.stop_write_behind()
+        self.assertIs(allocator, self.lex.idn_allocator)
+
+    def test_closed(self):
+        write_behind = self.use_write_behind()
+        self.lex.stop_write_behind()
+        with self.assertRaises(qiki.word.WriteBehind.ClosedError):
+            write_behind.put([])
+
+
+class Word0105WhnClock(WordTests):
+
+    def setUp(self):
+        super(Word0105WhnClock, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+
+    def tearDown(self):
+        self.lex.whn_clock.unique = False
+        super(Word0105WhnClock, self).tearDown()
+
+    def test_now_is_about_now(self):
+        self.assertAlmostEqual(time.time(), float(self.lex.now_number()), delta=2.0)
+
+    def test_never_decreasing(self):
+        whns = [self.lex.now_number() for _ in range(100)]
+        self.assertEqual(sorted(whns), whns)
+
+    def test_clock_set_back(self):
+        clock = qiki.word.WhnClock()
+        whn_before = clock.now()
+        clock._offset -= 3600.0   # as if the system clock were set back an hour
+        self.assertGreaterEqual(clock.now(), whn_before)
+
+    def test_unique(self):
+        clock = qiki.word.WhnClock(unique=True)
+        clock._offset -= 3600.0
+        whn_before = clock.now()
+        clock._offset -= 3600.0
+        whns = [clock.now() for _ in range(100)] + clock.nows(100)
+        self.assertGreater(whns[0], whn_before)
+        self.assertEqual(200, len(set(whns)))
+        self.assertEqual(sorted(whns), whns)
+
+    def test_batch_same_whn(self):
+        words = self.lex.create_words([(self.fred, self.like, self.apple, n) for n in range(3)])
+        self.assertEqual(1, len(set(w.whn for w in words)))
+
+    def test_batch_unique_whn(self):
+        self.lex.whn_clock.unique = True
+        words = self.lex.create_words([(self.fred, self.like, self.apple, n) for n in range(3)])
+        word = self.lex.create_word(self.fred, self.like, self.apple, 3)
+        whns = [w.whn for w in words + [word]]
+        self.assertEqual(4, len(set(whns)))
+        self.assertEqual(sorted(whns), whns)
+
+    def test_own_clock(self):
+        self.assertIsInstance(self.lex.whn_clock, qiki.word.WhnClock)
+        self.assertIsNot(self.lex.whn_clock, qiki.LexInMemory().whn_clock)
+
+    def test_wall_now_number(self):
+        self.assertAlmostEqual(time.time(), float(qiki.LexSentence.wall_now_number()), delta=2.0)
+        self.assertAlmostEqual(time.time(), float(type(self.lex).wall_now_number()), delta=2.0)
+
+    def test_replaced_clock_goes_backwards(self):
+        early = self.lex.create_word(self.fred, self.like, self.apple, 1)
+        self.addCleanup(setattr, self.lex, 'whn_clock', self.lex.whn_clock)
+        self.lex.whn_clock = qiki.word.WhnClock()
+        self.lex.whn_clock._offset -= 3600.0
+        late = self.lex.create_word(self.fred, self.like, self.apple, 2)
+        self.assertLess(late.whn, early.whn)
+
+        def nums(**kwargs):
+            return [int(w.num) for w in self.lex.find_words(sbj=self.fred, **kwargs)]
+        self.assertEqual([1], nums(whn_after=float(early.whn) - 1))
+        self.assertEqual([2], nums(whn_before=float(early.whn) - 1))
+        self.assertEqual([1, 2], nums(whn_after=float(late.whn) - 1))
+
+
+class Word0106FindWordsPaging(WordTests):
+
+    def setUp(self):
+        super(Word0106FindWordsPaging, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.words = [self.lex.create_word(self.fred, self.like, self.apple, n) for n in range(10)]
+
+    def idns(self, words):
+        return [w.idn for w in words]
+
+    def find_likes(self, **kwargs):
+        return self.lex.find_words(sbj=self.fred, vrb=self.like, **kwargs)
+
+    def test_limit(self):
+        self.assertEqual(self.idns(self.words[:3]), self.idns(self.find_likes(limit=3)))
+        self.assertEqual([], self.find_likes(limit=0))
+        self.assertEqual(self.idns(self.words), self.idns(self.find_likes(limit=99)))
+
+    def test_limit_descending(self):
+        self.assertEqual(
+            self.idns(self.words[:-4:-1]),
+            self.idns(self.find_likes(limit=3, idn_ascending=False))
+        )
+
+    def test_offset(self):
+        self.assertEqual(self.idns(self.words[4:6]), self.idns(self.find_likes(limit=2, offset=4)))
+        self.assertEqual(self.idns(self.words[7:]), self.idns(self.find_likes(offset=7)))
+
+    def test_after_before_idn(self):
+        w = self.words
+        self.assertEqual(self.idns(w[4:]), self.idns(self.find_likes(after_idn=w[3].idn)))
+        self.assertEqual(self.idns(w[:3]), self.idns(self.find_likes(before_idn=w[3])))
+        self.assertEqual(self.idns(w[3:5]), self.idns(self.find_likes(after_idn=w[2], before_idn=w[5])))
+        self.assertEqual([], self.find_likes(after_idn=w[-1]))
+
+    def test_newest_after(self):
+        w = self.words
+        self.assertEqual(
+            self.idns([w[9], w[8]]),
+            self.idns(self.find_likes(after_idn=w[5], idn_ascending=False, limit=2))
+        )
+
+    def test_keyset_pages(self):
+        pages = []
+        after_idn = None
+        while True:
+            page = self.find_likes(after_idn=after_idn, limit=4)
+            if not page:
+                break
+            pages.append(self.idns(page))
+            after_idn = page[-1].idn
+        self.assertEqual([4, 4, 2], [len(page) for page in pages])
+        self.assertEqual(self.idns(self.words), sum(pages, []))
+
+    def test_limit_counts_words_not_jbo(self):
+        bob = self.lex.define('agent', 'bob')
+        for _ in range(3):
+            self.lex.create_word(bob, self.like, self.words[1])
+        self.lex.create_word(bob, self.like, self.words[3])
+        found = self.find_likes(jbo_vrb=[self.like], limit=2)
+        self.assertEqual(self.idns(self.words[:2]), self.idns(found))
+        self.assertEqual(3, len(found[1].jbo))
+
+    def test_limit_jbo_strictly(self):
+        bob = self.lex.define('agent', 'bob')
+        self.lex.create_word(bob, self.like, self.words[1])
+        self.lex.create_word(bob, self.like, self.words[3])
+        self.lex.create_word(bob, self.like, self.words[5])
+        found = self.find_likes(jbo_vrb=[self.like], jbo_strictly=True, limit=2, offset=1)
+        self.assertEqual(self.idns([self.words[3], self.words[5]]), self.idns(found))
+
+    def test_find_last_reads_one_word(self):
+        finds = self.count_calls('find_words')
+        self.assertEqual(self.words[-1].idn, self.lex.find_last(sbj=self.fred, vrb=self.like).idn)
+        self.assertEqual(1, sum(len(words) for _, _, words in finds))
+
+
+class Word0107IterWords(WordTests):
+
+    def setUp(self):
+        super(Word0107IterWords, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.words = [self.lex.create_word(self.fred, self.like, self.apple, n) for n in range(10)]
+        self.finds = self.count_calls('find_words')
+
+    def idns(self, words):
+        return [w.idn for w in words]
+
+    def test_batches(self):
+        iterator = self.lex.iter_words(batch_size=4, sbj=self.fred, vrb=self.like)
+        self.assertEqual(0, len(self.finds))
+        self.assertEqual(self.words[0].idn, next(iterator).idn)
+        self.assertEqual(1, len(self.finds))
+        self.assertEqual(self.idns(self.words[1:]), self.idns(iterator))
+        self.assertEqual(3, len(self.finds))
+
+    def test_descending(self):
+        words = self.lex.iter_words(batch_size=3, sbj=self.fred, vrb=self.like, idn_ascending=False)
+        self.assertEqual(self.idns(self.words[::-1]), self.idns(words))
+
+    def test_exact_batches(self):
+        words = list(self.lex.iter_words(batch_size=5, sbj=self.fred, vrb=self.like))
+        self.assertEqual(self.idns(self.words), self.idns(words))
+        self.assertEqual(3, len(self.finds))
+
+    def test_idn_range(self):
+        words = self.lex.iter_words(
+            batch_size=2,
+            sbj=self.fred,
+            after_idn=self.words[2],
+            before_idn=self.words[8],
+        )
+        self.assertEqual(self.idns(self.words[3:8]), self.idns(words))
+
+    def test_jbo_stays_with_its_word(self):
+        bob = self.lex.define('agent', 'bob')
+        for _ in range(5):
+            self.lex.create_word(bob, self.like, self.words[1])
+        words = list(self.lex.iter_words(batch_size=2, sbj=self.fred, vrb=self.like, jbo_vrb=[self.like]))
+        self.assertEqual(self.idns(self.words), self.idns(words))
+        self.assertEqual([0, 5, 0], [len(w.jbo) for w in words[:3]])
+
+
+class Word0108FindWordsRanges(WordTests):
+
+    def setUp(self):
+        super(Word0108FindWordsRanges, self).setUp()
+        self.lex.whn_clock.unique = True
+        self.fred = self.lex.define('agent', 'fred')
+        self.rate = self.lex.verb('rate')
+        self.apple = self.lex.noun('apple')
+        self.words = [self.lex.create_word(self.fred, self.rate, self.apple, n) for n in (3, 7, 5, 9, 1)]
+
+    def tearDown(self):
+        self.lex.whn_clock.unique = False
+        super(Word0108FindWordsRanges, self).tearDown()
+
+    def nums(self, words):
+        return [int(w.num) for w in words]
+
+    def find_rates(self, **kwargs):
+        return self.lex.find_words(vrb=self.rate, **kwargs)
+
+    def test_num_min_max(self):
+        self.assertEqual([7, 5, 9], self.nums(self.find_rates(num_min=5)))
+        self.assertEqual([3, 5, 1], self.nums(self.find_rates(num_max=5)))
+        self.assertEqual([7, 5], self.nums(self.find_rates(num_min=5, num_max=qiki.Number(8))))
+        self.assertEqual([], self.find_rates(num_min=10))
+
+    def test_idn_range(self):
+        w = self.words
+        self.assertEqual([7, 5, 9], self.nums(self.find_rates(idn_range=(w[1], w[3].idn))))
+        self.assertEqual([9, 1], self.nums(self.find_rates(idn_range=(w[3], None))))
+        self.assertEqual([3, 7], self.nums(self.find_rates(idn_range=(None, w[1]))))
+
+    def test_whn(self):
+        whn_middle = self.words[2].whn
+        later = self.lex.create_word(self.fred, self.rate, self.apple, 11)
+        self.assertGreater(later.whn, whn_middle)
+        self.assertEqual([9, 1, 11], self.nums(self.find_rates(whn_after=whn_middle)))
+        self.assertEqual([3, 7], self.nums(self.find_rates(whn_before=whn_middle)))
+        self.assertEqual([], self.find_rates(whn_after=later.whn))
+        self.assertEqual([3, 7, 5, 9, 1, 11], self.nums(self.find_rates(whn_after=float(whn_middle) - 3600)))
+        self.assertEqual([], self.find_rates(whn_before=float(whn_middle) - 3600))
+        self.assertEqual(
+            [3, 7, 5, 9, 1],
+            self.nums(self.find_rates(whn_before=later.whn, num_min=1))
+        )
+
+    def test_rated_highly_lately(self):
+        found = self.find_rates(num_min=5, whn_after=time.time() - 3600, idn_ascending=False, limit=2)
+        self.assertEqual([9, 5], self.nums(found))
+
+
+class Word0109Aggregate(WordTests):
+
+    def setUp(self):
+        super(Word0109Aggregate, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.bob = self.lex.define('agent', 'bob')
+        self.rate = self.lex.verb('rate')
+        self.apple = self.lex.noun('apple')
+        self.berry = self.lex.noun('berry')
+        self.lex.create_word(self.fred, self.rate, self.apple, 3)
+        self.lex.create_word(self.fred, self.rate, self.apple, 5)   # fred changed his mind
+        self.lex.create_word(self.bob,  self.rate, self.apple, 4)
+        self.lex.create_word(self.bob,  self.rate, self.berry, 1.5)
+
+    def test_count_and_sum(self):
+        self.assertEqual([
+            dict(obj=self.apple.idn, count=3, sum_num=qiki.Number(12)),
+            dict(obj=self.berry.idn, count=1, sum_num=qiki.Number(1.5)),
+        ], self.lex.aggregate(vrb=self.rate, measures=('count', 'sum_num')))
+
+    def test_latest_per_sbj(self):
+        tallies = self.lex.aggregate(vrb=self.rate, measures=('count_sbj', 'latest_per_sbj'))
+        self.assertEqual([
+            dict(obj=self.apple.idn, count_sbj=2, latest_per_sbj=qiki.Number(9)),
+            dict(obj=self.berry.idn, count_sbj=1, latest_per_sbj=qiki.Number(1.5)),
+        ], tallies)
+
+    def test_min_max(self):
+        self.assertEqual([
+            dict(sbj=self.fred.idn, min_num=qiki.Number(3), max_num=qiki.Number(5)),
+            dict(sbj=self.bob.idn, min_num=qiki.Number(1.5), max_num=qiki.Number(4)),
+        ], self.lex.aggregate(vrb=self.rate, group_by='sbj', measures=('min_num', 'max_num')))
+
+    def test_top_n(self):
+        self.assertEqual(
+            [dict(obj=self.apple.idn, sum_num=qiki.Number(12))],
+            self.lex.aggregate(vrb=self.rate, measures='sum_num', order_by='sum_num', limit=1)
+        )
+        self.assertEqual(
+            [self.berry.idn, self.apple.idn],
+            [t['obj'] for t in self.lex.aggregate(vrb=self.rate, num_max=2, measures=('count',))]
+            + [t['obj'] for t in self.lex.aggregate(vrb=self.rate, num_min=2, measures=('count',))]
+        )
+
+    def test_top_n_by_count_with_sums(self):
+        self.lex.create_word(self.fred, self.rate, self.berry, 2)
+        self.assertEqual(
+            [dict(obj=self.apple.idn, count=3, sum_num=qiki.Number(12), latest_per_sbj=qiki.Number(9))],
+            self.lex.aggregate(
+                vrb=self.rate,
+                measures=('count', 'sum_num', 'latest_per_sbj'),
+                order_by='count',
+                limit=1,
+            )
+        )
+        self.assertEqual(
+            [dict(obj=self.apple.idn, count_sbj=2), dict(obj=self.berry.idn, count_sbj=2)],
+            self.lex.aggregate(vrb=self.rate, measures='count_sbj', order_by='count_sbj', limit=5)
+        )
+
+    def test_no_group(self):
+        self.assertEqual(
+            [dict(count=4, latest_per_sbj=qiki.Number(5 + 1.5))],
+            self.lex.aggregate(vrb=self.rate, group_by=None, measures=('count', 'latest_per_sbj'))
+        )
+        self.assertEqual([], self.lex.aggregate(vrb=self.rate, num_min=99, group_by=None))
+
+    def test_bad_measure(self):
+        with self.assertRaises(qiki.LexSentence.AggregateError):
+            self.lex.aggregate(vrb=self.rate, measures=('average',))
+        with self.assertRaises(qiki.LexSentence.AggregateError):
+            self.lex.aggregate(vrb=self.rate, measures=('count',), order_by='sum_num')
+        with self.assertRaises(qiki.LexSentence.AggregateError):
+            self.lex.aggregate(vrb=self.rate, group_by='txt')
+
+
+@unittest.skipIf(asyncio is None, "AsyncLex needs asyncio")
+class Word0110AsyncLex(WordTests):
+
+    def setUp(self):
+        super(Word0110AsyncLex, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.alex = qiki.AsyncLex(self.lex, max_workers=3, loop=self.loop)
+
+        def cleanup():
+            self.alex.close()
+            asyncio.set_event_loop(None)
+            self.loop.close()
+
+        self.addCleanup(cleanup)
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def test_read_word(self):
+        word = self.run_async(self.alex.read_word('apple'))
+        self.assertEqual(self.apple.idn, word.idn)
+        self.assertFalse(word._is_inchoate)
+        self.assertEqual(self.fred, self.run_async(self.alex.read_word(self.fred.idn)))
+
+    def test_create_and_find(self):
+        word = self.run_async(self.alex.create_word(self.fred, self.like, self.apple, 42))
+        self.assertEqual(42, word.num)
+        found = self.run_async(self.alex.find_words(sbj=self.fred, vrb=self.like))
+        self.assertEqual([word.idn], [w.idn for w in found])
+        self.assertEqual(word.idn, self.run_async(self.alex.find_last(vrb=self.like)).idn)
+
+    def test_many_in_flight(self):
+        self.run_async(self.alex.create_words([(self.fred, self.like, self.apple, n) for n in range(5)]))
+        words, tallies, agent = self.run_async(asyncio.gather(
+            self.alex.find_words(vrb=self.like),
+            self.alex.aggregate(vrb=self.like, measures=('count',)),
+            self.alex.read_word('agent'),
+        ))
+        self.assertEqual(5, len(words))
+        self.assertEqual([dict(obj=self.apple.idn, count=5)], tallies)
+        self.assertEqual('agent', agent.txt)
+
+    def test_iter_words(self):
+        self.run_async(self.alex.create_words([(self.fred, self.like, self.apple, n) for n in range(5)]))
+        words = self.alex.iter_words(batch_size=2, vrb=self.like)
+        nums = []
+        while True:
+            try:
+                word = self.run_async(words.__anext__())
+            except StopAsyncIteration:
+                break
+            nums.append(int(word.num))
+        self.assertEqual([0, 1, 2, 3, 4], nums)
+
+    def test_error(self):
+        with self.assertRaises(qiki.LexSentence.NotFound):
+            self.run_async(self.alex.find_last(vrb=self.apple))
+
+    def test_async_for_with_reads_in_flight(self):
+        self.lex.create_words([(self.fred, self.like, self.apple, n) for n in range(5)])
+        alex = qiki.AsyncLex(self.lex, max_workers=3)   # no loop, so it uses the running one
+        self.addCleanup(alex.close)
+        # noinspection PyUnresolvedReferences
+        words, apple, agent, like = self.run_async(
+            iterate_while_reading(alex, self.like, ['apple', 'agent', self.like.idn])
+        )
+        self.assertEqual([0, 1, 2, 3, 4], [int(w.num) for w in words])
+        self.assertEqual(self.apple.idn, apple.idn)
+        self.assertEqual('agent', agent.txt)
+        self.assertEqual('like', like.txt)
+
+    def test_no_running_loop(self):
+        alex = qiki.AsyncLex(self.lex)
+        self.addCleanup(alex.close)
+        with self.assertRaises(RuntimeError):
+            alex.read_word('agent')
+
+
+class Word0111OneConnection(WordTests):
+
+    def __init__(self, *args, **kwargs):
+        super(Word0111OneConnection, self).__init__(*args, **kwargs)
+        self.only_sql_flavors()
+
+    def setUp(self):
+        super(Word0111OneConnection, self).setUp()
+        self.fred = self.lex.define('agent', 'fred')
+        self.like = self.lex.verb('like')
+        self.apple = self.lex.noun('apple')
+
+    def borrows(self):
+        return self.lex.pool_stats()['n_borrows']
+
+    def test_create_word_one_connection(self):
+        borrows_before = self.borrows()
+        self.lex.create_word(self.fred, self.like, self.apple)
+        self.assertEqual(borrows_before + 1, self.borrows())
+
+    def test_num_add_one_connection(self):
+        self.lex.create_word(self.fred, self.like, self.apple, 10)
+        borrows_before = self.borrows()
+        word = self.lex.create_word(self.fred, self.like, self.apple, num_add=5)
+        self.assertEqual(borrows_before + 1, self.borrows())
+        self.assertEqual(qiki.Number(15), word.num)
+
+    def test_read_leaves_no_transaction(self):
+        with self.lex._connected() as connection:
+            self.assertEqual(self.apple.idn, self.lex.max_idn())
+            self.assertFalse(connection.in_transaction)
+
+
 def py23(if2, if3_or_greater):
     """
     Python-2-specific value.  Versus Python-3-or-later-specific value.
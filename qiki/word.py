@@ -7,8 +7,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import binascii
+import bisect
+import collections
+import contextlib
 import datetime
+import hashlib
+import itertools
+import math
+import os
 import re
+import struct
+import sys
 import threading
 import time
 
@@ -148,16 +158,22 @@ class Word(object):
     def set_idn_if_you_really_have_to(self, idn):
         self._idn = idn
 
-    def _choate(self):
+    def _choate(self, why='_choate()'):
         """
         Transform an inchoate word into a not-inchoate word.
 
         That is, from a mere container of an idn to a fleshed-out word
         with num and txt whatever other properties it has.
         This in preparation to use one of its properties, sbj, vrb, obj, txt, num, whn.
+
+        :param why: what needed the word choate, e.g. 'sbj' or 'exists()', for ChoateTracer
         """
         if self._is_inchoate:
-            self._from_idn(self._idn)
+            if self.lex.choate_tracer is None:
+                self._from_idn(self._idn)
+            else:
+                with self.lex.choate_tracer.choating(why):
+                    self._from_idn(self._idn)
 
             # assert not self._is_inchoate
             # TODO:  Why the f does asserting that break everything?
@@ -179,7 +195,7 @@ class Word(object):
         A choate word can be nonexistent just before a .save()
         """
         # TODO:  What about Listing words?
-        self._choate()
+        self._choate('exists()')
         return hasattr(self, '_exists') and self._exists   # WTF is not hasattr() enough?
 
     def _now_it_exists(self):
@@ -208,8 +224,12 @@ class Word(object):
     def num(self):
         return self._get_field('num')
 
+    _txt_batch = None   # words from a find_words(lazy_txt=True), still lacking their txt
+
     @property
     def txt(self):
+        if self._txt_batch is not None:
+            self.lex.populate_txts(self._txt_batch)
         return self._get_field('txt')
 
     @property
@@ -221,11 +241,11 @@ class Word(object):
         self._set_field('whn', new_whn)
 
     def _set_field(self, field_name, new_value):
-        self._choate()
+        self._choate(field_name)
         self._fields[field_name] = new_value
 
     def _get_field(self, field_name):
-        self._choate()
+        self._choate(field_name)
         try:
             return self._fields[field_name]
         except KeyError:
@@ -419,6 +439,37 @@ class Word(object):
         """
         return self.lex[self.idn]
 
+    _found_with = None   # the words found together with this one, by find_words()
+    _related = None      # (field, vrbs) -> words, filled by LexSentence.populate_related()
+    _related_as_of = None   # lex._n_inserted_words when _related was filled
+
+    def find_jbo(self, vrb=None):
+        """
+        Words whose object is this word, optionally restricted to some verbs.  Chronological.
+
+        Unlike the jbo attribute from find_words(jbo_vrb), this is loaded on demand,
+        and for all the words found together with this one, in one go.
+        So looping through a result set and calling find_jbo() on each word is not N+1 queries.
+        The result is found again after this lex inserts any word.
+        Words inserted by other processes may not show up until then.
+        """
+        return self._find_related('obj', vrb)
+
+    def find_jbs(self, vrb=None):
+        """Words whose subject is this word, optionally restricted to some verbs.  See find_jbo()"""
+        return self._find_related('sbj', vrb)
+
+    def _find_related(self, field, vrb):
+        key = (field, self.lex.vrbs_ify(vrb))
+        if (
+            self._related is None or
+            self._related_as_of != self.lex._n_inserted_words or
+            key not in self._related
+        ):
+            found_with = [self] if self._found_with is None else self._found_with
+            self.lex.populate_related(found_with, *key)
+        return self._related[key]
+
     def populate_from_word(self, word):
         word_dict = dict(
             idn=word.idn,
@@ -432,25 +483,38 @@ class Word(object):
         self.populate_from_row(word_dict)
 
     def populate_from_row(self, row, prefix=''):
-        assert isinstance(row[prefix + 'idn'], Number)
-        assert isinstance(row[prefix + 'sbj'], Number), type_name(row[prefix + 'sbj'])
-        assert isinstance(row[prefix + 'vrb'], Number)
-        assert isinstance(row[prefix + 'obj'], Number)
-        assert isinstance(row[prefix + 'num'], Number)
-        assert isinstance(row[prefix + 'txt'], Text)
-        assert isinstance(row[prefix + 'whn'], Number)
-        self.set_idn_if_you_really_have_to(row[prefix + 'idn'])
+        self.populate_from_fields(
+            row[prefix + 'idn'],
+            row[prefix + 'sbj'],
+            row[prefix + 'vrb'],
+            row[prefix + 'obj'],
+            row[prefix + 'num'],
+            row[prefix + 'whn'],
+            row.get(prefix + 'txt', None),   # No txt if lazy_txt
+        )
+
+    def populate_from_fields(self, idn, sbj, vrb, obj, num, whn, txt=None):
+        """Like populate_from_row() but from the values themselves, e.g. a tuple row.  txt=None if lazy."""
+        assert isinstance(idn, Number)
+        assert isinstance(sbj, Number), type_name(sbj)
+        assert isinstance(vrb, Number)
+        assert isinstance(obj, Number)
+        assert isinstance(num, Number)
+        assert isinstance(txt, (Text, type(None)))
+        assert isinstance(whn, Number)
+        self.set_idn_if_you_really_have_to(idn)
         self._now_it_exists()
         # NOTE:  Is this comment on the _now_it_exists() call obsolete?
         #        Must come before spawn(sbj) for lex's sake.
         self._fields = dict(
-            sbj=self.lex[row[prefix + 'sbj']],
-            vrb=self.lex[row[prefix + 'vrb']],
-            obj=self.lex[row[prefix + 'obj']],
-            num=row[prefix + 'num'],
-            txt=row[prefix + 'txt'],
-            whn=row[prefix + 'whn'],
+            sbj=self.lex[sbj],
+            vrb=self.lex[vrb],
+            obj=self.lex[obj],
+            num=num,
+            whn=whn,
         )
+        if txt is not None:
+            self._fields['txt'] = txt
 
     def populate_from_num_txt(self, num, txt):
         assert isinstance(txt, Text), "Need Text, not a {t}: `{r}'".format(
@@ -470,6 +534,8 @@ class Word(object):
             return True
         if recursion <= 0:
             return False
+        if isinstance(self.lex, LexSentence):
+            return self.lex.is_ancestor(word, self, recursion=recursion)
         if not self.exists():
             return False
         if not hasattr(self, 'vrb'):
@@ -570,8 +636,53 @@ class Word(object):
         del d['whn']   # TODO:  Do we want whn fields in JSON or not?!?
         return d
 
+    RECORD_NUMBERS = ('idn', 'sbj', 'vrb', 'obj', 'num', 'whn')
+
+    def to_record(self):
+        """
+        All 7 properties of a word as a compact binary record.
+
+        Each Number in RECORD_NUMBERS order is a 2-byte big-endian length then its raw bytes.
+        Then the txt is a 4-byte big-endian length then its UTF-8 bytes.
+        Read it back with LexSentence.words_from_records().
+        """
+        numbers = (self.idn, self.sbj.idn, self.vrb.idn, self.obj.idn, self.num, self.whn)
+        txt_utf8 = self.txt.utf8()
+        return b''.join(
+            struct.pack('>H', len(number.raw)) + number.raw for number in numbers
+        ) + struct.pack('>I', len(txt_utf8)) + txt_utf8
+
+    # NOTE:  One cache per process, shared by all threads and all lexes.
+    #        Least recently used presentations go first when it's full.
+    _presentable_cache = collections.OrderedDict()   # num.raw -> presentable string
+    _presentable_lock = threading.Lock()
+    PRESENTABLE_CACHE_MAX = 1000
+
+    @classmethod
+    def presentable(cls, num):
+        with cls._presentable_lock:
+            try:
+                presentation = cls._presentable_cache.pop(num.raw)
+            except KeyError:
+                presentation = cls._presentable(num)
+                while len(cls._presentable_cache) >= cls.PRESENTABLE_CACHE_MAX:
+                    cls._presentable_cache.popitem(last=False)
+            cls._presentable_cache[num.raw] = presentation
+            return presentation
+
+    _time_lex = None   # shared by all words, for .format(word) with 'w'
+    _time_lex_lock = threading.Lock()
+
+    @staticmethod
+    def _shared_time_lex():
+        """The TimeLex that renders whn, made once per process."""
+        with Word._time_lex_lock:
+            if Word._time_lex is None:
+                Word._time_lex = TimeLex()
+            return Word._time_lex
+
     @staticmethod
-    def presentable(num):
+    def _presentable(num):
         if num.is_suffixed() or not num.is_reasonable():
             return num.qstring()
         try:
@@ -599,7 +710,7 @@ class Word(object):
             elif c == 'o':  yield "obj={}".format(str(self.obj))
             elif c == 't':  yield "txt='{}'".format(str(self.txt))
             elif c == 'n':  yield "num={}".format(self.presentable(self.num))
-            elif c == 'w':  yield "whn={}".format(str(TimeLex()[self.whn].txt))
+            elif c == 'w':  yield "whn={}".format(str(self._shared_time_lex()[self.whn].txt))
             else:
                 raise ValueError("'{}' unknown in .format(word)".format(c))
 
@@ -899,6 +1010,86 @@ class SubjectedVerb(object):
             raise type_failure()
 
 
+class SentenceTemplate(object):
+    """
+    A subject and verb, resolved once, for saying the same kind of sentence over and over.
+
+    This is the fast lane next to the bracket syntax lex[s](v)[o] = n,t
+    Made by LexSentence.sentence().  The sbj and vrb are looked up (by idn or name) only once.
+    Each say() skips the argument sniffing of SubjectedVerb and the checks of create_word().
+
+        like = lex.sentence(lex['fred'], 'like')
+        like.say(lex['apple'], 10, "so crisp")
+        like.say_many([(apple, 10), (banana, -1, "too mushy")])
+    """
+    def __init__(self, lex, sbj, vrb):
+        self.lex = lex
+        self.sbj = self._resolve(sbj)
+        self.vrb = self._resolve(vrb)
+
+    def _resolve(self, sbj_vrb_or_obj):
+        word = self.lex.root_lex[sbj_vrb_or_obj]
+        if not word.exists():
+            raise self.lex.NotFound("Cannot say a sentence with {word}".format(
+                word=repr(sbj_vrb_or_obj),
+            ))
+        return word
+
+    def _resolve_obj(self, obj):
+        """
+        The object of a sentence.
+
+        A word or idn is taken as it is, without reading it, as create_word() does.
+        A name is looked up, see LexSentence.preload_definitions().
+        """
+        if isinstance(obj, (Word, Number)):
+            return self.lex.root_lex[obj]
+        else:
+            return self._resolve(obj)
+
+    def say(self, obj, num=1, txt=''):
+        """Create a new sentence sbj-vrb-obj, with num and txt."""
+        return self._say(self._resolve_obj(obj), num, txt)
+
+    def say_many(self, sentences):
+        """
+        Create many sentences, in order.  Each object is resolved once however often it recurs.
+        They are inserted together.  See LexSentence.insert_next_words()
+
+        :param sentences: iterable of (obj, num, txt) or (obj, num) or (obj,) tuples
+        :return: list of the new words
+        """
+        objs = dict()
+        new_words = []
+        for sentence in sentences:
+            obj = sentence[0]
+            obj_key = obj.idn if isinstance(obj, Word) else obj
+            try:
+                objected = objs[obj_key]
+            except KeyError:
+                objected = objs[obj_key] = self._resolve_obj(obj)
+            new_words.append(self._new_word(objected, *sentence[1:]))
+        self.lex.insert_next_words(new_words)
+        return new_words
+
+    def _say(self, objected, num=1, txt=''):
+        new_word = self._new_word(objected, num, txt)
+        self.lex.insert_next_word(new_word)
+        return new_word
+
+    def _new_word(self, objected, num=1, txt=''):
+        new_word = self.lex.word_class(None)
+        # noinspection PyProtectedMember
+        new_word._fields.update(
+            sbj=self.sbj,
+            vrb=self.vrb,
+            obj=objected,
+            num=num if isinstance(num, Number) else Number(num),
+            txt=txt if isinstance(txt, Text) else Text(txt),
+        )
+        return new_word
+
+
 class Lex(object):
     """
     Collection of Number-identified Words.
@@ -961,6 +1152,25 @@ class Lex(object):
     class LexMetaError(TypeError):
         """Something is wrong with Lex meta words, e.g. two sub-lexes use the same meta word."""
 
+    choate_tracer = None
+
+    def trace_choates(self, stack_depth=3):
+        """
+        Start recording where words in this lex become choate, e.g. to find N+1 queries.
+
+        EXAMPLE:
+            with lex.trace_choates() as tracer:
+                render_the_page()
+            print(tracer.report())
+
+        :return: a ChoateTracer
+        """
+        self.choate_tracer = ChoateTracer(self, stack_depth=stack_depth)
+        return self.choate_tracer
+
+    def untrace_choates(self):
+        self.choate_tracer = None
+
     def __repr__(self):
         """
         EXAMPLE:  GoogleQikiListing Word('google user')
@@ -1456,15 +1666,44 @@ class LexSentence(Lex):
     # TODO:  class WordForLexSentence base class, ala WordListed for Listing.
 
     def populate_word_from_idn(self, word, idn):
-        raise NotImplementedError
+        if self._write_behind is not None:
+            pending_word = self._write_behind.pending_word(idn)
+            if pending_word is not None:
+                word.populate_from_word(pending_word)
+                return True
+        if self._membership is not None and not self._membership.might_have_idn(idn):
+            return False
+        return self._populate_word_from_idn(word, idn)
+
+    def _populate_word_from_idn(self, word, idn):
+        raise NotImplementedError()
 
     def __init__(self, **kwargs):
         super(LexSentence, self).__init__(**kwargs)
+        self._membership = None
+        self._write_behind = None
+        if self.whn_clock is None:
+            self.whn_clock = WhnClock()
         self._lex = None
         self._noun = None
         self._verb = None
         self._define = None
         self._duplicate_definition_callback_functions = []
+        self._definition_ancestry = dict()   # idn.raw -> (tuple, frozenset) of ancestor raws
+        self._definitions = dict()           # txt -> earliest definition word, with that txt
+        self._definitions_complete = False   # True if every definition is in _definitions
+        self._n_inserted_words = 0           # so words know their find_jbo() results are stale
+
+    def _forget_cached_words(self):
+        """
+        Empty the caches of words in this lex.
+
+        Words never change once they exist, so caches only go stale when the lex is reinstalled.
+        """
+        self._definition_ancestry.clear()
+        self._definitions.clear()
+        self._definitions_complete = False
+        self._n_inserted_words += 1
 
     def duplicate_definition_notify(self, f):
         # XXX:  Sure is a drastic, totalitarian solution.
@@ -1550,14 +1789,114 @@ class LexSentence(Lex):
         raise NotImplementedError()
 
     def populate_word_from_definition(self, word, define_txt):
+        """
+        Flesh out a word by its txt.  sbj=lex, vrb=define only.
+
+        The earliest definition wins, so once a name is found it never changes.
+        That makes name resolution (e.g. lex['like']) a dictionary lookup after the first time.
+        """
+        define_txt = Text(define_txt)
+        try:
+            definition = self._definitions[define_txt]
+        except KeyError:
+            if self._definitions_complete:
+                return False
+            if self._membership is not None and not self._membership.might_have_name(define_txt):
+                return False
+            self.flush_behind()
+            if not self._populate_word_from_definition(word, define_txt):
+                return False
+            self._remember_definition(word)
+            return True
+        else:
+            word.populate_from_word(definition)
+            return True
+
+    def _populate_word_from_definition(self, word, define_txt):
+        """Flesh out a word by its txt, bypassing the cache of definitions."""
         raise NotImplementedError()
 
+    def _remember_definition(self, word):
+        """Cache a definition word.  Unless an earlier definition with the same txt is cached."""
+        if word.txt not in self._definitions:
+            definition = self[None]
+            definition.populate_from_word(word)
+            self._definitions[word.txt] = definition
+
+    def preload_definitions(self):
+        """
+        Cache all definitions (sbj=lex, vrb=define) in one query.
+
+        Suitable for startup.  Returns the number of different names.
+        """
+        for definition in self.find_words(sbj=self.IDN_LEX, vrb=self.IDN_DEFINE):
+            if definition.txt not in self._definitions:
+                self._definitions[definition.txt] = definition
+        return len(self._definitions)
+
     def populate_word_from_sbj_vrb_obj(self, word, sbj, vrb, obj):
+        """Flesh out a word by its sbj, vrb, obj.  The latest such word."""
+        if not self._might_have_sbj_vrb_obj(sbj, vrb, obj):
+            return False
+        self.flush_behind()
+        return self._populate_word_from_sbj_vrb_obj(word, sbj, vrb, obj)
+
+    def _populate_word_from_sbj_vrb_obj(self, word, sbj, vrb, obj):
         raise NotImplementedError()
 
     def populate_word_from_sbj_vrb_obj_num_txt(self, word, sbj, vrb, obj, num, txt):
+        """Flesh out a word by its sbj, vrb, obj, num, txt.  The latest such word."""
+        if not self._might_have_sbj_vrb_obj(sbj, vrb, obj):
+            return False
+        self.flush_behind()
+        return self._populate_word_from_sbj_vrb_obj_num_txt(word, sbj, vrb, obj, num, txt)
+
+    def _populate_word_from_sbj_vrb_obj_num_txt(self, word, sbj, vrb, obj, num, txt):
         raise NotImplementedError()
 
+    def _might_have_sbj_vrb_obj(self, sbj, vrb, obj):
+        if self._membership is None:
+            return True
+        return self._membership.might_have_sbj_vrb_obj(
+            self.idn_ify(sbj),
+            self.idn_ify(vrb),
+            self.idn_ify(obj),
+        )
+
+    def use_membership_filter(self, capacity=None, error_rate=0.001):
+        """
+        Answer definite misses locally, with a Bloom filter of idns, names, and s,v,o triples.
+
+        Reads every word in the lex, once.  Then inserts keep the filter current.
+        Afterward, looking up a word that does not exist usually costs no query:
+            lex[idn].exists()
+            lex['name']
+            lex.create_word(..., use_already=True)
+
+        CAUTION:  Only inserts by THIS lex instance are added to the filter.
+                  So words inserted by other processes or lex instances may seem not to exist.
+
+        :param capacity: - expected number of words, default is twice the current number
+        :param error_rate: - false-positive rate to expect when there are capacity words
+        :return: the MembershipFilter, e.g. lex.use_membership_filter().false_positive_rate()
+        """
+        words = self.find_words()
+        if capacity is None:
+            capacity = max(2 * len(words), 1000)
+        membership = MembershipFilter(capacity=capacity, error_rate=error_rate)
+        for word in words:
+            membership.add_word(word, is_definition=self._is_definition(word))
+        self._membership = membership
+        return membership
+
+    @property
+    def membership_filter(self):
+        """The MembershipFilter from use_membership_filter(), or None."""
+        return self._membership
+
+    def _is_definition(self, word):
+        return word.sbj.idn == self.IDN_LEX and word.vrb.idn == self.IDN_DEFINE
+
     def noun(self, name=None):
         if name is None:
             return self._noun
@@ -1617,7 +1956,87 @@ class LexSentence(Lex):
                                 )
                             )
                 return old_definition
-        return self.create_word(sbj=sbj, vrb=vrb, obj=obj, txt=txt)
+        new_definition = self.create_word(sbj=sbj, vrb=vrb, obj=obj, txt=txt)
+        self._remember_definition(new_definition)
+        return new_definition
+
+    def is_ancestor(self, ancestor, word, recursion=10):
+        """
+        Is the ancestor in the chain of define sentences leading up from word?
+
+        Same answer as Word.is_a(reflexive=False) with the same recursion limit.
+        But after the first time, a set-membership test instead of a walk through the lex.
+        """
+        chain, ancestors = self._ancestry(word)
+        if len(chain) <= recursion:
+            return ancestor.idn.raw in ancestors
+        else:
+            return ancestor.idn.raw in chain[0:recursion]
+
+    def definition_ancestors(self, word):
+        """
+        The words a word was defined as, nearest first.
+
+        EXAMPLE:  fuji = lex.define('apple', 'fuji')
+                  assert [apple, noun, noun] == lex.definition_ancestors(fuji)
+                  (noun is defined as a noun, so the chain ends there)
+        """
+        chain, _ = self._ancestry(word)
+        return [self[Number.from_raw(raw)] for raw in chain]
+
+    def _ancestry(self, word):
+        """
+        Transitive closure of a word's define sentences.  Cached by idn.
+
+        A word that exists never changes, so neither do its ancestors.
+        Only a complete chain is cached.  A chain is incomplete if some ancestor
+        does not exist yet.  (e.g. lex is defined as an agent before agent is defined.)
+
+        :return: (tuple, frozenset) of the raw idns of ancestors
+        """
+        raw = word.idn.raw
+        try:
+            return self._definition_ancestry[raw]
+        except KeyError:
+            pass
+
+        chain = []
+        seen = {raw}
+        is_complete = True
+        current = word
+        while True:
+            if current is not word:
+                try:
+                    chain.extend(self._definition_ancestry[current.idn.raw][0])
+                    break
+                except KeyError:
+                    pass
+            if not current.exists():
+                is_complete = False
+                break
+            if current.vrb is None or current.vrb.idn != self.IDN_DEFINE:
+                break
+            parent_raw = current.obj.idn.raw
+            chain.append(parent_raw)
+            if parent_raw in seen:
+                break   # e.g. noun is defined as a noun
+            seen.add(parent_raw)
+            current = self[current.obj]
+
+        ancestry = tuple(chain), frozenset(chain)
+        if is_complete:
+            self._definition_ancestry[raw] = ancestry
+        return ancestry
+
+    def _note_inserted_word(self, word):
+        """A word was just inserted.  Keep the caches current."""
+        self._n_inserted_words += 1
+        if word.vrb.idn == self.IDN_DEFINE:
+            self._ancestry(word)
+            if self._definitions_complete and word.sbj.idn == self.IDN_LEX:
+                self._remember_definition(word)
+        if self._membership is not None:
+            self._membership.add_word(word, is_definition=self._is_definition(word))
 
     def find_words(self, **kwargs):
         raise NotImplementedError()
@@ -1640,13 +2059,44 @@ class LexSentence(Lex):
         Or the derived class may override the instance method _lock_next_word(),
         so that each instance of that class has its own lock.
         This might make sense if a single instance could be shared by multiple threads.
-        Wouldn't work with LexMySQL because apparently one mysql.connector.connect()
-        object cannot be shared by multiple threads.
+        (A LexMySQL instance can be, each thread borrows a connection from its pool.)
 
         By default all instances of all derived classes use the singleton LexSentence._global_lock
         (Only applies to instances running on the same host of course.)
+
+        With an idn_allocator, only this instance's allocator is locked.
+        That's enough for inserting.  Reading before inserting needs _lock_read_then_write().
+        """
+        if self.idn_allocator is None:
+            return self._global_lock
+        else:
+            return self.idn_allocator.lock
+
+    @contextlib.contextmanager
+    def _lock_sentence(self, sbj, vrb, obj):
+        """
+        Lock one sbj,vrb,obj across processes, for reading its latest word and then inserting.
+
+        Call inside with self._connected().  Nothing to lock by default,
+        there's no other process, and _lock_read_then_write() takes care of this one.
+        """
+        yield
+
+    @contextlib.contextmanager
+    def _lock_read_then_write(self):
         """
-        return self._global_lock
+        Lock for reading the latest sentence and then inserting one, e.g. num_add or use_already.
+
+        Always the process-global lock, even with an idn_allocator, so another lex instance
+        in this process can't insert the same sentence in between.
+        Plus the allocator's lock, for next_idn().
+        """
+        with self._global_lock:
+            if self.idn_allocator is None:
+                yield
+            else:
+                with self.idn_allocator.lock:
+                    yield
 
     def insert_next_word(self, word):
         # global max_idn_lock
@@ -1676,7 +2126,7 @@ class LexSentence(Lex):
         try:
             LexSentence.outer += 1
             droid("INSERT_A")
-            with self._lock_next_word():   # test_word.Word0080Threading.LexManipulated.cop1
+            with self._lock_next_word(), self._connected():   # test_word.Word0080Threading.LexManipulated.cop1
                 try:
                     LexSentence.inner += 1
                     droid("INSERT_B")
@@ -1686,7 +2136,10 @@ class LexSentence(Lex):
                     self._critical_moment_1()   # test_word.Word0080Threading.LexManipulated.cop3
                     word.set_idn_if_you_really_have_to(idn_of_new_word)
                     self._critical_moment_2()
-                    self.insert_word(word)
+                    if self._write_behind is None:
+                        self.insert_word(word)
+                    else:
+                        self._insert_behind([word])
                 finally:
                     droid("INSERT_C")
                     LexSentence.inner -= 1
@@ -1695,6 +2148,81 @@ class LexSentence(Lex):
             droid("INSERT_D")
             LexSentence.outer -= 1
         
+    def insert_next_words(self, words):
+        """Like insert_next_word() for many words, locking once, with a contiguous range of idns."""
+        if not words:
+            return
+        with self._lock_next_word(), self._connected():
+            self._start_transaction()
+            first_idn = self.next_idn(len(words))
+            for index, word in enumerate(words):
+                word.set_idn_if_you_really_have_to(first_idn + index)
+            if self._write_behind is None:
+                self.insert_words(words)
+            else:
+                self._insert_behind(words)
+
+    def insert_words(self, words):
+        """Insert words that have their idns.  Derived classes may do it in fewer queries."""
+        for word in words:
+            self.insert_word(word)
+
+    def _write_words(self, words):
+        """Store words that already have their idn and whn.  No caches are touched."""
+        raise NotImplementedError()
+
+    def use_write_behind(self, writer=None, batch_size=500, flush_seconds=1.0, max_queue=10000, max_tries=3):
+        """
+        Queue new words and store them in batches on a background thread.
+
+        Inserts return as soon as the word is queued.  A queued word can be read by its idn.
+        Other lookups (by sbj,vrb,obj, by definition, find_words()) flush the queue first.
+
+        EXAMPLE:
+            lex.use_write_behind(writer=LexMySQL(**credentials), batch_size=500)
+            ...
+            lex.stop_write_behind()
+
+        The writer is this lex (writer=None) or another instance on the same table.
+        The background thread borrows its own connection from a LexMySQL connection pool.
+
+        Idns come from an IdnBlockAllocator, one batch per block,
+        unless an idn allocator is already in use.  stop_write_behind() puts back the one before.
+        """
+        self._idn_allocator_before_write_behind = self.idn_allocator
+        if self.idn_allocator is None:
+            self.use_idn_allocator(IdnBlockAllocator(self, block_size=batch_size))
+        self._write_behind = WriteBehind(
+            self if writer is None else writer,
+            batch_size=batch_size,
+            flush_seconds=flush_seconds,
+            max_queue=max_queue,
+            max_tries=max_tries,
+        )
+        return self._write_behind
+
+    def stop_write_behind(self):
+        """Store everything queued, and go back to storing each word as it's inserted."""
+        if self._write_behind is not None:
+            with self._lock_next_word():
+                self._write_behind.close()
+                self._write_behind = None
+            self.use_idn_allocator(self._idn_allocator_before_write_behind)
+
+    def flush_behind(self):
+        """Store everything queued by use_write_behind(), if anything."""
+        if self._write_behind is not None:
+            self._write_behind.flush()
+
+    def _insert_behind(self, words):
+        """Like insert_words() but queue them instead.  Call with the _lock_next_word() lock held."""
+        for word, whn in zip(words, self.now_numbers(len(words))):
+            word.whn = whn
+            # noinspection PyProtectedMember
+            word._now_it_exists()
+            self._note_inserted_word(word)
+        self._write_behind.put(words)
+
     def _critical_moment_1(self):
         """For testing, hold up this step to raise a duplicate IDN error."""
 
@@ -1704,8 +2232,53 @@ class LexSentence(Lex):
     def _start_transaction(self):
         """Whatever needs to happen just before getting the next idn.  Do nothing by default."""
 
-    def next_idn(self):
-        return self.max_idn().inc()   # Crude reinvention of AUTO_INCREMENT
+    @contextlib.contextmanager
+    def _connected(self):
+        """
+        Hold one database connection for all the statements of a read-then-write operation.
+
+        So they can be in one transaction, see _start_transaction().  Nothing to hold by default.
+        """
+        yield None
+
+    idn_allocator = None   # None means next_idn() is MAX(idn) + 1 under the global lock
+
+    def use_idn_allocator(self, allocator):
+        """
+        Get new idns from an allocator instead of MAX(idn) + 1 under the process-global lock.
+
+        EXAMPLE:
+            lex.use_idn_allocator(IdnBlockAllocator(lex, block_size=100))
+
+        Every process that writes to this lex should then use an allocator.
+        Or None to go back to MAX(idn) + 1.
+
+        Idns from MAX(idn) + 1 inserts in the meantime are skipped:  the lex catches up its
+        reservations, see _catch_up_idns(), and an IdnBlockAllocator forgets its old block.
+        """
+        if allocator is not None:
+            self._catch_up_idns()
+            if isinstance(allocator, IdnBlockAllocator):
+                allocator.discard_block()
+        self.idn_allocator = allocator
+
+    def _catch_up_idns(self):
+        """Make reserve_idns() start after the highest idn, e.g. one inserted without an allocator."""
+
+    def next_idn(self, n=1):
+        """The first of n new contiguous idns.  Call with the _lock_next_word() lock held."""
+        if self.idn_allocator is None:
+            return self.max_idn().inc()   # Crude reinvention of AUTO_INCREMENT
+        else:
+            return self.idn_allocator.allocate(n)
+
+    def reserve_idns(self, n):
+        """
+        Reserve n contiguous idns for an IdnBlockAllocator, safely across processes.
+
+        :return: the first idn reserved
+        """
+        raise NotImplementedError()
 
     def max_idn(self):
         raise NotImplementedError()
@@ -1716,16 +2289,303 @@ class LexSentence(Lex):
     def disconnect(self):
         raise NotImplementedError()
 
+    def populate_words(self, words):
+        """
+        Make inchoate words choate.  Derived classes may do it in fewer queries.
+
+        Words from other lexes, and words that are already choate, are left alone.
+        """
+        for word in words:
+            if word is not None and word.lex is self:
+                # noinspection PyProtectedMember
+                word._choate()
+
+    @staticmethod
+    def _defer_txt(words):
+        """Leave out the txt of found words, until one of them needs it.  See find_words(lazy_txt)"""
+        for word in words:
+            # noinspection PyProtectedMember
+            word._choate()
+            # noinspection PyProtectedMember
+            word._fields.pop('txt', None)
+            word._txt_batch = words
+
+    def populate_txts(self, words):
+        """
+        Fetch the txt of words found with find_words(lazy_txt=True).
+
+        Happens on its own when one of them first needs its txt, for all the words found with it.
+        Words that already have their txt are left alone.
+        """
+        # noinspection PyProtectedMember
+        lazy_words = [word for word in words if word._txt_batch is not None]
+        if lazy_words:
+            txts = self._txts_by_idn([word.idn for word in lazy_words])
+            for word in lazy_words:
+                # noinspection PyProtectedMember
+                word._fields['txt'] = txts[word.idn.raw]
+                word._txt_batch = None
+
+    def _txts_by_idn(self, idns):
+        """Dictionary of txt by idn.raw.  Derived classes may select only the txt."""
+        return {word.idn.raw: word.txt for word in self.find_words(idn=idns)}
+
+    @staticmethod
+    def _found_together(words):
+        """Remember the words found together, so Word.find_jbo() can load them all at once."""
+        for word in words:
+            word._found_with = words
+
+    def vrbs_ify(self, vrb):
+        """
+        Convert a verb, or verbs, to a frozenset of idns.  Or None for no restriction on the verb.
+
+        Like find_words(vrb), an empty collection is no restriction.
+        """
+        if vrb is None:
+            return None
+        elif is_iterable(vrb):
+            return frozenset(self.idn_ify(v) for v in vrb) or None
+        else:
+            return frozenset((self.idn_ify(vrb),))
+
+    def populate_related(self, words, field, vrbs=None):
+        """
+        Find the words related to each of these words, in one go.  See Word.find_jbo()
+
+        :param words: words in this lex
+        :param field: 'obj' for the words whose object is each word (jbo)
+                      'sbj' for the words whose subject is each word (jbs)
+        :param vrbs: frozenset of verb idns, or None for any verb.  See vrbs_ify()
+        """
+        assert field in ('sbj', 'obj')
+        key = (field, vrbs)
+        needy_words = []
+        for word in words:
+            if word._related is None or word._related_as_of != self._n_inserted_words:
+                word._related = dict()
+                word._related_as_of = self._n_inserted_words
+            if key not in word._related:
+                needy_words.append(word)
+        if needy_words:
+            idns = list({word.idn.raw: word.idn for word in needy_words}.values())
+            related = self._find_related_words(field, idns, vrbs)
+            for word in needy_words:
+                word._related[key] = related.get(word.idn.raw, [])
+
+    def _find_related_words(self, field, idns, vrbs):
+        """
+        Dictionary of related words by idn.raw.  (They're related by their sbj or obj field.)
+
+        Derived classes may find them all more efficiently.
+        """
+        related = dict()
+        find_kwargs = {field: idns, 'vrb': None if vrbs is None else list(vrbs)}
+        for found_word in self.find_words(**find_kwargs):
+            related.setdefault(getattr(found_word, field).idn.raw, []).append(found_word)
+        return related
+
+    RENDER_FIELDS = ('description', 'dict', 'json', 'repr', 'str')
+
+    def render_many(self, words, fields=('description', 'dict')):
+        """
+        Render many words at once, e.g. for an activity feed.
+
+        First make the words choate, then the words they refer to (sbj, vrb, obj),
+        so rendering them does not read the words one at a time.
+
+        :param words: iterable of words in this lex
+        :param fields: which renderings, any of RENDER_FIELDS, e.g.
+                       'description' - word.description()
+                       'dict' - word.to_dict()
+        :return: list of dictionaries, one per word, keyed by field
+        """
+        for field in fields:
+            if field not in self.RENDER_FIELDS:
+                raise ValueError("render_many() doesn't know how to render {field}".format(
+                    field=repr(field)
+                ))
+        words = list(words)
+        self.populate_words(words)
+        self.populate_words([
+            part
+            for word in words if word.exists()
+            for part in (word.sbj, word.vrb, word.obj)
+        ])
+
+        renderers = dict(
+            description=lambda w: w.description(),
+            dict=lambda w: w.to_dict(),
+            json=lambda w: w.to_json(),
+            repr=lambda w: repr(w),
+            str=lambda w: str(w),
+        )
+        return [{field: renderers[field](word) for field in fields} for word in words]
+
+    @staticmethod
+    def records_from_words(words):
+        """Binary records of words, end to end, e.g. to pass to another process.  See Word.to_record()"""
+        return b''.join(word.to_record() for word in words)
+
+    def words_from_records(self, records):
+        """
+        Rehydrate binary records into choate words in this lex.
+
+        The sbj, vrb, obj of each word are inchoate words in this lex.
+
+        :param records: bytes, bytearray or memoryview, from records_from_words()
+        :return: list of words
+        """
+        words = []
+        for row in self.parse_records(records):
+            word = self.word_class(row['idn'])
+            word.populate_from_row(row)
+            words.append(word)
+        return words
+
+    @staticmethod
+    def parse_records(records):
+        """
+        Generate a dictionary for each binary record, with Number idn,sbj,vrb,obj,num,whn and Text txt.
+
+        Reads through a memoryview, so the only copies are the raw bytes of each field.
+        """
+        view = memoryview(records)
+        offset = 0
+        while offset < len(view):
+            row = dict()
+            for name in Word.RECORD_NUMBERS:
+                raw, offset = LexSentence._record_field(view, offset, '>H')
+                row[name] = Number.from_raw(raw)
+            utf8, offset = LexSentence._record_field(view, offset, '>I')
+            row['txt'] = Text(utf8.decode('utf-8'))
+            yield row
+
+    @staticmethod
+    def _record_field(view, offset, length_format):
+        """Bytes of one length-prefixed field, and the offset after it."""
+        start = offset + struct.calcsize(length_format)
+        if start > len(view):
+            raise LexSentence.RecordError("Record truncated at byte " + str(offset))
+        length, = struct.unpack(length_format, view[offset:start].tobytes())
+        if start + length > len(view):
+            raise LexSentence.RecordError("Record truncated at byte " + str(start))
+        return view[start:start + length].tobytes(), start + length
+
+    class RecordError(ValueError):
+        """A binary word record was cut short."""
+
+    def iter_words(self, batch_size=1000, **kwargs):
+        """
+        Generate the words find_words(**kwargs) would find, without holding them all in memory.
+
+        Each batch is a find_words() of batch_size words after the last idn of the batch before.
+        (Not one cursor left open for the whole iteration, which would tie up the connection,
+        so the words could not be looked into, e.g. word.sbj.txt, until the iteration ended.)
+        Jbo words stay with their word.
+        """
+        assert 'limit' not in kwargs and 'offset' not in kwargs
+        assert batch_size >= 1
+        keyset_name = 'after_idn' if kwargs.get('idn_ascending', True) else 'before_idn'
+        while True:
+            words = self.find_words(limit=batch_size, **kwargs)
+            for word in words:
+                yield word
+            if len(words) < batch_size:
+                return
+            kwargs[keyset_name] = words[-1].idn
+
     def find_last(self, **kwargs):
-        # TODO:  In LexMySQL, do this more efficiently:
-        #        limit find_words() to latest using sql LIMIT.
-        # TODO:  Who should make sure idn_ascending is True?
+        """The word with the biggest idn that find_words(**kwargs) would find.  Only one is read."""
+        kwargs.update(idn_ascending=False, limit=1)
         bunch = self.find_words(**kwargs)
         try:
-            return bunch[-1]
+            return bunch[0]
         except IndexError:
             raise self.NotFound
 
+    AGGREGATE_MEASURES = ('count', 'count_sbj', 'min_num', 'max_num', 'sum_num', 'latest_per_sbj')
+
+    class AggregateError(ValueError):
+        """Unknown measure or group_by for aggregate()."""
+
+    def aggregate(
+        self,
+        group_by='obj',
+        measures=('count',),
+        order_by=None,
+        limit=None,
+        idn=None,
+        sbj=None,
+        vrb=None,
+        obj=None,
+        txt=None,
+        idn_range=None,
+        num_min=None,
+        num_max=None,
+        whn_after=None,
+        whn_before=None,
+    ):
+        """
+        Tally the words find_words() would find, by group, without reading the words.
+
+        group_by is 'sbj', 'vrb', 'obj', or None for one grand tally.
+        measures are any of:
+            count           - how many words
+            count_sbj       - how many different subjects
+            min_num         - smallest num
+            max_num         - biggest num
+            sum_num         - total of the nums
+            latest_per_sbj  - total of the nums, counting only each subject's latest word,
+                              e.g. each user's current rating of the obj
+        order_by is one of the measures, biggest first (top-N), or None for group order.
+        The top-N is chosen by the database when it can, e.g. ordering by count.
+
+        EXAMPLE:  "12 people like this, total score 37", for the 10 most liked things
+            lex.aggregate(vrb=like, measures=('count_sbj', 'latest_per_sbj'), order_by='count_sbj', limit=10)
+            [{'obj': Number(...), 'count_sbj': 12, 'latest_per_sbj': Number(37)}, ...]
+
+        :return: list of dictionaries, one per group, of the group_by idn and the measures.
+        """
+        if isinstance(measures, six.string_types):
+            measures = (measures,)
+        if group_by not in ('sbj', 'vrb', 'obj', None):
+            raise self.AggregateError("Cannot group by " + repr(group_by))
+        for measure in measures:
+            if measure not in self.AGGREGATE_MEASURES:
+                raise self.AggregateError("Unknown measure " + repr(measure))
+        if order_by is not None and order_by not in measures:
+            raise self.AggregateError("order_by must be one of the measures, not " + repr(order_by))
+        self.flush_behind()
+        tallies = self._aggregate(group_by, measures, order_by, limit, dict(
+            idn=idn,
+            sbj=sbj,
+            vrb=vrb,
+            obj=obj,
+            txt=txt,
+            idn_range=idn_range,
+            num_min=num_min,
+            num_max=num_max,
+            whn_after=whn_after,
+            whn_before=whn_before,
+        ))
+        if group_by is not None:
+            tallies.sort(key=lambda tally: tally[group_by])
+        if order_by is not None:
+            tallies.sort(key=lambda tally: tally[order_by], reverse=True)
+            # NOTE:  Stable sort, so ties stay in group order.
+        return tallies if limit is None else tallies[:limit]
+
+    def _aggregate(self, group_by, measures, order_by, limit, filters):
+        """
+        The tallies for aggregate(), in any order.
+
+        order_by and limit are hints.  The tallies may be all the groups, aggregate() sorts and limits them.
+        :param filters: - find_words() keyword arguments
+        :return: list of dictionaries, one per group
+        """
+        raise NotImplementedError()
+
     # def read_word(self, txt_or_idn_etc):
     #     if Text.is_valid(txt_or_idn_etc):
     #         # word = self.word_class(txt=txt_or_idn_etc)  <-- well that was dumb ... OR NOT
@@ -1767,15 +2627,6 @@ class LexSentence(Lex):
         """
         # TODO:  Disallow num,txt positionally, unlike Word.says()
 
-        # TODO:  Allow sbj=lex
-        assert isinstance(sbj, (Word, Number, type(''))), "sbj cannot be a " + type_name(sbj)
-        assert isinstance(vrb, (Word, Number, type(''))), "vrb cannot be a " + type_name(vrb)
-        assert isinstance(obj, (Word, Number, type(''))), "obj cannot be a " + type_name(obj)
-
-        # if isinstance(txt, numbers.Number) or Text.is_valid(num):
-        #     # TODO:  Why `or` not `and`?
-        #     (txt, num) = (num, txt)
-
         if num is not None and num_add is not None:
             raise self.CreateWordError(
                 "{self_type}.create_word() cannot specify both num and num_add.".format(
@@ -1783,9 +2634,69 @@ class LexSentence(Lex):
                 )
             )
 
-        num = num if num is not None else 1
-        txt = txt if txt is not None else ''
-
+        new_word = self._new_sentence(sbj, vrb, obj, num, txt)
+        if num_add is not None:
+            assert Number.is_number(num_add)
+            self._save_num_add(new_word, Number(num_add))
+        elif use_already:
+            self._save_unless_already(new_word)
+        else:
+            new_word.save(override_idn=override_idn)
+        return new_word
+
+    def create_words(self, specs):
+        """
+        Create many new sentences at once, e.g. to import ratings.
+
+        Each distinct sbj, vrb, obj (word, idn or name) is looked up only once.
+        The new words get a contiguous range of idns.  See insert_next_words()
+
+        :param specs: iterable of (sbj, vrb, obj) or (sbj, vrb, obj, num) or (sbj, vrb, obj, num, txt)
+        :return: list of the new words, in order
+        """
+        parts = dict()
+
+        def part_word(part):
+            key = part.idn if isinstance(part, Word) else part
+            try:
+                return parts[key]
+            except KeyError:
+                word = parts[key] = self.read_word(part)
+                return word
+
+        new_words = []
+        for spec in specs:
+            sbj, vrb, obj = (part_word(part) for part in spec[0:3])
+            num = spec[3] if len(spec) > 3 else None
+            txt = spec[4] if len(spec) > 4 else None
+            new_words.append(self._new_sentence(sbj, vrb, obj, num, txt))
+        self.insert_next_words(new_words)
+        return new_words
+
+    def upsert_word(self, sbj, vrb, obj, num=None, txt=None):
+        """
+        Like create_word(use_already=True) but also tell whether a new word was created.
+
+        :return: (word, is_new)
+        """
+        new_word = self._new_sentence(sbj, vrb, obj, num, txt)
+        is_new = self._save_unless_already(new_word)
+        return new_word, is_new
+
+    def _new_sentence(self, sbj, vrb, obj, num, txt):
+        """Check the parts of a sentence for create_word() and construct it (not saved yet)."""
+        # TODO:  Allow sbj=lex
+        assert isinstance(sbj, (Word, Number, type(''))), "sbj cannot be a " + type_name(sbj)
+        assert isinstance(vrb, (Word, Number, type(''))), "vrb cannot be a " + type_name(vrb)
+        assert isinstance(obj, (Word, Number, type(''))), "obj cannot be a " + type_name(obj)
+
+        # if isinstance(txt, numbers.Number) or Text.is_valid(num):
+        #     # TODO:  Why `or` not `and`?
+        #     (txt, num) = (num, txt)
+
+        num = num if num is not None else 1
+        txt = txt if txt is not None else ''
+
         if not Number.is_number(num):
             # TODO:  Allow q-strings for num.  I.e. raise this exception on Number(num) error.
             raise self.CreateWordError(
@@ -1802,73 +2713,116 @@ class LexSentence(Lex):
                 )
             )
 
-        new_word = self.word_class(
+        return self.word_class(
             sbj=sbj,
             vrb=vrb,
             obj=obj,
             num=Number(num),
             txt=txt,
         )
-        if num_add is not None:
-            assert Number.is_number(num_add)
-            self.populate_word_from_sbj_vrb_obj(new_word, sbj, vrb, obj)
-            if new_word.exists():
+
+    def _save_num_add(self, new_word, num_add):
+        """
+        Save a new word whose num is num_add more than the latest word with its sbj,vrb,obj.
+
+        Reading the latest num and inserting the sum happen under the process-global lock,
+        so concurrent increments of the same counter by this process are not lost.
+        And under _lock_sentence(), so increments by other processes aren't lost either.
+        On MySQL they also happen on one connection, in one transaction, see _connected().
+        (The sum happens in Python.  The raw bytes of a Number cannot be added in SQL.)
+        """
+        sbj, vrb, obj = new_word.sbj, new_word.vrb, new_word.obj
+        old_word = self.word_class(sbj=sbj, vrb=vrb, obj=obj)
+        with self._lock_read_then_write(), self._connected(), self._lock_sentence(sbj, vrb, obj):
+            self._start_transaction()
+            self.populate_word_from_sbj_vrb_obj(old_word, sbj, vrb, obj)
+            if old_word.exists():
                 # noinspection PyProtectedMember
-                new_word._fields['num'] += Number(num_add)
-                new_word.set_idn_if_you_really_have_to(Number.NAN)
+                new_word._fields.update(num=old_word.num + num_add, txt=old_word.txt)
             else:
                 # noinspection PyProtectedMember
-                new_word._fields['num'] = Number(num_add)
+                new_word._fields['num'] = num_add
+            new_word.set_idn_if_you_really_have_to(self.next_idn())
+            self.insert_word(new_word)
+
+    def _save_unless_already(self, new_word):
+        """
+        Save a new word, unless the latest word with its sbj,vrb,obj also has its num,txt.
+
+        In that case populate new_word from that old word.
+        Derived classes may do this in fewer steps.
+
+        :return: True if a new word was saved.
+        """
+        sbj, vrb, obj = new_word.sbj, new_word.vrb, new_word.obj
+        old_word = self.word_class(
+            sbj=sbj,
+            vrb=vrb,
+            obj=obj
+        )
+        self.populate_word_from_sbj_vrb_obj(old_word, sbj, vrb, obj)
+        if not old_word.exists():
             new_word.save()
-        elif use_already:
-            old_word = self.word_class(
-                sbj=sbj,
-                vrb=vrb,
-                obj=obj
+            return True
+        elif (
+            old_word.txt == new_word.txt and
+            old_word.num == new_word.num
+        ):
+            # NOTE:  There was an identical sentence already (same s,v,o,t,n).
+            #        (And it was the latest word matching (s,v,o).)
+            #        Fetch it so new_word.exists().
+            #        This is the only path through create_word()
+            #        where no new sentence is created.
+            #        That is, where new_word is an old word.
+            # NOTE:  It only happens when the old_word is the NEWEST of its kind (s,v,o)
+            #        This was a problem with multiple explanations on a word.
+            self.populate_word_from_sbj_vrb_obj_num_txt(
+                new_word,
+                sbj,
+                vrb,
+                obj,
+                new_word.num,
+                new_word.txt
             )
-            self.populate_word_from_sbj_vrb_obj(old_word, sbj, vrb, obj)
-            if not old_word.exists():
-                new_word.save()
-            elif (
-                old_word.txt == new_word.txt and
-                old_word.num == new_word.num
-            ):
-                # NOTE:  There was an identical sentence already (same s,v,o,t,n).
-                #        (And it was the latest word matching (s,v,o).)
-                #        Fetch it so new_word.exists().
-                #        This is the only path through create_word()
-                #        where no new sentence is created.
-                #        That is, where new_word is an old word.
-                # NOTE:  It only happens when the old_word is the NEWEST of its kind (s,v,o)
-                #        This was a problem with multiple explanations on a word.
-                self.populate_word_from_sbj_vrb_obj_num_txt(
-                    new_word,
-                    sbj,
-                    vrb,
-                    obj,
-                    Number(num),
-                    txt
-                )
-                assert new_word.idn == old_word.idn, "Race condition {old} to {new}".format(
-                    old=old_word.idn.qstring(),
-                    new=new_word.idn.qstring()
-                )
-            else:
-                new_word.save()
+            assert new_word.idn == old_word.idn, "Race condition {old} to {new}".format(
+                old=old_word.idn.qstring(),
+                new=new_word.idn.qstring()
+            )
+            return False
         else:
-            new_word.save(override_idn=override_idn)
-        return new_word
+            new_word.save()
+            return True
 
-    @classmethod
-    def now_number(cls):
+    def sentence(self, sbj, vrb):
+        """
+        Resolve a subject and verb once, for saying many sentences with them.
+
+        lex.sentence(s, v).say(o, n, t) is like lex[s](v)[o] = n,t but quicker.
+        """
+        return SentenceTemplate(self, sbj, vrb)
+
+    whn_clock = None   # Each LexSentence instance gets its own WhnClock.
+
+    def now_number(self):
         """
         Returns a qiki.Number suitable for the whn field:  seconds since 1970 UTC.
 
+        Never less than the whn this lex handed out before.
+        Without a lex, e.g. where LexSentence.now_number() used to be called, see wall_now_number()
         Not to be confused with qiki.TimeLex.now_word() which is a qiki.Word
         an abstraction representing the current time.
         """
+        return self.whn_clock.now()
+
+    @classmethod
+    def wall_now_number(cls):
+        """The time now, as a qiki.Number, seconds since 1970 UTC.  Straight from the wall clock."""
         return TimeLex().now_word().num
 
+    def now_numbers(self, n):
+        """Whn for each of n words inserted together.  All the same, unless the clock is unique."""
+        return self.whn_clock.nows(n)
+
 
 def native_num(num):
     if num.is_suffixed():
@@ -1905,26 +2859,57 @@ class LexInMemory(LexSentence):
         # TODO:  new_lex_memory = LexMemory(old_lex_memory)?
 
         self.words = None
+        self._whn_in_idn_order = True
         self.install_from_scratch()
 
     def insert_word(self, word):
         assert not word.idn.is_nan()
         word.whn = self.now_number()
 
-        self.words.append(word)
+        self._append_word(word)
 
         assert int(word.idn) == len(self.words) - 1
         # NOTE:   Crude expectation word insertion order 0,1,2,...
 
         # noinspection PyProtectedMember
         word._now_it_exists()
+        self._note_inserted_word(word)
+
+    def insert_words(self, words):
+        """All at the same whn, like LexMySQL.insert_words()"""
+        for word, whn in zip(words, self.now_numbers(len(words))):
+            word.whn = whn
+        self._write_words(words)
+        for word in words:
+            # noinspection PyProtectedMember
+            word._now_it_exists()
+            self._note_inserted_word(word)
+
+    def _write_words(self, words):
+        for word in words:
+            assert int(word.idn) == len(self.words)
+            self._append_word(word)
+
+    def _append_word(self, word):
+        """
+        Store a word after the others, noting whether whn still goes up with idn.
+
+        A whn_clock from this lex never goes backwards, but a replaced lex.whn_clock can.
+        """
+        if self.words and word.whn < self.words[-1].whn:
+            self._whn_in_idn_order = False
+        self.words.append(word)
 
     def disconnect(self):
         pass
 
     def install_from_scratch(self):
         self.words = []
+        self._whn_in_idn_order = True
         # NOTE:  Assume zero-starting idns
+        self._forget_cached_words()
+        self._definitions_complete = True
+        # NOTE:  Every word in this lex goes through insert_word(), so no definition escapes.
 
         self._lex = self.word_class(self.IDN_LEX)
 
@@ -1937,7 +2922,7 @@ class LexInMemory(LexSentence):
     def uninstall_to_scratch(self):
         del self.words
 
-    def populate_word_from_idn(self, word, idn):
+    def _populate_word_from_idn(self, word, idn):
         try:
             integer_identifier = int(idn)
         except ValueError:   # e.g. Word(Number.NAN)
@@ -1951,7 +2936,7 @@ class LexInMemory(LexSentence):
         else:
             return False
 
-    def populate_word_from_definition(self, word, define_txt):
+    def _populate_word_from_definition(self, word, define_txt):
         """Flesh out a word by its txt.  sbj=lex, vrb=define only."""
         for word_source in self.words:
             if (
@@ -1963,7 +2948,7 @@ class LexInMemory(LexSentence):
                 return True
         return False
 
-    def populate_word_from_sbj_vrb_obj(self, word, sbj, vrb, obj):
+    def _populate_word_from_sbj_vrb_obj(self, word, sbj, vrb, obj):
         for word_source in reversed(self.words):
             # NOTE:  reversed() to prefer the LATEST word that matches s,v,o
             if word_source.sbj == sbj and word_source.vrb == vrb and word_source.obj == obj:
@@ -1971,7 +2956,7 @@ class LexInMemory(LexSentence):
                 return True
         return False
 
-    def populate_word_from_sbj_vrb_obj_num_txt(self, word, sbj, vrb, obj, num, txt):
+    def _populate_word_from_sbj_vrb_obj_num_txt(self, word, sbj, vrb, obj, num, txt):
         for word_source in reversed(self.words):
             if (
                 word_source.sbj == sbj and
@@ -1990,6 +2975,17 @@ class LexInMemory(LexSentence):
         except (AttributeError, IndexError):   # whether self.words is missing or empty
             return Number(0)
 
+    _idns_reserved_up_to = 0
+
+    def reserve_idns(self, n):
+        first = max(int(self.max_idn()) + 1, self._idns_reserved_up_to)
+        self._idns_reserved_up_to = first + n
+        return Number(first)
+
+    def _catch_up_idns(self):
+        """Reserve from just after the highest idn, because words here must have contiguous idns."""
+        self._idns_reserved_up_to = int(self.max_idn()) + 1
+
     def find_words(
         self,
         idn=None,
@@ -2002,26 +2998,42 @@ class LexInMemory(LexSentence):
         jbo_ascending=True,
         jbo_vrb=(),
         jbo_strictly=False,
+        lazy_txt=False,
+        limit=None,
+        offset=0,
+        after_idn=None,
+        before_idn=None,
+        idn_range=None,
+        num_min=None,
+        num_max=None,
+        whn_after=None,
+        whn_before=None,
         debug=False
     ):
+        assert limit is None or limit >= 0
+        assert offset >= 0
+        self.flush_behind()
+        i_stop = None if limit is None else offset + limit
+        can_stop_early = i_stop is not None and not (jbo_vrb and jbo_strictly)
         found_words = []
-        for word_source in self.words if idn_ascending else reversed(self.words):
-            hit = True
-            if idn is not None and not self.word_match(word_source.idn, idn):   #
-                # was word_source.idn != self.idn_ify(idn):
-                # TODO:  Why does word_match(word_source.idn, idn) fail in one test?
-                hit = False
-            if sbj is not None and not self.word_match(word_source.sbj, sbj):
-                hit = False
-            if vrb is not None and not self.word_match(word_source.vrb, vrb):
-                hit = False
-            if obj is not None and not self.word_match(word_source.obj, obj):
-                hit = False
-            if txt is not None and not self.txt_match(word_source.txt, txt):
-                # was word_source.txt != Text(txt):
-                hit = False
-            if hit:
-                found_words.append(self[word_source])   # copy constructor
+        for word_source in self._word_sources(
+            idn=idn,
+            sbj=sbj,
+            vrb=vrb,
+            obj=obj,
+            txt=txt,
+            idn_ascending=idn_ascending,
+            after_idn=after_idn,
+            before_idn=before_idn,
+            idn_range=idn_range,
+            num_min=num_min,
+            num_max=num_max,
+            whn_after=whn_after,
+            whn_before=whn_before,
+        ):
+            if can_stop_early and len(found_words) >= i_stop:
+                break
+            found_words.append(self[word_source])   # copy constructor
 
         if jbo_vrb:
             restricted_found_words = []
@@ -2048,9 +3060,147 @@ class LexInMemory(LexSentence):
 
                 if jbo or not jbo_strictly:
                     restricted_found_words.append(new_word)
-            return restricted_found_words
-        else:
-            return found_words
+            found_words = restricted_found_words
+        found_words = found_words[offset:i_stop]
+        self._found_together(found_words)
+        if lazy_txt:
+            self._defer_txt(found_words)
+        return found_words
+
+    def _aggregate(self, group_by, measures, order_by, limit, filters):
+        """One pass through the words.  All the groups, no use for order_by and limit."""
+        tallies = dict()
+        for word_source in self._word_sources(**filters):
+            key = None if group_by is None else getattr(word_source, group_by).idn
+            try:
+                tally = tallies[None if key is None else key.raw]
+            except KeyError:
+                tally = tallies[None if key is None else key.raw] = dict(
+                    key=key,
+                    count=0,
+                    sum_num=Number(0),
+                    min_num=word_source.num,
+                    max_num=word_source.num,
+                    latest=dict(),
+                )
+            tally['count'] += 1
+            tally['sum_num'] = tally['sum_num'] + word_source.num
+            tally['min_num'] = min(tally['min_num'], word_source.num)
+            tally['max_num'] = max(tally['max_num'], word_source.num)
+            tally['latest'][word_source.sbj.idn.raw] = word_source.num   # idn order, so latest wins
+        results = []
+        for tally in tallies.values():
+            measured = dict(
+                count=tally['count'],
+                count_sbj=len(tally['latest']),
+                min_num=tally['min_num'],
+                max_num=tally['max_num'],
+                sum_num=tally['sum_num'],
+                latest_per_sbj=sum(tally['latest'].values(), Number(0)),
+            )
+            result = {measure: measured[measure] for measure in measures}
+            if group_by is not None:
+                result[group_by] = tally['key']
+            results.append(result)
+        return results
+
+    def _word_sources(
+        self,
+        idn=None,
+        sbj=None,
+        vrb=None,
+        obj=None,
+        txt=None,
+        idn_ascending=True,
+        after_idn=None,
+        before_idn=None,
+        idn_range=None,
+        num_min=None,
+        num_max=None,
+        whn_after=None,
+        whn_before=None,
+    ):
+        """Generate the stored words that pass the find_words() filters.  Not copies, don't modify."""
+        i_start = 0
+        i_end = len(self.words)
+        idns = self._Column(self.words, 'idn')
+        if after_idn is not None:
+            i_start = max(i_start, bisect.bisect_right(idns, self.idn_ify(after_idn)))
+        if before_idn is not None:
+            i_end = min(i_end, bisect.bisect_left(idns, self.idn_ify(before_idn)))
+        if idn_range is not None:
+            idn_min, idn_max = idn_range
+            if idn_min is not None:
+                i_start = max(i_start, bisect.bisect_left(idns, self.idn_ify(idn_min)))
+            if idn_max is not None:
+                i_end = min(i_end, bisect.bisect_right(idns, self.idn_ify(idn_max)))
+        if whn_after is not None:
+            whn_after = Number(whn_after)
+        if whn_before is not None:
+            whn_before = Number(whn_before)
+        if self._whn_in_idn_order:
+            # NOTE:  Bisect whn too, unless a replaced whn_clock ever went backwards.
+            whns = self._Column(self.words, 'whn')
+            if whn_after is not None:
+                i_start = max(i_start, bisect.bisect_right(whns, whn_after))
+                whn_after = None
+            if whn_before is not None:
+                i_end = min(i_end, bisect.bisect_left(whns, whn_before))
+                whn_before = None
+        if num_min is not None:
+            num_min = Number(num_min)
+        if num_max is not None:
+            num_max = Number(num_max)
+        word_sources = self.words[i_start:i_end]
+        for word_source in word_sources if idn_ascending else reversed(word_sources):
+            hit = True
+            if idn is not None and not self.word_match(word_source.idn, idn):   #
+                # was word_source.idn != self.idn_ify(idn):
+                # TODO:  Why does word_match(word_source.idn, idn) fail in one test?
+                hit = False
+            if sbj is not None and not self.word_match(word_source.sbj, sbj):
+                hit = False
+            if vrb is not None and not self.word_match(word_source.vrb, vrb):
+                hit = False
+            if obj is not None and not self.word_match(word_source.obj, obj):
+                hit = False
+            if txt is not None and not self.txt_match(word_source.txt, txt):
+                # was word_source.txt != Text(txt):
+                hit = False
+            if num_min is not None and not word_source.num >= num_min:
+                hit = False
+            if num_max is not None and not word_source.num <= num_max:
+                hit = False
+            if whn_after is not None and not word_source.whn > whn_after:
+                hit = False
+            if whn_before is not None and not word_source.whn < whn_before:
+                hit = False
+            if hit:
+                yield word_source
+
+    class _Column(object):
+        """One field of a list of words, for bisect, without copying it out."""
+        def __init__(self, words, name):
+            self.words = words
+            self.name = name
+
+        def __len__(self):
+            return len(self.words)
+
+        def __getitem__(self, index):
+            return getattr(self.words[index], self.name)
+
+    def _find_related_words(self, field, idns, vrbs):
+        """One pass through all the words, instead of one per idn."""
+        self.flush_behind()
+        raws = set(idn.raw for idn in idns)
+        vrb_raws = None if vrbs is None else set(vrb.raw for vrb in vrbs)
+        related = dict()
+        for word_source in self.words:
+            raw = getattr(word_source, field).idn.raw
+            if raw in raws and (vrb_raws is None or word_source.vrb.idn.raw in vrb_raws):
+                related.setdefault(raw, []).append(self[word_source])
+        return related
 
     def word_match(self, word_1, word_or_words_2):
         """
@@ -2098,13 +3248,45 @@ class LexMySQL(LexSentence):
             table - e.g. 'word' (required)
             engine - MySQL ENGINE, defaults to InnoDB
             txt_type - MySQL type of txt, defaults to VARCHAR(10000)
+            pool_size - most connections at once, one per thread doing an operation, default 5
+            pool_timeout - seconds to wait for a connection when they're all busy, default 30
+            pool_max_lifetime - seconds before a connection is replaced, default 3600
+            pool_ping_seconds - idle seconds before a connection is checked when borrowed, default 10
+            statement_cache_size - query shapes remembered, and prepared statements kept open
+                                   on each connection, default 100
+            connector - 'pure' (default) for the pure Python MySQL Connector with prepared statements,
+                        or 'cext' for its C extension, faster for big results, with the data
+                        bound into the query string instead, see _bind()
         """
 
         language = kwargs.pop('language')
         assert language == 'MySQL'
         self._table = kwargs.pop('table')
         self._engine = kwargs.pop('engine', 'InnoDB')
-        self._connection = None
+        self._pool = None
+        self._held = threading.local()
+        pool_kwargs = dict(
+            size=kwargs.pop('pool_size', 5),
+            timeout=kwargs.pop('pool_timeout', 30.0),
+            max_lifetime=kwargs.pop('pool_max_lifetime', 3600.0),
+            ping_seconds=kwargs.pop('pool_ping_seconds', 10.0),
+        )
+        connector = kwargs.pop('connector', 'pure')
+        if connector not in self.CONNECTORS:
+            raise self.ConnectError("connector should be one of {connectors}, not {connector}".format(
+                connectors=", ".join(repr(c) for c in self.CONNECTORS),
+                connector=repr(connector),
+            ))
+        if connector == 'cext' and not getattr(mysql.connector, 'HAVE_CEXT', False):
+            raise self.ConnectError("The MySQL Connector C extension is not available.")
+        self._client_binding = connector == 'cext'
+        self._statement_cache_size = kwargs.pop('statement_cache_size', 100)
+        self._shapes = StatementCache(self._statement_cache_size)
+        self._shapes_lock = threading.Lock()
+        self._n_shape_hits = 0
+        self._n_shape_misses = 0
+        self._n_prepare_hits = 0
+        self._n_prepare_misses = 0
         default_txt_type = 'VARCHAR(10000)'   if self._engine.upper() == 'MEMORY' else   'TEXT'
         # VARCHAR(65536):  ProgrammingError: 1074 (42000): Column length too big for column 'txt'
         #                  (max = 16383); use BLOB or TEXT instead
@@ -2135,9 +3317,10 @@ class LexMySQL(LexSentence):
             MySQL Python Connector version 2.2.2b1 doesn't support use_pure.
             """
 
-            kwargs_for_sql_connect['use_pure'] = True
+            kwargs_for_sql_connect['use_pure'] = not self._client_binding
             # THANKS:  Disable CEXT because it doesn't support prepared statements
             #          https://stackoverflow.com/a/50535647/673991
+            # NOTE:  Unless connector='cext', which binds data into the query instead.
 
             try:
                 return do_connect()
@@ -2149,60 +3332,68 @@ class LexMySQL(LexSentence):
                     print("Unknown Attribute Error:", str(attribute_error))
                     raise
 
-        try:
-            self._connection = do_connect_with_and_without_use_pure()
-        except mysql.connector.Error as exception:
-            raise self.ConnectError(exception.__class__.__name__ + " - " + str(exception))
-            # EXAMPLE:  (mysqld is down)
-            #     InterfaceError - 2003: Can't connect to MySQL server on 'localhost:3306'
-            #     (10061 No connection could be made because the target machine actively refused it)
-            # EXAMPLE:  (maybe wrong password)
-            #     ProgrammingError
-
-        try:
+        def connect():
+            try:
+                connection = do_connect_with_and_without_use_pure()
+            except mysql.connector.Error as exception:
+                raise self.ConnectError(exception.__class__.__name__ + " - " + str(exception))
+                # EXAMPLE:  (mysqld is down)
+                #     InterfaceError - 2003: Can't connect to MySQL server on 'localhost:3306'
+                #     (10061 No connection could be made because the target machine actively refused it)
+                # EXAMPLE:  (maybe wrong password)
+                #     ProgrammingError
             if HORRIBLE_MYSQL_CONNECTOR_WORKAROUND:
-                self._connection.set_charset_collation(str('latin1'))
+                connection.set_charset_collation(str('latin1'))
             else:
-                self._connection.set_charset_collation(str('utf8'))
-
-            # self.super_query('SET TRANSACTION ISOLATION LEVEL READ COMMITTED')
-            # # NOTE:  Required for max_idn() to keep up with latest insertions (created words).
-            # # THANKS:  Isolation level, https://stackoverflow.com/a/17589234/673991
-            # # SEE:  SET TRANSACTION, https://dev.mysql.com/doc/refman/en/set-transaction.html
-            # # SEE:  READ COMMITTED,
-            #         https://dev.mysql.com/doc/refman/en/innodb-transaction-isolation-levels.html#isolevel_read-committed
-            # # DONE:  Would still rather make max_idn() alone do this,
-            # #        but "FROM SHARE" was a syntax error.
-            # #        Maybe "FOR UPDATE" in the max_idn() SELECT statement,
-            # #        plus a commit in super_select() would do the trick?
-            # #        (Or maybe in insert_next_word())
-            # # SEE:  FOR UPDATE, https://dev.mysql.com/doc/refman/en/select.html
-
-            self._lex = self.word_class(self.IDN_LEX)
-            try:
-                # noinspection PyProtectedMember
-                self._lex._choate()   # Get the word out of this Lex that represents the Lex itself.
-            except self.QueryError as exception:
-                exception_message = str(exception)
-                if re.search(r"Table .* doesn't exist", exception_message):
-                    # TODO:  Better detection of automatic table creation opportunity.
-                    self.install_from_scratch()
-                    # TODO:  Do not super() twice -- cuz it's not D.R.Y.
-                    # TODO:  Do not install in unit tests if we're about to uninstall.
-                    super(LexMySQL, self).__init__(**kwargs_for_something_else)
-                    self._lex = self.word_class(self.IDN_LEX)
-                    # NOTE:  because base constructor sets it to None
-                else:
-                    raise self.ConnectError(str(exception))
+                connection.set_charset_collation(str('utf8'))
+            connection.autocommit = True
+            # NOTE:  So a read is not a transaction, and the pool need not roll it back.
+            #        Read-then-write operations use _start_transaction().
+            connection.qiki_prepared = StatementCache(self._statement_cache_size)
+            return connection
 
-            if self._lex is None or not self._lex.exists():
-                self._install_all_seminal_words()
+        self._pool = ConnectionPool(connect, **pool_kwargs)
 
-            self._lex = self[self.IDN_LEX]
-            self._noun = self[self.IDN_NOUN]
-            self._verb = self[self.IDN_VERB]
-            self._define = self[self.IDN_DEFINE]
-            assert self._connection.is_connected()
+        try:
+            with self._connected():
+                # self.super_query('SET TRANSACTION ISOLATION LEVEL READ COMMITTED')
+                # # NOTE:  Required for max_idn() to keep up with latest insertions (created words).
+                # # THANKS:  Isolation level, https://stackoverflow.com/a/17589234/673991
+                # # SEE:  SET TRANSACTION, https://dev.mysql.com/doc/refman/en/set-transaction.html
+                # # SEE:  READ COMMITTED,
+                #         https://dev.mysql.com/doc/refman/en/innodb-transaction-isolation-levels.html#isolevel_read-committed
+                # # DONE:  Would still rather make max_idn() alone do this,
+                # #        but "FROM SHARE" was a syntax error.
+                # #        Maybe "FOR UPDATE" in the max_idn() SELECT statement,
+                # #        plus a commit in super_select() would do the trick?
+                # #        (Or maybe in insert_next_word())
+                # # SEE:  FOR UPDATE, https://dev.mysql.com/doc/refman/en/select.html
+
+                self._lex = self.word_class(self.IDN_LEX)
+                try:
+                    # noinspection PyProtectedMember
+                    self._lex._choate()   # Get the word out of this Lex that represents the Lex itself.
+                except self.QueryError as exception:
+                    exception_message = str(exception)
+                    if re.search(r"Table .* doesn't exist", exception_message):
+                        # TODO:  Better detection of automatic table creation opportunity.
+                        self.install_from_scratch()
+                        # TODO:  Do not super() twice -- cuz it's not D.R.Y.
+                        # TODO:  Do not install in unit tests if we're about to uninstall.
+                        super(LexMySQL, self).__init__(**kwargs_for_something_else)
+                        self._lex = self.word_class(self.IDN_LEX)
+                        # NOTE:  because base constructor sets it to None
+                    else:
+                        raise self.ConnectError(str(exception))
+
+                if self._lex is None or not self._lex.exists():
+                    self._install_all_seminal_words()
+
+                self._lex = self[self.IDN_LEX]
+                self._noun = self[self.IDN_NOUN]
+                self._verb = self[self.IDN_VERB]
+                self._define = self[self.IDN_DEFINE]
+                assert self._connection.is_connected()
 
         except BaseException:
             # SEE:  Exception vs BaseException vs bare except,
@@ -2210,6 +3401,8 @@ class LexMySQL(LexSentence):
             # NOTE:  Prevent ConnectError: OperationalError - 1040 (08004): Too many connections
             self.disconnect()
             raise
+    CONNECTORS = ('pure', 'cext')
+
     RECOGNIZED_MYSQL_CONNECT_ARGUMENTS = {
         'user',
         'password',
@@ -2302,17 +3495,15 @@ class LexMySQL(LexSentence):
             # __del__() too.
         else:
             try:
-                need_to_close = hasattr(self, '_connection') and self._connection is not None
+                need_to_close = hasattr(self, '_pool') and self._pool is not None
             except name_error:
                 '''Dying session, give up trying to close gracefully.'''
                 # EXAMPLE:  NameError: name 'hasattr' is not defined
                 # THANKS:  Safely ignore, https://stackoverflow.com/a/44940341/673991
             else:
                 if need_to_close:
-                    if self._connection.is_connected():
-                        # NOTE:  Prevent `TypeError: 'NoneType'` deep in MySQL Connector code.
-                        self._connection.close()
-                    self._connection = None
+                    self._pool.close()
+                    self._pool = None
 
     def __del__(self):
         self.disconnect()
@@ -2325,6 +3516,7 @@ class LexMySQL(LexSentence):
         """
         if not re.match(self._ENGINE_NAME_VALIDITY, self._engine):
             raise self.IllegalEngineName("Not a valid table name: " + repr(self._engine))
+        self._forget_cached_words()
 
         with self._cursor() as cursor:
             if HORRIBLE_MYSQL_CONNECTOR_WORKAROUND:
@@ -2340,7 +3532,8 @@ class LexMySQL(LexSentence):
                     `num` VARBINARY(255) NOT NULL,
                     `txt` {txt_type} {txt_specs} NOT NULL,
                     `whn` VARBINARY(255) NOT NULL,
-                    PRIMARY KEY (`idn`)
+                    PRIMARY KEY (`idn`),
+                    {index_specs}
                 )
                     ENGINE = `{engine}`
                 ;
@@ -2348,6 +3541,10 @@ class LexMySQL(LexSentence):
                 table=self.table,
                 txt_type=self._txt_type,
                 txt_specs=txt_specs,
+                index_specs=",\n                    ".join(
+                    "INDEX `{name}` USING BTREE ({columns})".format(name=name, columns=columns)
+                    for _, name, columns, _ in self.SCHEMA_INDEXES
+                ),
                 engine=self._engine,
             )
 
@@ -2361,9 +3558,119 @@ class LexMySQL(LexSentence):
 
             # cursor.execute(query)
             self._execute(cursor, query)
-            # TODO:  other keys?  sbj-vrb?   obj-vrb?
         self._install_all_seminal_words()
 
+    SCHEMA_INDEXES = (
+        # (version, name, columns, a query that should use it)
+        (2, 'sbj_vrb_txt', '`sbj`, `vrb`, `txt`(100)',
+            dict(sbj=Number(0), vrb=Number(1), txt='define')),   # populate_word_from_definition()
+        (2, 'sbj_vrb_obj', '`sbj`, `vrb`, `obj`, `idn`',
+            dict(sbj=Number(0), vrb=Number(1), obj=Number(2))),   # populate_word_from_sbj_vrb_obj()
+        (2, 'obj_vrb', '`obj`, `vrb`, `idn`',
+            dict(obj=Number(2), vrb=Number(1))),                # find_words(jbo_vrb=...), find_jbo()
+    )
+    # NOTE:  Version 1 was the PRIMARY KEY alone.
+    #        All are USING BTREE, because the MEMORY engine would make them HASH,
+    #        which can't serve a leftmost-prefix lookup, e.g. sbj, vrb without txt.
+    #        To add an index, append it here with the next version number.
+    #        install_from_scratch() makes new tables with all of them.
+    #        upgrade_schema() adds the missing ones to old tables.
+
+    SCHEMA_VERSION = max(version for version, _, _, _ in SCHEMA_INDEXES)
+
+    class SchemaError(Exception):
+        """An index is missing, or a query would not use it."""
+
+    def index_names(self):
+        """Names of the indexes on the word table, including PRIMARY."""
+        return set(
+            Text.decode_if_you_must(row['Key_name'])
+            for row in self._select_raw('SHOW INDEX FROM', self.table)
+        )
+
+    def schema_version(self):
+        """The highest version whose indexes, and all the ones before, are on the word table."""
+        names = self.index_names()
+        version = 1
+        for index_version, name, _, _ in sorted(self.SCHEMA_INDEXES):
+            if name not in names:
+                return min(version, index_version - 1)
+            version = index_version
+        return version
+
+    def upgrade_schema(self, verify=True):
+        """
+        Add the missing indexes to an existing word table, in place.
+
+        InnoDB adds each index online (ALGORITHM=INPLACE, LOCK=NONE)
+        so words can still be read and inserted while it works.
+
+        :param verify: - check with EXPLAIN that the queries could use the indexes.
+        :return: names of the indexes added
+        """
+        names = self.index_names()
+        added = []
+        for _, name, columns, _ in sorted(self.SCHEMA_INDEXES):
+            if name not in names:
+                online = ', ALGORITHM=INPLACE, LOCK=NONE' if self._engine.upper() == 'INNODB' else ''
+                self.super_query(
+                    'ALTER TABLE', self.table,
+                    'ADD INDEX', self.SuperIdentifier(name),
+                    'USING BTREE (' + columns + ')' + online
+                )
+                added.append(name)
+        if verify:
+            self.verify_schema()
+        return added
+
+    def verify_schema(self):
+        """
+        EXPLAIN a query of each shape, raise SchemaError unless it can use its index.
+
+        FORCE INDEX in the EXPLAIN, because otherwise on a small table MySQL may rightly choose
+        a scan, or sbj_vrb_obj for a sbj_vrb_txt query, they share a leading sbj,vrb.
+        Also raise SchemaError if an index is not BTREE, e.g. a HASH index on a MEMORY table.
+        """
+        index_types = dict(
+            (Text.decode_if_you_must(row['Key_name']), Text.decode_if_you_must(row['Index_type']))
+            for row in self._select_raw('SHOW INDEX FROM', self.table)
+        )
+        for _, name, _, example in self.SCHEMA_INDEXES:
+            index_type = index_types.get(name)
+            if index_type != 'BTREE':
+                raise self.SchemaError("Index {name} is {index_type}, not BTREE".format(
+                    name=name,
+                    index_type=index_type or "missing",
+                ))
+            query_args = [
+                'EXPLAIN SELECT * FROM', self.table,
+                'AS w FORCE INDEX (', self.SuperIdentifier(name), ') WHERE TRUE', None
+            ]
+            query_args += self._and_clauses(
+                example.get('idn'),
+                example.get('sbj'),
+                example.get('vrb'),
+                example.get('obj'),
+                example.get('txt'),
+            )
+            keys_used = set(
+                Text.decode_if_you_must(row['key'] or '')
+                for row in self._select_raw(*query_args)
+            )
+            if name not in keys_used:
+                raise self.SchemaError("Index {name} not usable, instead {keys}".format(
+                    name=name,
+                    keys=", ".join(sorted(keys_used - {''})) or "a table scan",
+                ))
+
+    def _select_raw(self, *query_args):
+        """Rows as dictionaries, without converting to Number or Text.  E.g. for SHOW, EXPLAIN."""
+        query, parameters = self._super_parse(*query_args)
+        with self._cursor(query) as cursor:
+            self._execute(cursor, query, parameters)
+            rows = cursor.fetchall()
+            return [dict(zip(cursor.column_names, row)) for row in rows]
+
     def _install_one_seminal_word(self, _idn, _obj, _txt):
         try:
             super(LexMySQL, self)._install_one_seminal_word(_idn, _obj, _txt)
@@ -2389,24 +3696,17 @@ class LexMySQL(LexSentence):
         except self.QueryError:
             '''Not a problem if MySQL user doesn't have the DELETE privilege'''
         self.super_query('DROP TABLE IF EXISTS', self.table)
+        self.super_query('DROP TABLE IF EXISTS', self.idn_table)
+        self._idn_table_installed = False
+        self._forget_cached_words()
         # self._now_it_doesnt_exist()   # So install will insert the lex sentence.
         # After this, we can only install_from_scratch() or disconnect()
 
     # noinspection SpellCheckingInspection
     def insert_word(self, word):
         whn = self.now_number()
-        # TODO:  Enforce whn uniqueness?
-        # SEE:  https://docs.python.org/library/time.html#time.time
-        #     "Note that even though the time is always returned as a floating point number,
-        #     not all systems provide time with a better precision than 1 second.
-        #     While this function normally returns non-decreasing values,
-        #     it can return a lower value than a previous call
-        #     if the system clock has been set back between the two calls."
-        # Unfortunately, monotonic.monotonic() is seconds since boot, not since 1970.
-        # TODO:  Construct a hybrid?  Get an offset at startup then record offset + monotonic()?
-        # That would mean a time change requires restart.
-        # Groan, invent a qiki.Time() class?  Oh where does it end.
-        # Might as well make classes qiki.Wheel() and qiki.KitchenSink().
+        # NOTE:  The whn_clock never goes backwards, even if the system clock is set back.
+        #        Unique whns are optional, see WhnClock.
 
         # NOTE:  If any of the SQL in this module generates an error in PyCharm like one of these:
         #     <comma join expression> expected, unexpected end of file
@@ -2429,52 +3729,184 @@ class LexMySQL(LexSentence):
         names +=  [    'sbj',    'vrb',    'obj',    'num',    'txt', 'whn']
         values += [word.sbj, word.vrb, word.obj, word.num, word.txt,   whn ]
 
-        last_row_id = self.super_query(
-            'INSERT INTO', self.table,
-            '(' + ','.join(names) + ') ' +
-            'VALUES (', values, ')')
-        # TODO:  named substitutions with NON-prepared statements??
-        # THANKS:  https://dev.mysql.com/doc/connector-python/en/connector-python-api-mysqlcursor-execute.html # noqa
-        # THANKS:  About prepared statements, http://stackoverflow.com/a/31979062/673991
-        # THANKS:  Long comment without warning, https://stackoverflow.com/a/25034769/673991
-        # THANKS:  Etymology of #noqa, https://stackoverflow.com/a/57116704/673991
-        self._connection.commit()
+        with self._connected():
+            last_row_id = self.super_query(
+                'INSERT INTO', self.table,
+                '(' + ','.join(names) + ') ' +
+                'VALUES (', values, ')')
+            # TODO:  named substitutions with NON-prepared statements??
+            # THANKS:  https://dev.mysql.com/doc/connector-python/en/connector-python-api-mysqlcursor-execute.html # noqa
+            # THANKS:  About prepared statements, http://stackoverflow.com/a/31979062/673991
+            # THANKS:  Long comment without warning, https://stackoverflow.com/a/25034769/673991
+            # THANKS:  Etymology of #noqa, https://stackoverflow.com/a/57116704/673991
+            self._commit()
         word.whn = whn
         # noinspection PyProtectedMember
         word._now_it_exists()
+        self._note_inserted_word(word)
         return last_row_id
 
-    def _start_transaction(self):
+    def insert_words(self, words):
+        """Multi-row INSERTs of MAX_ITERABLE words each, with one commit at the end."""
+        for word, whn in zip(words, self.now_numbers(len(words))):
+            word.whn = whn
+        self._write_words(words)
+        for word in words:
+            # noinspection PyProtectedMember
+            word._now_it_exists()
+            self._note_inserted_word(word)
+
+    def _write_words(self, words):
+        with self._connected():
+            self._start_transaction()
+            for i_chunk in range(0, len(words), self.MAX_ITERABLE):
+                query_args = ['INSERT INTO', self.table, '(idn, sbj, vrb, obj, num, txt, whn) VALUES (']
+                for index, word in enumerate(words[i_chunk : i_chunk + self.MAX_ITERABLE]):
+                    if index > 0:
+                        query_args += ['),(']
+                    query_args += [[word.idn, word.sbj, word.vrb, word.obj, word.num, word.txt, word.whn]]
+                query_args += [')']
+                self.super_query(*query_args)
+            self._commit()
+
+    def _save_unless_already(self, new_word):
         """
-        Akin to MySQL START TRANSACTION.
+        Conditional INSERT, unless the latest word with the same sbj,vrb,obj has the same num,txt.
+
+        Under the global lock, on one connection and in one transaction, see _lock_read_then_write():
+        start the transaction, next_idn(), INSERT ... SELECT ... WHERE NOT EXISTS, commit.
+        The NOT EXISTS check and the INSERT are one statement, so no other
+        connection can sneak in an identical sentence between them.
+        The txt comparison is of CAST(... AS BINARY) bytes, so case and trailing spaces matter,
+        as they do in Python.  Not COLLATE utf8mb4_bin, whose PAD SPACE ignores trailing spaces.
+        (Nor the BINARY operator, deprecated in MySQL 8.0.27.)
+        """
+        with self._lock_read_then_write():
+            self.flush_behind()
+            with self._connected():
+                self._start_transaction()
+                idn = self.next_idn()
+                whn = self.now_number()
+                row_count = self.super_query_row_count(
+                    'INSERT INTO', self.table, '(idn, sbj, vrb, obj, num, txt, whn) '
+                    'SELECT', [idn, new_word.sbj, new_word.vrb, new_word.obj, new_word.num, new_word.txt, whn],
+                    'FROM DUAL WHERE NOT EXISTS ('
+                        'SELECT 1 FROM ('
+                            'SELECT num, txt FROM', self.table,
+                            'WHERE sbj =', new_word.sbj,
+                            'AND vrb =', new_word.vrb,
+                            'AND obj =', new_word.obj,
+                            'ORDER BY idn DESC LIMIT 1'
+                        ') AS latest '
+                        'WHERE latest.num =', new_word.num,
+                        'AND CAST(latest.txt AS BINARY) = CAST(', new_word.txt, 'AS BINARY)'
+                    ')'
+                )
+                if row_count < 1:
+                    self.populate_word_from_sbj_vrb_obj(new_word, new_word.sbj, new_word.vrb, new_word.obj)
+                    # NOTE:  In the same transaction, so it's the word that stopped the INSERT.
+                self._commit()
+        if row_count < 1:
+            return False
+        new_word.set_idn_if_you_really_have_to(idn)
+        new_word.whn = whn
+        # noinspection PyProtectedMember
+        new_word._now_it_exists()
+        self._note_inserted_word(new_word)
+        return True
+
+    SENTENCE_LOCK_SECONDS = 30
+
+    @contextlib.contextmanager
+    def _lock_sentence(self, sbj, vrb, obj):
+        """
+        GET_LOCK() named for this table and sbj,vrb,obj, so other processes take turns.
+
+        Held by the connection from the caller's with self._connected(), past the commit,
+        because COMMIT doesn't release it.  RELEASE_LOCK() does, or the connection closing.
+        Works on any engine, unlike SELECT ... FOR UPDATE (e.g. MEMORY only locks whole tables).
+        """
+        key = b''.join([
+            self._table.encode('utf8'),
+            self.idn_ify(sbj).raw,
+            self.idn_ify(vrb).raw,
+            self.idn_ify(obj).raw,
+        ])
+        name = Text('qiki_' + hashlib.md5(key).hexdigest())   # GET_LOCK() names are up to 64 chars
+        (is_locked,) = self.super_select_one('SELECT GET_LOCK(', name, ',', self.SENTENCE_LOCK_SECONDS, ')')
+        if is_locked != 1:
+            raise self.QueryError("Waited too long for lock " + name)
+        try:
+            yield
+        finally:
+            self.super_select_one('SELECT RELEASE_LOCK(', name, ')')
 
-        Ironically, start a new transaction by ending the (apparently auto-started) old one.
+    def _start_transaction(self):
+        """
+        START TRANSACTION, on the connection held by the caller's with self._connected()
 
-        This prevents the following exception when multi-threaded requests generate new words:
-            mysql.connector.errors.ProgrammingError: Transaction already in progress
+        Connections autocommit, so reads don't leave a transaction open.
+        Any transaction left open, e.g. by an earlier step of the operation, is committed first.
         """
-        self._connection.commit()
-        # NOTE:  self._connection.start_transaction() generates:
-        #        ProgrammingError: Transaction already in progress
+        self._commit()
+        self._connection.start_transaction()
+
+    def _commit(self):
+        """Commit the transaction on this thread's connection, if there is one."""
+        if self._connection.in_transaction:
+            self._connection.commit()
 
     class Cursor(object):
-        def __init__(self, connection):
+        """
+        Prepared cursor for a connection.
+
+        Given a query (the very string object from _super_parse(), see execute() in
+        mysql.connector.cursor.MySQLCursorPrepared) the cursor comes from, and goes back to,
+        connection.qiki_prepared.  So the server-side statement is prepared once per connection.
+        """
+        def __init__(self, connection, query=None, lex=None):
             self.connection = connection
+            self.query = query
+            self.lex = lex
+            # noinspection PyProtectedMember
+            self.use_prepared = lex is None or not lex._client_binding
+            if query is not None and self.use_prepared:
+                self.prepared = getattr(connection, 'qiki_prepared', None)
+            else:
+                self.prepared = None
 
         def __enter__(self):
-            try:
+            self.the_cursor = None
+            if self.prepared is not None:
+                self.the_cursor = self.prepared.pop(self.query)
+                if self.lex is not None:
+                    self.lex._count_prepare(hit=self.the_cursor is not None)
+            if self.the_cursor is None and not self.use_prepared:
+                self.the_cursor = self.connection.cursor()
+            elif self.the_cursor is None:
                 self.the_cursor = self.connection.cursor(prepared=True)
                 # NOTE:  Exception here if we don't connect with use_pure=True:
                 #        NotImplementedError: Alternative: Use connection.MySQLCursorPrepared
-            except mysql.connector.OperationalError:
-                self.connection.connect()
-                self.the_cursor = self.connection.cursor(prepared=True)
+                # NOTE:  A connection that was lost, e.g. idle too long, is replaced by the pool.
             return self.the_cursor
 
         # noinspection PyUnusedLocal
         def __exit__(self, exc_type, exc_val, exc_tb):
+            if (
+                self.prepared is not None and
+                exc_type is None and
+                not getattr(self.connection, 'unread_result', True)
+            ):
+                for cursor_evicted in self.prepared.put(self.query, self.the_cursor):
+                    self._close(cursor_evicted)
+            else:
+                # NOTE:  A cursor with rows unread, e.g. super_select() abandoned, is not reused.
+                self._close(self.the_cursor)
+
+        @staticmethod
+        def _close(cursor):
             try:
-                self.the_cursor.close()
+                cursor.close()
             except mysql.connector.DatabaseError as e:
                 # NOTE:  Avoid this exception masking another, while a cursor is alive.
                 # EXAMPLE:  InternalError: Unread result found
@@ -2482,8 +3914,94 @@ class LexMySQL(LexSentence):
                 #           when selecting multiple rows.
                 print("Error closing cursor", str(e))
 
-    def _cursor(self):
-        return self.Cursor(self._connection)
+    @contextlib.contextmanager
+    def _cursor(self, query=None):
+        """Borrow a connection and open a cursor on it.  With a query, reuse its prepared statement."""
+        with self._connected() as connection:
+            with self.Cursor(connection, query, self) as cursor:
+                yield cursor
+
+    def _count_prepare(self, hit):
+        with self._shapes_lock:
+            if hit:
+                self._n_prepare_hits += 1
+            else:
+                self._n_prepare_misses += 1
+
+    @contextlib.contextmanager
+    def _connected(self):
+        """
+        Borrow a connection from the pool, for one operation by this thread.
+
+        Nested operations, e.g. a query inside an insert, use the same connection.
+        So several statements, and their commit, happen on one connection.
+        """
+        held = self._held
+        if getattr(held, 'depth', 0) == 0:
+            held.connection = self._pool.borrow()
+            held.failed = False
+        held.depth = getattr(held, 'depth', 0) + 1
+        try:
+            yield held.connection
+        except GeneratorExit:   # e.g. super_select() rows not all read
+            raise
+        except BaseException:
+            held.failed = True
+            raise
+        finally:
+            held.depth -= 1
+            if held.depth == 0:
+                connection = held.connection
+                held.connection = None
+                self._pool.give_back(connection, check=held.failed)
+
+    @contextlib.contextmanager
+    def _connected_apart(self):
+        """
+        Like _connected() but outside the transaction this thread is in, if any.
+
+        For statements that commit on their own, e.g. reserve_idns().
+        Inside a transaction, that borrows a second connection, so the pool lends this thread two.
+        """
+        held = self._held
+        connection = getattr(held, 'connection', None)
+        is_apart = connection is not None and connection.in_transaction
+        if is_apart:
+            saved = held.connection, held.depth, held.failed
+            held.connection, held.depth = None, 0
+        try:
+            with self._connected() as connection:
+                yield connection
+        finally:
+            if is_apart:
+                held.connection, held.depth, held.failed = saved
+
+    @property
+    def _connection(self):
+        """The connection this thread borrowed for the operation in progress.  See _connected()."""
+        connection = getattr(self._held, 'connection', None)
+        assert connection is not None, "Use self._connection only inside with self._connected()"
+        return connection
+
+    def pool_stats(self):
+        """Connection pool sizes and wait times, see ConnectionPool.stats()."""
+        return self._pool.stats()
+
+    def statement_stats(self):
+        """
+        How often queries were reused.
+
+        shape_hits - super_select() etc. calls that skipped building the query string
+        prepare_hits - statements executed without preparing them again
+        """
+        with self._shapes_lock:
+            return dict(
+                shape_hits=self._n_shape_hits,
+                shape_misses=self._n_shape_misses,
+                shapes_cached=len(self._shapes),
+                prepare_hits=self._n_prepare_hits,
+                prepare_misses=self._n_prepare_misses,
+            )
 
     def _simulate_connection_neglect(self):
         """
@@ -2495,16 +4013,17 @@ class LexMySQL(LexSentence):
         I originally thought this had something to do with the connection_timeout
         option aka socket.settimeout(), but it does not.
         """
-        self._connection.close()
+        # noinspection PyProtectedMember
+        self._pool._simulate_neglect()
 
-    def populate_word_from_idn(self, word, idn):
+    def _populate_word_from_idn(self, word, idn):
         rows = self.super_select(
             'SELECT * FROM', self.table,
             'WHERE idn =', idn
         )
         return self._populate_from_one_row(word, rows)
 
-    def populate_word_from_definition(self, word, define_txt):
+    def _populate_word_from_definition(self, word, define_txt):
         """Flesh out a word by its txt.  sbj=lex, vrb=define only."""
         rows = self.super_select(
             'SELECT * FROM', self.table, 'AS w '
@@ -2516,7 +4035,7 @@ class LexMySQL(LexSentence):
         )
         return self._populate_from_one_row(word, rows)
 
-    def populate_word_from_sbj_vrb_obj(self, word, sbj, vrb, obj):
+    def _populate_word_from_sbj_vrb_obj(self, word, sbj, vrb, obj):
         rows = self.super_select(
             'SELECT * FROM', self.table, 'AS w '
             'WHERE sbj =', sbj,
@@ -2526,7 +4045,7 @@ class LexMySQL(LexSentence):
         )
         return self._populate_from_one_row(word, rows)
 
-    def populate_word_from_sbj_vrb_obj_num_txt(self, word, sbj, vrb, obj, num, txt):
+    def _populate_word_from_sbj_vrb_obj_num_txt(self, word, sbj, vrb, obj, num, txt):
         rows = self.super_select(
             'SELECT * FROM', self.table, 'AS w '
             'WHERE sbj =', sbj,
@@ -2538,6 +4057,56 @@ class LexMySQL(LexSentence):
         )
         return self._populate_from_one_row(word, rows)
 
+    def populate_words(self, words):
+        """Make inchoate words choate, with one SELECT per MAX_ITERABLE different idns."""
+        inchoate_words = dict()   # idn.raw -> list of words with that idn
+        for word in words:
+            # noinspection PyProtectedMember
+            if (
+                word is not None and
+                word.lex is self and
+                word._is_inchoate and
+                not word.idn.is_suffixed() and
+                not word.idn.is_nan()
+            ):
+                inchoate_words.setdefault(word.idn.raw, []).append(word)
+        raws = list(inchoate_words.keys())
+        for i_chunk in range(0, len(raws), self.MAX_ITERABLE):
+            chunk_raws = raws[i_chunk : i_chunk + self.MAX_ITERABLE]
+            found_words = self.find_words(idn=[Number.from_raw(raw) for raw in chunk_raws])
+            for found_word in found_words:
+                for word in inchoate_words.pop(found_word.idn.raw, []):
+                    word.populate_from_word(found_word)
+        for nonexistent_words in inchoate_words.values():
+            for word in nonexistent_words:
+                word._fields = dict()   # Same as Word._choate() on a nonexistent word.
+
+    def _txts_by_idn(self, idns):
+        """Select only idn and txt, with one SELECT per MAX_ITERABLE idns."""
+        txts = dict()
+        for i_chunk in range(0, len(idns), self.MAX_ITERABLE):
+            chunk_idns = idns[i_chunk : i_chunk + self.MAX_ITERABLE]
+            rows = self.super_select_tuples(
+                'SELECT idn, txt FROM', self.table,
+                'WHERE idn IN (', chunk_idns, ')',
+                raw={'idn'}
+            )
+            for idn_raw, txt in rows:
+                txts[idn_raw] = txt
+        return txts
+
+    def _find_related_words(self, field, idns, vrbs):
+        """One SELECT per MAX_ITERABLE idns, e.g. WHERE obj IN (...)"""
+        related = dict()
+        for i_chunk in range(0, len(idns), self.MAX_ITERABLE):
+            chunk_related = super(LexMySQL, self)._find_related_words(
+                field,
+                idns[i_chunk : i_chunk + self.MAX_ITERABLE],
+                vrbs,
+            )
+            related.update(chunk_related)
+        return related
+
     @staticmethod
     def _populate_from_one_row(word, rows):
         # assert len(rows) in (0, 1), "Populating from unexpectedly {} rows.".format(len(rows))
@@ -2571,6 +4140,16 @@ class LexMySQL(LexSentence):
         jbo_ascending=True,
         jbo_vrb=(),
         jbo_strictly=False,
+        lazy_txt=False,
+        limit=None,
+        offset=0,
+        after_idn=None,
+        before_idn=None,
+        idn_range=None,
+        num_min=None,
+        num_max=None,
+        whn_after=None,
+        whn_before=None,
         debug=False
     ):
         # TODO:  Lex.find()  It should return inchoate words.
@@ -2612,6 +4191,23 @@ class LexMySQL(LexSentence):
 
         (note 1) If jbo_strictly is True, then jbo_vrb IS restrictive.
         and words are excluded that would otherwise have an empty jbo.
+
+        lazy_txt means leave out the txt column, e.g. for a listing of idns and nums.
+        When any found word first needs its txt, all the found words get theirs in one SELECT.
+        (The jbo words always come with their txt.)
+
+        limit and offset count found words (not jbo words), in the idn_ascending order.
+        after_idn and before_idn restrict idns, exclusively, for paging by the last idn seen.
+
+        idn_range=(idn_min, idn_max), num_min, num_max restrict inclusively.
+        whn_after, whn_before restrict exclusively.  Any of these can be None.
+        They're indexable range comparisons, because raw Numbers sort in numeric order.
+
+        EXAMPLE:  Ratings of 5 or more in the last hour
+            lex.find_words(vrb=rate, num_min=5, whn_after=time.time() - 3600)
+
+        EXAMPLE:  The newest 50 words after idn x
+            lex.find_words(after_idn=x, idn_ascending=False, limit=50)
         """
         if isinstance(jbo_vrb, (Word, Number)):
             jbo_vrb = (jbo_vrb,)
@@ -2624,8 +4220,31 @@ class LexMySQL(LexSentence):
         assert isinstance(txt, (Text,         type(None), type(''))) or is_iterable(txt)
         assert isinstance(jbo_vrb, (list, tuple, set)), "jbo_vrb is a " + type_name(jbo_vrb)
         assert hasattr(jbo_vrb, '__iter__')
+        assert limit is None or limit >= 0
+        assert offset >= 0
+        self.flush_behind()
         idn_order = 'ASC' if idn_ascending else 'DESC'
         jbo_order = 'ASC' if jbo_ascending else 'DESC'
+        if limit is not None:
+            limit_clause = ' LIMIT {offset:d},{limit:d}'.format(offset=int(offset), limit=int(limit))
+        elif offset > 0:
+            limit_clause = ' LIMIT {offset:d},18446744073709551615'.format(offset=int(offset))
+            # THANKS:  OFFSET without LIMIT, https://dev.mysql.com/doc/refman/en/select.html
+        else:
+            limit_clause = ''
+        where_args = ['WHERE TRUE', None]
+        where_args += self._and_clauses(
+            idn, sbj, vrb, obj, txt,
+            idn_range=idn_range,
+            num_min=num_min,
+            num_max=num_max,
+            whn_after=whn_after,
+            whn_before=whn_before,
+        )
+        if after_idn is not None:
+            where_args += ['AND w.idn >', self.idn_ify(after_idn)]
+        if before_idn is not None:
+            where_args += ['AND w.idn <', self.idn_ify(before_idn)]
         query_args = [
             'SELECT '
             'w.idn AS idn, '
@@ -2633,10 +4252,12 @@ class LexMySQL(LexSentence):
             'w.vrb AS vrb, '
             'w.obj AS obj, '
             'w.num AS num, '
-            'w.txt AS txt, '
-            'w.whn AS whn',
+            'w.whn AS whn' +
+            ('' if lazy_txt else ', w.txt AS txt'),
             None
         ]
+        # NOTE:  Columns in the order of Word.populate_from_fields(), which gets them as a tuple row.
+        n_word_columns = 6 if lazy_txt else 7
         if any(jbo_vrb):
             query_args += [
                 ', jbo.idn AS jbo_idn'
@@ -2644,11 +4265,26 @@ class LexMySQL(LexSentence):
                 ', jbo.vrb AS jbo_vrb'
                 ', jbo.obj AS jbo_obj'
                 ', jbo.num AS jbo_num'
-                ', jbo.txt AS jbo_txt'
-                ', jbo.whn AS jbo_whn',
+                ', jbo.whn AS jbo_whn'
+                ', jbo.txt AS jbo_txt',
                 None
             ]
-        query_args += 'FROM', self.table, 'AS w', None,
+        if any(jbo_vrb) and limit_clause:
+            # NOTE:  LIMIT the words before the JOIN, so it doesn't count jbo rows.
+            query_args += ['FROM (SELECT * FROM', self.table, 'AS w', None]
+            query_args += where_args
+            if jbo_strictly:
+                query_args += [
+                    'AND EXISTS (SELECT 1 FROM', self.table, 'AS j ' +
+                        'WHERE j.obj = w.idn ' +
+                            'AND j.vrb in (', jbo_vrb, '))',
+                    None
+                ]
+            query_args += ['ORDER BY w.idn ' + idn_order + limit_clause + ') AS w', None]
+            where_args = []
+            limit_clause = ''
+        else:
+            query_args += 'FROM', self.table, 'AS w', None,
         if any(jbo_vrb):
             join = 'JOIN' if jbo_strictly else 'LEFT JOIN'
             query_args += [
@@ -2658,22 +4294,21 @@ class LexMySQL(LexSentence):
                 None
             ]
 
-        query_args += ['WHERE TRUE', None]
-        query_args += self._and_clauses(idn, sbj, vrb, obj, txt)
+        query_args += where_args
 
         order_clause = 'ORDER BY w.idn ' + idn_order
         if any(jbo_vrb):
             order_clause += ', jbo.idn ' + jbo_order
-        query_args += [order_clause]
+        query_args += [order_clause + limit_clause]
 
-        rows = self.super_select(*query_args, debug=debug)
+        rows = self.super_select_tuples(*query_args, debug=debug)
 
         words = []
         word = None
         for row in rows:
-            if word is None or row['idn'] != word.idn:
+            if word is None or row[0] != word.idn:
                 word = self[None]
-                word.populate_from_row(row)
+                word.populate_from_fields(*row[:n_word_columns])
                 # NOTE:  This violates the singleton lex object idea!
                 word.jbo = []
                 words.append(word)   # To be continued, we may append to word.jbo later.
@@ -2683,13 +4318,110 @@ class LexMySQL(LexSentence):
                 # But wait a minute, who's to say an object cannot be modified after yielded?
                 # It could, but that could lead to ferociously complicated bugs!
                 # Upshot:  append not yield
-            jbo_idn = row.get('jbo_idn', None)
-            if jbo_idn is not None:
+            jbo_fields = row[n_word_columns:]
+            if jbo_fields and jbo_fields[0] is not None:
                 new_jbo = self[None]
-                new_jbo.populate_from_row(row, prefix='jbo_')
+                new_jbo.populate_from_fields(*jbo_fields)
                 word.jbo.append(new_jbo)
+        self._found_together(words)
+        if lazy_txt:
+            self._defer_txt(words)
         return words
 
+    AGGREGATE_SQL_MEASURES = ('count', 'count_sbj', 'min_num', 'max_num')
+
+    def _aggregate(self, group_by, measures, order_by, limit, filters):
+        """
+        GROUP BY queries, one for the SQL aggregate functions, and one for each kind of sum.
+
+        Raw Numbers can be compared but not added in SQL.  So the sums are grouped by num too,
+        and Python adds up each distinct num times its count.  That's few rows for e.g. ratings.
+
+        Ordering by one of the AGGREGATE_SQL_MEASURES (or by group) with a limit,
+        the first query picks the top groups with ORDER BY and LIMIT.
+        Then the sums are only for those groups.
+        """
+        where_args = ['WHERE TRUE', None]
+        where_args += self._and_clauses(
+            filters.pop('idn'),
+            filters.pop('sbj'),
+            filters.pop('vrb'),
+            filters.pop('obj'),
+            filters.pop('txt'),
+            **filters
+        )
+        group_column = '' if group_by is None else 'w.{name} AS grp, '.format(name=group_by)
+        group_by_clause = '' if group_by is None else 'GROUP BY w.{name}'.format(name=group_by)
+        is_sql_measured = bool(set(measures) & set(self.AGGREGATE_SQL_MEASURES))
+        is_limited_in_sql = (
+            is_sql_measured and
+            group_by is not None and
+            limit is not None and
+            limit <= self.MAX_ITERABLE and
+            (order_by is None or order_by in self.AGGREGATE_SQL_MEASURES)
+        )
+        if is_limited_in_sql:
+            group_by_clause += ' ORDER BY {order}grp LIMIT {limit:d}'.format(
+                order='' if order_by is None else '`{measure}` DESC, '.format(measure=order_by),
+                limit=int(limit),
+            )
+            # NOTE:  Ties in group order, same as aggregate() sorts them.
+        tallies = dict()
+
+        def tally_of(row):
+            key = row.get('grp', None)
+            raw = None if key is None else key.raw
+            try:
+                return tallies[raw]
+            except KeyError:
+                tally = tallies[raw] = dict()
+                if group_by is not None:
+                    tally[group_by] = key
+                return tally
+
+        if is_sql_measured:
+            for row in self.super_select(
+                'SELECT ' + group_column +
+                'COUNT(*) AS count, '
+                'COUNT(DISTINCT w.sbj) AS count_sbj, '
+                'MIN(w.num) AS min_num, '
+                'MAX(w.num) AS max_num '
+                'FROM', self.table, 'AS w', None,
+                *(where_args + [group_by_clause])
+            ):
+                if row['count'] > 0:   # Without GROUP BY there's a row even if no words.
+                    tally = tally_of(row)
+                    for measure in self.AGGREGATE_SQL_MEASURES:
+                        if measure in measures:
+                            tally[measure] = row[measure]
+            if is_limited_in_sql and set(measures) & {'sum_num', 'latest_per_sbj'}:
+                if not tallies:
+                    return []
+                top_groups = dict(idn=None, sbj=None, vrb=None, obj=None, txt=None)
+                top_groups[group_by] = [tally[group_by] for tally in tallies.values()]
+                where_args += self._and_clauses(**top_groups)
+
+        def sum_of_distinct_nums(measure, from_args):
+            for tally in tallies.values():
+                tally[measure] = Number(0)
+            for row in self.super_select(*(from_args + [
+                'GROUP BY ' + ('' if group_by is None else 'w.{name}, '.format(name=group_by)) + 'w.num'
+            ])):
+                tally = tally_of(row)
+                tally[measure] = tally.get(measure, Number(0)) + row['num'] * row['n']
+
+        select_grouped_nums = 'SELECT ' + group_column + 'w.num AS num, COUNT(*) AS n FROM'
+        if 'sum_num' in measures:
+            sum_of_distinct_nums('sum_num', [select_grouped_nums, self.table, 'AS w', None] + where_args)
+        if 'latest_per_sbj' in measures:
+            sum_of_distinct_nums('latest_per_sbj', (
+                [select_grouped_nums, self.table, 'AS w JOIN (SELECT MAX(w.idn) AS latest_idn FROM', self.table, 'AS w', None] +
+                where_args +
+                ['GROUP BY ' + ('' if group_by is None else 'w.{name}, '.format(name=group_by)) + 'w.sbj' +
+                 ') AS latest ON w.idn = latest.latest_idn', None]
+            ))
+        return list(tallies.values())
+
     # def find_idns(self, idn=None, sbj=None, vrb=None, obj=None, idn_order='ASC'):
     #     """
     #     Select word identifiers by subject, verb, and/or object.
@@ -2709,7 +4441,14 @@ class LexMySQL(LexSentence):
         """find_words() can take iterables, but not too big."""
 
     # @staticmethod
-    def _and_clauses(self, idn, sbj, vrb, obj, txt):
+    def _and_clauses(
+        self, idn, sbj, vrb, obj, txt,
+        idn_range=None,
+        num_min=None,
+        num_max=None,
+        whn_after=None,
+        whn_before=None,
+    ):
         assert isinstance(idn, (Number, Word, type(None),         )) or is_iterable(idn)
         assert isinstance(sbj, (Number, Word, type(None), type(''))) or is_iterable(sbj)
         assert isinstance(vrb, (Number, Word, type(None), type(''))) or is_iterable(vrb)
@@ -2762,6 +4501,14 @@ class LexMySQL(LexSentence):
                     yield ')'
                     yield None
 
+        def range_clause(value, name, operator):
+            """EXAMPLE:  ['AND w.num >=', Number(5)] == list(range_clause(5, 'num', '>='))"""
+            if value is not None:
+                yield 'AND w.{name} {operator}'.format(name=name, operator=operator)
+                yield Number(value)
+
+        idn_min, idn_max = (None, None) if idn_range is None else idn_range
+
         query_args = []
 
         query_args += list(clause(idn, 'idn', lambda x: self.idn_ify(x)))
@@ -2769,6 +4516,12 @@ class LexMySQL(LexSentence):
         query_args += list(clause(vrb, 'vrb', lambda x: self.idn_ify(x)))
         query_args += list(clause(obj, 'obj', lambda x: self.idn_ify(x)))
         query_args += list(clause(txt, 'txt', lambda x: Text(x)))
+        query_args += list(range_clause(None if idn_min is None else self.idn_ify(idn_min), 'idn', '>='))
+        query_args += list(range_clause(None if idn_max is None else self.idn_ify(idn_max), 'idn', '<='))
+        query_args += list(range_clause(num_min,    'num', '>='))
+        query_args += list(range_clause(num_max,    'num', '<='))
+        query_args += list(range_clause(whn_after,  'whn', '>'))
+        query_args += list(range_clause(whn_before, 'whn', '<'))
         return query_args
 
     def server_version(self):
@@ -2781,7 +4534,7 @@ class LexMySQL(LexSentence):
         Unlike super_select() this does not convert the returned row to Number, Text.
         """
         query, parameters = self._super_parse(*query_args, **kwargs)
-        with self._cursor() as cursor:
+        with self._cursor(query) as cursor:
             self._execute(cursor, query, parameters)
             return cursor.fetchone()
 
@@ -2798,10 +4551,17 @@ class LexMySQL(LexSentence):
         Returns last inserted id (as qiki Number) if INSERT and auto_increment.
         """
         query, parameters = self._super_parse(*query_args, **kwargs)
-        with self._cursor() as cursor:
+        with self._cursor(query) as cursor:
             self._execute(cursor, query, parameters)
             return Number(cursor.lastrowid)
 
+    def super_query_row_count(self, *query_args, **kwargs):
+        """Non-SELECT SQL statement, e.g. a conditional INSERT.  Returns the number of rows affected."""
+        query, parameters = self._super_parse(*query_args, **kwargs)
+        with self._cursor(query) as cursor:
+            self._execute(cursor, query, parameters)
+            return cursor.rowcount
+
     def super_select(self, *query_args, **kwargs):
         """
         SQL statement that generates rows.  Alternate syntax with data or symbol.
@@ -2816,24 +4576,110 @@ class LexMySQL(LexSentence):
         :param kwargs: - e.g. debug=True
         :return: - generator yielding row-dictionaries
         """
+        for column_names, values in self._decoded_rows(query_args, kwargs):
+            yield dict(zip(column_names, values))
+
+    def super_select_tuples(self, *query_args, **kwargs):
+        """
+        Like super_select() but rows are tuples, in the order of the SELECT columns.
+
+        raw=True leaves all the columns undecoded, as binary strings, e.g. for callers
+        that only need idns.  Or raw can be a collection of the names of columns to leave so.
+        Other kwargs are like super_select(), e.g. debug=True
+
+        EXAMPLE:
+            for idn_raw, txt in super_select_tuples('SELECT idn, txt FROM', table, raw={'idn'}):
+        """
+        for _, values in self._decoded_rows(query_args, kwargs):
+            yield values
+
+    def _decoded_rows(self, query_args, kwargs):
+        """Generate (column_names, values) for each row.  Plan the decoding once, on the first row."""
+        raw = kwargs.pop('raw', False)
         debug = kwargs.get('debug', False)
         query, parameters = self._super_parse(*query_args, **kwargs)
-        with self._cursor() as cursor:
+        with self._cursor(query) as cursor:
             self._execute(cursor, query, parameters)
+            decode = None
+            column_names = None
             for row in cursor:
-                field_dictionary = dict()
-                if debug:  print(end='\t')
-                for field, name in zip(row, cursor.column_names):
-                    if field is None:
-                        value = None
-                    elif name.endswith('txt'):   # including jbo_txt
-                        value = self.text_from_mysql(field)
-                    else:
-                        value = self.number_from_mysql(field)
-                    field_dictionary[name] = value
-                    if debug:  print(name, repr(value), end='; ')
-                yield field_dictionary
-                if debug:  print()
+                if decode is None:
+                    column_names = tuple(cursor.column_names)
+                    column_types = tuple(description[1] for description in cursor.description)
+                    decode = self._row_decoder(column_names, row, raw, column_types)
+                values = decode(row)
+                if debug:
+                    print(end='\t')
+                    for name, value in zip(column_names, values):
+                        print(name, repr(value), end='; ')
+                    print()
+                yield column_names, values
+
+    def _row_decoder(self, column_names, first_row, raw=False, column_types=None):
+        """
+        Function to convert row tuples to Number, Text, int, or None -- or raw binary strings.
+
+        The converter for each column is chosen once, by its name and the type of its first cell,
+        instead of again for every cell.  A column whose first cell is NULL goes by its
+        column_types entry instead, a mysql.connector.FieldType, or None if unknown.
+        """
+        if column_types is None:
+            column_types = (None,) * len(column_names)
+        converters = tuple(
+            self._cell_converter(name, cell, raw is True or bool(raw and name in raw), column_type)
+            for name, cell, column_type in zip(column_names, first_row, column_types)
+        )
+
+        def decode(row):
+            return tuple(
+                None if cell is None else convert(cell)
+                for convert, cell in zip(converters, row)
+            )
+        return decode
+
+    def _cell_converter(self, name, cell, raw, column_type=None):
+        """Function to convert cells like this one, from a column with this name."""
+        if cell is None:
+            # NOTE:  e.g. LEFT JOIN jbo_ columns.  No cell to go by, so go by the column type.
+            return self._column_converter(name, raw, column_type)
+        elif isinstance(cell, six.integer_types):   # e.g. COUNT(*)
+            return lambda c: c
+        elif isinstance(cell, six.text_type):
+            # NOTE:  HORRIBLE_MYSQL_CONNECTOR_WORKAROUND latin1 strings, or a 2.2.2b1 connector.
+            if raw:
+                return lambda c: c.encode('latin1')
+            elif name.endswith('txt'):   # including jbo_txt
+                return self.text_from_mysql
+            else:
+                return lambda c: Number.from_raw(c.encode('latin1'))
+        else:
+            if raw:
+                return six.binary_type
+            elif name.endswith('txt'):
+                return Text.decode_if_you_must
+            elif isinstance(cell, six.binary_type):
+                return Number.from_raw
+            else:
+                return Number.from_raw_bytearray
+
+    _NUMBER_FIELD_TYPES = frozenset(mysql.connector.FieldType.get_number_types())
+
+    def _column_converter(self, name, raw, column_type):
+        """
+        Function to convert any cell from a column of this name and type.  For NULL first cells.
+
+        A string column's cells could come as any of the string types, depending on the connector.
+        So convert each by a converter for its type, chosen here once for all of them.
+        """
+        if column_type in self._NUMBER_FIELD_TYPES:
+            return lambda c: c
+        converters = dict(
+            (cell_type, self._cell_converter(name, cell_type(), raw))
+            for cell_type in (six.text_type, six.binary_type, bytearray)
+        )
+        for integer_type in six.integer_types:   # column_type unknown
+            converters[integer_type] = lambda c: c
+        return lambda c: converters[type(c)](c)
 
     def _execute(self, cursor, query, parameters=()):
         """
@@ -2896,6 +4742,10 @@ class LexMySQL(LexSentence):
 
         Return a tuple of the two parameters for cursor.execute(),
         Namely (query, parameters) where query is a string with ? placeholders.
+
+        Queries are remembered by their shape, see _super_shape().
+        The same shape gets the same query string object, so the connection's
+        prepared statement for it can be reused, see LexMySQL.Cursor.
         """
         # TODO:  Recursive query_args?
         # So super_select(*args) === super_select(args) === super_select([args]) etc.
@@ -2903,7 +4753,118 @@ class LexMySQL(LexSentence):
         # Instead of                 super_select('SELECT +', None, 'FROM table')
 
         debug = kwargs.pop('debug', False)
-        query = ''
+        shape, parameters = self._super_shape(query_args)
+        compiled = None
+        if shape is not None:
+            with self._shapes_lock:
+                compiled = self._shapes.get(shape)
+                if compiled is None:
+                    self._n_shape_misses += 1
+                else:
+                    self._n_shape_hits += 1
+        if compiled is None:
+            query, parameters, pieces = self._super_compile(query_args)
+            compiled = query, pieces
+            if shape is not None:
+                with self._shapes_lock:
+                    compiled_other_thread = self._shapes.get(shape)
+                    if compiled_other_thread is None:
+                        self._shapes.put(shape, compiled)
+                    else:
+                        compiled = compiled_other_thread
+        query, pieces = compiled
+        if self._client_binding:
+            query, parameters = self._bind(pieces, parameters), []
+        if debug:
+            print("Query", query)
+            print("Parameters", ", ".join([repr(parameter) for parameter in parameters]))
+        return query, parameters
+
+    def _bind(self, pieces, parameters):
+        """
+        Put the parameters into the query, for a connector without prepared statements.
+
+        Every string is a hexadecimal literal, so no escaping can go wrong.  For VARBINARY
+        (e.g. raw Numbers) that's X'...' and for txt it gets a character set introducer,
+        so it compares with the column's collation, just as a parameter would.
+        """
+        assert len(pieces) == len(parameters) + 1
+        parts = [pieces[0]]
+        for parameter, piece in zip(parameters, pieces[1:]):
+            parts.append(self._sql_literal(parameter))
+            parts.append(piece)
+        return ''.join(parts)
+
+    @classmethod
+    def _sql_literal(cls, parameter):
+        """SQL for one data parameter, from _super_shape() or _super_compile()."""
+        if parameter is None:
+            return 'NULL'
+        elif isinstance(parameter, bool):
+            return '1' if parameter else '0'
+        elif isinstance(parameter, six.integer_types):
+            return str(int(parameter))
+        elif isinstance(parameter, (six.binary_type, bytearray)):
+            return "X'" + binascii.hexlify(parameter).decode('ascii') + "'"
+        elif isinstance(parameter, six.text_type):
+            # NOTE:  A string from mysql_from_text().
+            if HORRIBLE_MYSQL_CONNECTOR_WORKAROUND:
+                return "_latin1 X'" + binascii.hexlify(parameter.encode('latin1')).decode('ascii') + "'"
+            else:
+                return "_utf8mb4 X'" + binascii.hexlify(parameter.encode('utf8')).decode('ascii') + "'"
+        else:
+            raise cls.SuperSelectTypeError("Cannot bind a " + type_name(parameter))
+
+    _SHAPE_PARAMETER = ('?',)
+
+    def _super_shape(self, query_args):
+        """
+        The shape of a super query, and its parameters.
+
+        The shape is a key for the query string _super_compile() would build.
+        It has the plain strings and identifiers, but for data only a placeholder,
+        or for a list, how long it is.
+
+        Return (None, None) for anything unusual.  Let _super_compile() explain what's wrong.
+        """
+        shape = []
+        parameters = []
+        for query_arg in query_args:
+            if isinstance(query_arg, Text):
+                shape.append(self._SHAPE_PARAMETER)
+                parameters.append(self.mysql_from_text(query_arg))
+            elif isinstance(query_arg, self.SuperIdentifier):
+                shape.append(('`', six.text_type(query_arg)))
+            elif isinstance(query_arg, six.string_types):
+                shape.append(query_arg)
+            elif isinstance(query_arg, Number):
+                shape.append(self._SHAPE_PARAMETER)
+                parameters.append(query_arg.raw)
+            elif isinstance(query_arg, int):
+                shape.append(self._SHAPE_PARAMETER)
+                parameters.append(query_arg)
+            elif isinstance(query_arg, Word):
+                shape.append(self._SHAPE_PARAMETER)
+                parameters.append(query_arg.idn.raw)
+            elif is_iterable(query_arg):
+                try:
+                    parameters += self._parametric_forms(query_arg)
+                except TypeError:
+                    return None, None
+                shape.append(('?', len(query_arg)))
+            elif query_arg is None:
+                shape.append(None)
+            else:
+                return None, None
+        return tuple(shape), parameters
+
+    def _super_compile(self, query_args):
+        """
+        Build the query string and parameters the long way, checking for mistakes.
+
+        Return (query, parameters, pieces) where pieces are the parts of query between placeholders.
+        """
+        pieces = ['']
         parameters = []
         for index, (arg_previous, arg_next) in enumerate(zip(query_args[:-1], query_args[1:])):
             if (
@@ -2936,28 +4897,31 @@ class LexMySQL(LexSentence):
                 #        that are not parameters.
         for index_zero_based, query_arg in enumerate(query_args):
             if isinstance(query_arg, Text):
-                query += '?'
+                pieces.append('')
                 parameters.append(self.mysql_from_text(query_arg))
             elif isinstance(query_arg, self.SuperIdentifier):
-                query += '`' + six.text_type(query_arg) + '`'
+                pieces[-1] += '`' + six.text_type(query_arg) + '`'
             elif isinstance(query_arg, six.string_types):
                 # NOTE:  Must come after Text and Lex.SuperIdentifier tests.
-                query += query_arg
+                pieces[-1] += query_arg
             elif isinstance(query_arg, Number):
-                query += '?'
+                pieces.append('')
                 parameters.append(query_arg.raw)
             elif isinstance(query_arg, int):
-                query += '?'
+                pieces.append('')
                 parameters.append(query_arg)
             elif isinstance(query_arg, Word):
-                query += '?'
+                pieces.append('')
                 parameters.append(query_arg.idn.raw)
             # elif isinstance(query_arg, (list, tuple, set)):
             # TODO:  Dictionary for INSERT or UPDATE syntax SET c=z, c=z, c=z, ...
             elif is_iterable(query_arg):
                 # TODO:  query_arg should probably be passed through list() here, so
                 #        that a generated iterable could be supported.
-                query += ','.join(['?']*len(query_arg))
+                for index_placeholder in range(len(query_arg)):
+                    if index_placeholder > 0:
+                        pieces[-1] += ','
+                    pieces.append('')
                 try:
                     parameters += self._parametric_forms(query_arg)
                 except TypeError as e:
@@ -2985,11 +4949,8 @@ class LexMySQL(LexSentence):
                         type=type_name(query_arg)
                     )
                 )
-            query += ' '
-        if debug:
-            print("Query", query)
-            print("Parameters", ", ".join([repr(parameter) for parameter in parameters]))
-        return query, parameters
+            pieces[-1] += ' '
+        return '?'.join(pieces), parameters, pieces
 
     class SuperSelectTypeError(TypeError):
         """super_select() or super_query() cannot parse this type."""
@@ -3064,6 +5025,53 @@ class LexMySQL(LexSentence):
         assert return_value.is_whole()
         return return_value
 
+    def reserve_idns(self, n):
+        """
+        Reserve idns from a one-row sequence table.  No MAX(idn) scan, no process-global lock.
+
+        LAST_INSERT_ID(expr) makes the UPDATE and the read atomic for this connection.
+        The connection autocommits, apart from any transaction this thread is in,
+        so other processes are not blocked on the row, and a rollback can't undo the reservation.
+        """
+        if not self._idn_table_installed:
+            self._catch_up_idns()
+        with self._connected_apart():
+            self.super_query(
+                'UPDATE', self.idn_table,
+                'SET next_idn = LAST_INSERT_ID(next_idn +', n, ') WHERE id = 1'
+            )
+            (end_idn,) = self.super_select_one('SELECT LAST_INSERT_ID()')
+        return Number(int(end_idn) - n)
+
+    _idn_table_installed = False
+
+    def _catch_up_idns(self):
+        """
+        Create the sequence table if it's not there.  Move it past the highest idn.
+
+        E.g. words were inserted with MAX(idn) + 1, before use_idn_allocator(), or by another process.
+        """
+        if not re.match(self._ENGINE_NAME_VALIDITY, self._engine):
+            raise self.IllegalEngineName("Not a valid engine name: " + repr(self._engine))
+        with self._connected_apart():
+            if not self._idn_table_installed:
+                self.super_query(
+                    'CREATE TABLE IF NOT EXISTS', self.idn_table,
+                    '(`id` TINYINT NOT NULL, `next_idn` BIGINT NOT NULL, PRIMARY KEY (`id`)) '
+                    'ENGINE = ' + self._engine
+                )
+            after_max_idn = int(self.max_idn()) + 1
+            self.super_query(
+                'INSERT INTO', self.idn_table, '(id, next_idn) VALUES (1,', after_max_idn,
+                ') ON DUPLICATE KEY UPDATE next_idn = GREATEST(next_idn,', after_max_idn, ')'
+            )
+        self._idn_table_installed = True
+
+    @property
+    def idn_table(self):
+        """Sequence table for reserve_idns().  Named after the word table."""
+        return self.TableName(self.table + '_idn')
+
     @property
     def table(self):
         """For super_select() and for continuous validation of table name."""
@@ -3081,6 +5089,750 @@ class LexMySQL(LexSentence):
         pass
 
 
+class BloomFilter(object):
+    """
+    Probabilistic set of byte strings.  No false negatives, a few false positives.
+
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.add(b'spam')
+    assert b'spam' in bloom      # always
+    assert b'eggs' not in bloom  # probably
+
+    SEE:  Bloom filter, https://en.wikipedia.org/wiki/Bloom_filter
+    """
+    def __init__(self, capacity, error_rate=0.01):
+        assert capacity > 0
+        assert 0.0 < error_rate < 1.0
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _bit_indexes(self, key):
+        """Double hashing, k indexes from two 64-bit halves of one digest."""
+        digest = hashlib.md5(key).digest()
+        h1, h2 = struct.unpack('>QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key):
+        for index in self._bit_indexes(key):
+            self.bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        for index in self._bit_indexes(key):
+            if not self.bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def false_positive_rate(self):
+        """Expected rate of false positives, given how many keys were added so far."""
+        fraction_of_bits_clear = math.exp(-self.num_hashes * self.count / self.num_bits)
+        return (1.0 - fraction_of_bits_clear) ** self.num_hashes
+
+
+class MembershipFilter(BloomFilter):
+    """Bloom filter of the idns, names, and s,v,o triples of the words in a lex."""
+
+    def add_word(self, word, is_definition):
+        self.add(self._idn_key(word.idn))
+        self.add(self._sbj_vrb_obj_key(word.sbj.idn, word.vrb.idn, word.obj.idn))
+        if is_definition:
+            self.add(self._name_key(word.txt))
+
+    def might_have_idn(self, idn):
+        return self._idn_key(idn) in self
+
+    def might_have_name(self, txt):
+        return self._name_key(txt) in self
+
+    def might_have_sbj_vrb_obj(self, sbj_idn, vrb_idn, obj_idn):
+        return self._sbj_vrb_obj_key(sbj_idn, vrb_idn, obj_idn) in self
+
+    @staticmethod
+    def _idn_key(idn):
+        return b'i' + idn.raw
+
+    @staticmethod
+    def _name_key(txt):
+        return b't' + Text(txt).utf8()
+
+    @staticmethod
+    def _sbj_vrb_obj_key(sbj_idn, vrb_idn, obj_idn):
+        return b's' + b''.join(
+            struct.pack('>H', len(idn.raw)) + idn.raw for idn in (sbj_idn, vrb_idn, obj_idn)
+        )
+
+
+class IdnBlockAllocator(object):
+    """
+    Hand out new idns from blocks reserved with lex.reserve_idns().  Aka hi/lo allocation.
+
+    block_size=1 reserves every idn from the lex, e.g. a sequence table in LexMySQL.
+    Bigger blocks mean fewer round trips, but the idns from different processes interleave,
+    so idn order is only roughly whn order.  Idns left in a block when a process ends are skipped.
+    A new block that continues the old one extends it, so bulk inserts stay contiguous.
+    """
+    def __init__(self, lex, block_size=1):
+        assert block_size >= 1
+        self.lex = lex
+        self.block_size = block_size
+        self.lock = threading.Lock()
+        self._next = 0
+        self._end = 0
+
+    def discard_block(self):
+        """Reserve a new block next time, e.g. the idns left in this one were inserted meanwhile."""
+        with self.lock:
+            self._next = 0
+            self._end = 0
+
+    def allocate(self, n=1):
+        """The first of n new contiguous idns.  Call with self.lock held."""
+        while self._next + n > self._end:
+            n_reserve = max(n - (self._end - self._next), self.block_size)
+            first_reserved = int(self.lex.reserve_idns(n_reserve))
+            if first_reserved != self._end:
+                self._next = first_reserved   # Not contiguous, so skip what's left of the old block.
+            self._end = first_reserved + n_reserve
+        first = self._next
+        self._next += n
+        return Number(first)
+
+
+class ConnectionPool(object):
+    """
+    A bounded pool of database connections, each lent to one thread at a time.  Made by LexMySQL().
+
+    Connections are made when needed, up to size of them.  When they're all lent out,
+    borrow() waits up to timeout seconds for one to come back, then raises ConnectionPool.Timeout.
+    A connection older than max_lifetime seconds is closed and replaced when it comes up.
+    A connection idle more than ping_seconds is pinged before it's lent, and replaced if it's dead.
+    So is one given back after an error.
+
+    :param connect: - function that makes a new connection
+    """
+    def __init__(self, connect, size=5, timeout=30.0, max_lifetime=3600.0, ping_seconds=10.0):
+        assert size >= 1
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_seconds = ping_seconds
+        self._condition = threading.Condition()
+        self._idle = []   # [connection, t_created, t_last_used] most recently used last
+        self._lent = dict()   # same, by id(connection)
+        self._n_open = 0
+        self._closed = False
+        self._n_borrows = 0
+        self._n_waits = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._n_created = 0
+        self._n_recycled = 0
+        self._n_replaced = 0
+
+    class Timeout(Exception):
+        """All the connections were busy for too long."""
+
+    class Closed(Exception):
+        """The pool was closed, e.g. by lex.disconnect()."""
+
+    def borrow(self):
+        t_start = time.time()
+        did_wait = False
+        entry = None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise self.Closed("Connection pool is closed.")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._n_open < self.size:
+                    self._n_open += 1
+                    break
+                seconds_left = self.timeout - (time.time() - t_start)
+                if seconds_left <= 0:
+                    raise self.Timeout("All {n} connections busy for {s:.1f} seconds.".format(
+                        n=self.size,
+                        s=self.timeout,
+                    ))
+                did_wait = True
+                self._condition.wait(seconds_left)
+            self._n_borrows += 1
+            if did_wait:
+                wait_seconds = time.time() - t_start
+                self._n_waits += 1
+                self._wait_seconds += wait_seconds
+                self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+        try:
+            entry = self._healthy(entry)
+        except BaseException:
+            with self._condition:
+                self._n_open -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._lent[id(entry[0])] = entry
+        return entry[0]
+
+    def _healthy(self, entry):
+        """
+        A live connection, this one or a new one.
+
+        Connecting, pinging and closing happen outside the lock.  Only the counting is locked.
+        """
+        now = time.time()
+        if entry is not None and now - entry[1] > self.max_lifetime:
+            self._close(entry[0])
+            with self._condition:
+                self._n_recycled += 1
+            entry = None
+        elif entry is not None and now - entry[2] > self.ping_seconds and not entry[0].is_connected():
+            self._close(entry[0])
+            with self._condition:
+                self._n_replaced += 1
+            entry = None
+        if entry is None:
+            entry = [self._connect(), now, now]
+            with self._condition:
+                self._n_created += 1
+        return entry
+
+    def give_back(self, connection, check=False):
+        """
+        Return a borrowed connection.  End whatever transaction it was in.
+
+        :param check: - True if something went wrong, so see if the connection still works.
+        """
+        with self._condition:
+            entry = self._lent.pop(id(connection))
+        is_usable = not check or connection.is_connected()
+        if is_usable and getattr(connection, 'in_transaction', True):
+            try:
+                connection.rollback()   # Nothing's left to commit.  This renews the read snapshot.
+            except Exception:
+                is_usable = False
+        with self._condition:
+            if is_usable and not self._closed:
+                entry[2] = time.time()
+                self._idle.append(entry)
+            else:
+                self._n_open -= 1
+                self._close(connection)
+            self._condition.notify()
+
+    def close(self):
+        """Close the idle connections now, and the lent ones when they come back."""
+        with self._condition:
+            self._closed = True
+            for connection, _, _ in self._idle:
+                self._n_open -= 1
+                self._close(connection)
+            self._idle = []
+            self._condition.notify_all()
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.close()
+        except Exception:
+            """Not a problem if it was closed already."""
+
+    def stats(self):
+        with self._condition:
+            return dict(
+                size=self.size,
+                n_open=self._n_open,
+                n_idle=len(self._idle),
+                n_borrows=self._n_borrows,
+                n_waits=self._n_waits,
+                wait_seconds=self._wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+                n_created=self._n_created,
+                n_recycled=self._n_recycled,
+                n_replaced=self._n_replaced,
+            )
+
+    def _simulate_neglect(self):
+        """For testing, close the idle connections, as if the server dropped them for being idle."""
+        with self._condition:
+            for entry in self._idle:
+                self._close(entry[0])
+                entry[2] -= self.ping_seconds + 1.0
+
+
+class StatementCache(object):
+    """
+    Least recently used mapping, holding up to size entries.  Made by LexMySQL().
+
+    Remembers query shapes (see LexMySQL._super_parse()) and,
+    for each connection, prepared cursors by their query.
+    Values pushed out by put() are returned, so the caller can close them.
+    Not thread-safe, the caller locks if it needs to.
+    """
+    def __init__(self, size):
+        assert size >= 1
+        self.size = size
+        self._entries = collections.OrderedDict()   # least recently used first
+
+    def get(self, key, default=None):
+        """Value for key, now the most recently used.  Or default."""
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            return default
+        self._entries[key] = value
+        return value
+
+    def pop(self, key, default=None):
+        """Take the value out, e.g. a cursor while it's in use."""
+        return self._entries.pop(key, default)
+
+    def put(self, key, value):
+        """Remember the value.  Return a list of the values it pushed out."""
+        evicted = []
+        old_value = self._entries.pop(key, None)
+        if old_value is not None and old_value is not value:
+            evicted.append(old_value)
+        self._entries[key] = value
+        while len(self._entries) > self.size:
+            _, oldest_value = self._entries.popitem(last=False)
+            evicted.append(oldest_value)
+        return evicted
+
+    def pop_all(self):
+        """Forget everything.  Return a list of the values."""
+        values = list(self._entries.values())
+        self._entries.clear()
+        return values
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class WhnClock(object):
+    """
+    Source of whn values:  seconds since 1970 UTC, never decreasing.
+
+    The wall clock is read once, then a monotonic clock measures time since then.
+    So setting the system clock back won't make whn go backwards.
+    (It won't make it go forward either.  A time change requires a new clock, e.g. a restart.)
+
+    unique=True makes every whn bigger than the one before, by at least resolution seconds.
+
+    EXAMPLE:
+        lex.whn_clock = WhnClock(unique=True)
+
+    A replacement clock that starts behind the old one makes whn go backwards in that lex.
+    LexInMemory then stops bisecting by whn, and checks every word's whn instead.
+    """
+    def __init__(self, unique=False, resolution=0.000001):
+        self.unique = unique
+        self.resolution = resolution
+        self._lock = threading.Lock()
+        try:
+            self._monotonic = time.monotonic
+        except AttributeError:   # Python 2
+            self._monotonic = time.time
+        self._offset = Pythonic.unix_epoch_now() - self._monotonic()
+        self._last = None
+
+    def now(self):
+        """The whn for one word."""
+        return self.nows(1)[0]
+
+    def nows(self, n):
+        """The whns for n words inserted together.  Unique if the clock is unique."""
+        seconds = self._offset + self._monotonic()
+        with self._lock:
+            if self._last is not None:
+                if self.unique:
+                    seconds = max(seconds, self._last + self.resolution)
+                else:
+                    seconds = max(seconds, self._last)
+            if self.unique:
+                stamps = [seconds + i * self.resolution for i in range(n)]
+            else:
+                stamps = [seconds] * n
+            if stamps:
+                self._last = stamps[-1]
+        return [Number(stamp) for stamp in stamps]
+
+
+class WriteBehind(object):
+    """
+    Queue of new words, stored in batches by a background thread.  Made by lex.use_write_behind().
+
+    A batch is stored when batch_size words are waiting, or flush_seconds after the oldest one was queued,
+    with writer._write_words(), e.g. one multi-row INSERT and one commit in LexMySQL.
+    put() blocks while max_queue words are waiting, so a slow database slows down the inserts
+    instead of filling memory.  Unless storing is failing, then put() raises the error.
+
+    If storing a batch fails, the same batch is tried again, before anything queued after it.
+    The error is counted in stats(), and raised by flush().
+    After max_tries failures, e.g. a duplicate idn, the batch is given up on.
+    Its words go in the dead letters, listed by stats(), and are not stored.
+    """
+    def __init__(self, writer, batch_size=500, flush_seconds=1.0, max_queue=10000, max_tries=3):
+        assert 1 <= batch_size <= max_queue
+        assert max_tries >= 1
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_queue = max_queue
+        self.max_tries = max_tries
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._queue = []
+        self._retry = []   # the batch that failed, to try again first
+        self._n_tries = 0   # failures of that batch
+        self._is_failing = False   # the last try failed
+        self._dead_letters = []   # (words, error) for each batch given up on
+        self._pending = dict()   # queued or being stored, by idn.raw
+        self._closed = False
+        self._n_words = 0
+        self._n_flushes = 0
+        self._n_errors = 0
+        self._last_error = None
+        self._last_seconds = 0.0
+        self._max_seconds = 0.0
+        self._thread = threading.Thread(target=self._run, name='qiki write-behind')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, words):
+        """Queue words that have their idn and whn, in idn order."""
+        with self._condition:
+            if self._closed:
+                raise self.ClosedError("Write-behind queue is closed.")
+            while len(self._queue) + len(self._retry) >= self.max_queue:
+                if self._is_failing:
+                    raise self._last_error   # Instead of waiting for a writer that may never recover.
+                self._condition.wait()
+            for word in words:
+                self._queue.append(word)
+                self._pending[word.idn.raw] = word
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify_all()
+
+    class ClosedError(RuntimeError):
+        pass
+
+    def pending_word(self, idn):
+        """A queued word that has not been stored yet, or None."""
+        try:
+            return self._pending.get(idn.raw)
+        except AttributeError:
+            return None
+
+    def flush(self):
+        """
+        Store everything queued so far.  Raise whatever error storing it raised.
+
+        Also wait for a batch the background thread is storing.  Its words are off the queue
+        but still pending, until they're stored.
+        """
+        with self._condition:
+            raws_to_store = list(self._pending.keys())
+        while True:
+            with self._condition:
+                if not any(raw in self._pending for raw in raws_to_store):
+                    break
+            self._write_batch()   # Waits for the _flush_lock, if the background thread has it.
+
+    def close(self):
+        """Stop the background thread and store what's left."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.flush()
+
+    def stats(self):
+        with self._condition:
+            return dict(
+                queue_depth=len(self._queue) + len(self._retry),
+                n_words=self._n_words,
+                n_flushes=self._n_flushes,
+                n_errors=self._n_errors,
+                last_error=self._last_error,
+                dead_letters=list(self._dead_letters),
+                last_flush_seconds=self._last_seconds,
+                max_flush_seconds=self._max_seconds,
+            )
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._queue) < self.batch_size:
+                    self._condition.wait(self.flush_seconds)
+                if self._closed:
+                    return
+                if not self._queue and not self._retry:
+                    continue
+            try:
+                self._write_batch()
+            except Exception:   # Counted in stats().  The words are tried again, up to max_tries.
+                with self._condition:
+                    if not self._closed:
+                        self._condition.wait(self.flush_seconds)
+
+    def _write_batch(self):
+        with self._flush_lock:   # One batch at a time, so batches are stored in idn order.
+            with self._condition:
+                if self._retry:
+                    batch = self._retry
+                    self._retry = []
+                else:
+                    batch = self._queue[:self.batch_size]
+                    del self._queue[:self.batch_size]
+                self._condition.notify_all()
+            if not batch:
+                return
+            t_start = time.time()
+            try:
+                # noinspection PyProtectedMember
+                self.writer._write_words(batch)
+            except Exception as e:
+                with self._condition:
+                    self._n_errors += 1
+                    self._last_error = e
+                    self._is_failing = True
+                    self._n_tries += 1
+                    if self._n_tries < self.max_tries:
+                        self._retry = batch
+                    else:
+                        self._dead_letters.append((batch, e))
+                        self._n_tries = 0
+                        for word in batch:
+                            del self._pending[word.idn.raw]
+                    self._condition.notify_all()
+                raise
+            seconds = time.time() - t_start
+            with self._condition:
+                self._n_tries = 0
+                self._is_failing = False
+                for word in batch:
+                    del self._pending[word.idn.raw]
+                self._n_words += len(batch)
+                self._n_flushes += 1
+                self._last_seconds = seconds
+                self._max_seconds = max(self._max_seconds, seconds)
+
+
+class ChoateTracer(object):
+    """
+    Record each time a word becomes choate:  from where, why, and how long it took.
+
+    Made by Lex.trace_choates().  A word becomes choate when one of its properties
+    (sbj, txt, exists(), ...) is first needed.  When that happens inside a loop,
+    words are read one at a time, the N+1 queries problem.
+
+    Each event is recorded as a tuple:  (signature, why, seconds)
+        signature - the innermost stack_depth frames outside this module, e.g.
+                    ('views.py:42 feed', 'views.py:10 home')
+        why - what needed the word, e.g. 'sbj', 'txt', 'exists()'
+        seconds - time spent reading the word
+    """
+    def __init__(self, lex, stack_depth=3):
+        self.lex = lex
+        self.stack_depth = stack_depth
+        self.events = []
+        self._lazy_load_forbidden = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.lex.choate_tracer is self:
+            self.lex.untrace_choates()
+
+    @contextlib.contextmanager
+    def choating(self, why):
+        signature = self.signature()
+        if self._lazy_load_forbidden:
+            raise self.LazyLoad("A word became choate, needing its {why}, at {where}".format(
+                why=why,
+                where=", ".join(signature),
+            ))
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.events.append((signature, why, time.time() - start))
+
+    @contextlib.contextmanager
+    def no_lazy_loads(self):
+        """Raise LazyLoad if any word becomes choate inside this block."""
+        self._lazy_load_forbidden += 1
+        try:
+            yield
+        finally:
+            self._lazy_load_forbidden -= 1
+
+    class LazyLoad(Exception):
+        """A word became choate inside ChoateTracer.no_lazy_loads()"""
+
+    _MODULES_NOT_IN_SIGNATURE = (__name__, contextlib.__name__)
+
+    def signature(self):
+        """The innermost stack frames outside this module."""
+        frames = []
+        frame = sys._getframe(1)
+        while frame is not None and len(frames) < self.stack_depth:
+            if frame.f_globals.get('__name__') not in self._MODULES_NOT_IN_SIGNATURE:
+                frames.append("{file}:{line} {function}".format(
+                    file=os.path.basename(frame.f_code.co_filename),
+                    line=frame.f_lineno,
+                    function=frame.f_code.co_name,
+                ))
+            frame = frame.f_back
+        return tuple(frames)
+
+    def hottest(self, limit=10):
+        """
+        Call sites where the most words became choate.
+
+        :return: list of (signature, count, seconds, whys) most count first
+        """
+        sites = dict()
+        for signature, why, seconds in self.events:
+            site = sites.setdefault(signature, [0, 0.0, set()])
+            site[0] += 1
+            site[1] += seconds
+            site[2].add(why)
+        ranking = sorted(sites.items(), key=lambda item: (-item[1][0], -item[1][1]))
+        return [
+            (signature, count, seconds, sorted(whys))
+            for signature, (count, seconds, whys) in ranking[:limit]
+        ]
+
+    def report(self, limit=10):
+        lines = ["{n} words became choate in {seconds:.3f} sec".format(
+            n=len(self.events),
+            seconds=sum(seconds for _, _, seconds in self.events),
+        )]
+        for signature, count, seconds, whys in self.hottest(limit):
+            lines.append("{count:6d} words {seconds:8.3f} sec, needing {whys}".format(
+                count=count,
+                seconds=seconds,
+                whys=", ".join(whys),
+            ))
+            for frame in signature:
+                lines.append("        " + frame)
+        return "\n".join(lines)
+
+
+class AsyncLex(object):
+    """
+    Awaitable LexSentence methods, for asyncio.  Each call runs the lex method on a thread pool.
+
+    EXAMPLE:
+        alex = AsyncLex(LexMySQL(**credentials), max_workers=5)
+        agent = await alex.read_word('agent')
+        word = await alex.create_word(sbj, like, obj, num=1)
+        words, tallies = await asyncio.gather(alex.find_words(vrb=like), alex.aggregate(vrb=like))
+        async for word in alex.iter_words(vrb=like):
+            ...
+
+    Call the methods from a coroutine, on the running event loop.  Or pass the loop,
+    e.g. loop.run_until_complete(alex.read_word('agent')) from outside one.
+
+    Calls in flight at once run at once, up to max_workers.
+    Each LexMySQL worker thread borrows its own pooled connection,
+    so max_workers should be no more than the lex's pool_size.
+
+    The words that come back are choate.  But following them, e.g. word.sbj.txt,
+    reads the lex without the thread pool, and blocks the event loop.
+    Instead:  sbj = await alex.read_word(word.sbj)
+
+    No async syntax here, each method returns an asyncio future, so this module still imports in Python 2.
+    """
+    def __init__(self, lex, max_workers=5, loop=None):
+        import concurrent.futures   # Python 3, or the futures backport for Python 2
+        self.lex = lex
+        self.loop = loop
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def _run(self, function, *args, **kwargs):
+        """An asyncio future for function(*args, **kwargs) on the thread pool."""
+        return self._loop().run_in_executor(self._executor, lambda: function(*args, **kwargs))
+
+    def _done(self, value):
+        """An asyncio future that already has its value."""
+        future = self._loop().create_future()
+        future.set_result(value)
+        return future
+
+    def _loop(self):
+        """The loop passed to AsyncLex(), or else the running one.  RuntimeError if neither."""
+        if self.loop is not None:
+            return self.loop
+        import asyncio
+        return asyncio.get_running_loop()
+
+    def read_word(self, idn_ish):
+        """Like lex[idn_ish], e.g. an idn, a word, or a name."""
+        def read():
+            word = self.lex[idn_ish]
+            word.exists()   # Choate it here, on the thread pool.
+            return word
+        return self._run(read)
+
+    def find_words(self, **kwargs):
+        return self._run(self.lex.find_words, **kwargs)
+
+    def find_last(self, **kwargs):
+        return self._run(self.lex.find_last, **kwargs)
+
+    def aggregate(self, **kwargs):
+        return self._run(self.lex.aggregate, **kwargs)
+
+    def create_word(self, *args, **kwargs):
+        return self._run(self.lex.create_word, *args, **kwargs)
+
+    def create_words(self, specs):
+        return self._run(self.lex.create_words, specs)
+
+    def iter_words(self, batch_size=1000, **kwargs):
+        """For async for.  Like lex.iter_words(), each batch is read on the thread pool."""
+        return self.AsyncWords(self, self.lex.iter_words(batch_size=batch_size, **kwargs), batch_size)
+
+    class AsyncWords(object):
+        """Asynchronous iterator of words, from a synchronous one, a batch at a time."""
+        def __init__(self, async_lex, words, batch_size):
+            self._async_lex = async_lex
+            self._words = words
+            self._batch_size = batch_size
+            self._batch = collections.deque()
+
+        def __aiter__(self):
+            return self
+
+        def __anext__(self):
+            # noinspection PyProtectedMember
+            if self._batch:
+                return self._async_lex._done(self._batch.popleft())
+            # noinspection PyProtectedMember
+            return self._async_lex._run(self._next_batch)
+
+        def _next_batch(self):
+            self._batch.extend(itertools.islice(self._words, self._batch_size))
+            if not self._batch:
+                # noinspection PyUnresolvedReferences
+                raise StopAsyncIteration()
+            return self._batch.popleft()
+
+    def close(self):
+        """Wait for the calls in flight, and stop the threads."""
+        self._executor.shutdown(wait=True)
+
+
 def is_iterable(x):
     """
     Yes for (tuple) or [list] or {set} or {dictionary keys}.
@@ -3350,13 +6102,11 @@ class QoolbarSimple(Qoolbar):
         # could mean 1=reflexive, 0=not.  The way noun is a noun but verb is not a verb.
         # could inform the is_a() hierarchy bubbling
 
-# TODO:  word.jbo a "soft" property that refers to the set of words whose object is word.
-# Or w.jbo(vrb=qool_verbs) could filter that set down to the words
-# whose verbs were in the iterator qool_verbs
-# Maybe it should always be a method.
-# Similarly word.jbs.
-    # The set of words whose subject is word.
-# word.brv?  The set of definitions and qualifiers supporting this verb??
+# NOTE:  word.find_jbo(vrb=qool_verbs) is the "soft" version of word.jbo,
+#        the words whose object is word, whose verbs are in qool_verbs.
+#        Similarly word.find_jbs(), the words whose subject is word.
+#        (Not word.jbo() because find_words(jbo_vrb) already makes word.jbo a list.)
+# TODO:  word.brv?  The set of definitions and qualifiers supporting this verb??
     # No, that would be word.jbo.  word.brv is the set of sentences that use word as their verb!
 
 # TODO:  Word iterators and iterables.